@@ -70,6 +70,13 @@ setup(
         'viz': [
             'matplotlib>=3.4.0',
         ],
+        'ann': [
+            'hnswlib>=0.7.0',
+            'faiss-cpu>=1.7.4',
+        ],
+        'simd': [
+            'simsimd>=3.0.0',
+        ],
         'api': [
             'fastapi>=0.104.1',
             'uvicorn[standard]>=0.24.0',
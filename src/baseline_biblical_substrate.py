@@ -6,21 +6,22 @@ Maintains biblical standards while operating flexibly in secular environments.
 """
 
 import math
-import contextlib
-import io
 import os
 from typing import Dict, List, Tuple, Optional, Any, Set, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import re
+import functools
+import threading
+from collections import OrderedDict
 import numpy as np
 
 from src.ice_framework import ICEFramework, ThoughtType, ContextDomain
-
-try:
-    from .context_profiles import FINANCIAL_CONTEXT_PROFILE
-except (ImportError, ModuleNotFoundError):
-    from context_profiles import FINANCIAL_CONTEXT_PROFILE
+from src.keyword_scanner import KeywordScanner, KeywordWeights
+from src.embedding_batcher import EmbeddingBatcher
+from src.jit_support import njit, prange, NUMBA_AVAILABLE
+from src.compat import DATACLASS_SLOTS
+from src.logger_config import get_logger
 
 try:
     from .context_profiles import FINANCIAL_CONTEXT_PROFILE
@@ -32,6 +33,18 @@ try:
 except ImportError:
     SentenceTransformer = None
 
+try:
+    import simsimd
+except ImportError:
+    simsimd = None
+
+try:
+    import torch
+except ImportError:
+    torch = None
+
+logger = get_logger(__name__)
+
 class BiblicalPrinciple(Enum):
     """Core biblical principles for semantic analysis"""
     FEAR_OF_JEHOVAH = "fear_of_jehovah"
@@ -53,7 +66,13 @@ class BiblicalPrinciple(Enum):
     INTEGRITY = "integrity"
     HUMILITY = "humility"
 
-@dataclass
+# Weights of resonance, balance and mean value in overall_biblical_alignment
+# (shared with the batch scorers)
+ALIGNMENT_RESONANCE_WEIGHT = 0.4
+ALIGNMENT_BALANCE_WEIGHT = 0.3
+ALIGNMENT_VALUE_WEIGHT = 0.3
+
+@dataclass(**DATACLASS_SLOTS)
 class BiblicalCoordinates:
     """
     Enhanced 4D semantic coordinates based on biblical attributes
@@ -77,21 +96,33 @@ class BiblicalCoordinates:
         self.wisdom = max(0.0, min(1.0, self.wisdom))
         self.justice = max(0.0, min(1.0, self.justice))
     
+    @classmethod
+    def from_array(cls, values: np.ndarray) -> 'BiblicalCoordinates':
+        """Build from a (love, power, wisdom, justice) array row"""
+        love, power, wisdom, justice = values.tolist()
+        return cls(love, power, wisdom, justice)
+
     def to_tuple(self) -> Tuple[float, float, float, float]:
         """Convert to tuple for easy comparison"""
         return (self.love, self.power, self.wisdom, self.justice)
     
+    def squared_distance_from_jehovah(self) -> float:
+        """
+        Squared Euclidean distance from JEHOVAH coordinates (1.0, 1.0, 1.0, 1.0)
+        Monotonic in the distance, so thresholds can be compared without a sqrt
+        """
+        dl = 1.0 - self.love
+        dp = 1.0 - self.power
+        dw = 1.0 - self.wisdom
+        dj = 1.0 - self.justice
+        return dl * dl + dp * dp + dw * dw + dj * dj
+
     def distance_from_jehovah(self) -> float:
         """
         Calculate Euclidean distance from perfect JEHOVAH coordinates (1.0, 1.0, 1.0, 1.0)
         This represents how far from divine perfection the concept is
         """
-        return math.sqrt(
-            (1.0 - self.love) ** 2 +
-            (1.0 - self.power) ** 2 +
-            (1.0 - self.wisdom) ** 2 +
-            (1.0 - self.justice) ** 2
-        )
+        return math.sqrt(self.squared_distance_from_jehovah())
     
     def divine_resonance(self) -> float:
         """
@@ -106,31 +137,33 @@ class BiblicalCoordinates:
         Calculate how balanced the coordinates are across all four biblical attributes
         Returns 1.0 for perfect balance, 0.0 for complete imbalance
         """
-        coords = [self.love, self.power, self.wisdom, self.justice]
-        max_coord = max(coords)
-        min_coord = min(coords)
+        love, power, wisdom, justice = self.love, self.power, self.wisdom, self.justice
+        max_coord = max(love, power, wisdom, justice)
+        min_coord = min(love, power, wisdom, justice)
         
         if max_coord == 0:
             return 1.0
         
         return min_coord / max_coord
     
-    def overall_biblical_alignment(self) -> float:
+    def overall_biblical_alignment(self, resonance: Optional[float] = None,
+                                   balance: Optional[float] = None) -> float:
         """
         Calculate overall biblical alignment score
         Considers resonance, balance, and absolute values
+
+        Callers that already hold divine_resonance() or biblical_balance()
+        can pass them in instead of having them recomputed.
         """
-        resonance_weight = 0.4
-        balance_weight = 0.3
-        value_weight = 0.3
-        
-        resonance = self.divine_resonance()
-        balance = self.biblical_balance()
+        if resonance is None:
+            resonance = self.divine_resonance()
+        if balance is None:
+            balance = self.biblical_balance()
         value = (self.love + self.power + self.wisdom + self.justice) / 4.0
         
-        return (resonance * resonance_weight + 
-                balance * balance_weight + 
-                value * value_weight)
+        return (resonance * ALIGNMENT_RESONANCE_WEIGHT + 
+                balance * ALIGNMENT_BALANCE_WEIGHT + 
+                value * ALIGNMENT_VALUE_WEIGHT)
     
     def get_dominant_attribute(self) -> str:
         """
@@ -182,6 +215,148 @@ class BiblicalCoordinates:
         """Official representation of coordinates"""
         return f"BiblicalCoordinates{self.__str__()}"
 
+@njit(cache=True, parallel=True)
+def _score_coordinate_rows(coords):
+    """Fused per-row scoring kernel; compiled by Numba when it is installed"""
+    n = coords.shape[0]
+    distance = np.empty(n)
+    balance = np.empty(n)
+    alignment = np.empty(n)
+    coercive = np.empty(n, dtype=np.bool_)
+    for i in prange(n):
+        love = min(max(coords[i, 0], 0.0), 1.0)
+        power = min(max(coords[i, 1], 0.0), 1.0)
+        wisdom = min(max(coords[i, 2], 0.0), 1.0)
+        justice = min(max(coords[i, 3], 0.0), 1.0)
+
+        dist = math.sqrt((1.0 - love) ** 2 + (1.0 - power) ** 2 +
+                         (1.0 - wisdom) ** 2 + (1.0 - justice) ** 2)
+        max_coord = max(max(love, power), max(wisdom, justice))
+        min_coord = min(min(love, power), min(wisdom, justice))
+        bal = min_coord / max_coord if max_coord != 0 else 1.0
+        value = (love + power + wisdom + justice) / 4.0
+
+        distance[i] = dist
+        balance[i] = bal
+        alignment[i] = ((1.0 - dist / 2.0) * ALIGNMENT_RESONANCE_WEIGHT + bal * ALIGNMENT_BALANCE_WEIGHT
+                        + value * ALIGNMENT_VALUE_WEIGHT)
+        coercive[i] = (justice + power) / 2.0 > 0.7 and (love + wisdom) / 2.0 < 0.4
+    return distance, balance, alignment, coercive
+
+def score_biblical_coordinates_batch(coords_matrix: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Vectorized BiblicalCoordinates scoring for many concepts at once.
+
+    Args:
+        coords_matrix: (N, 4) array with columns (love, power, wisdom, justice)
+
+    Returns:
+        Struct-of-arrays with one length-N array per score, matching the
+        per-instance methods of BiblicalCoordinates
+    """
+    if NUMBA_AVAILABLE:
+        coords = np.ascontiguousarray(coords_matrix, dtype=np.float64)
+        distance, balance, alignment, coercive = _score_coordinate_rows(coords)
+        return {
+            'distance_from_jehovah': distance,
+            'divine_resonance': 1.0 - distance / 2.0,
+            'biblical_balance': balance,
+            'overall_biblical_alignment': alignment,
+            'coercive': coercive
+        }
+
+    coords = np.clip(np.asarray(coords_matrix, dtype=np.float64), 0.0, 1.0)
+    love, power, wisdom, justice = coords.T
+
+    distance = np.sqrt(np.square(1.0 - coords).sum(axis=1))
+    resonance = 1.0 - distance / 2.0  # max distance is sqrt(4)
+
+    max_coord = coords.max(axis=1)
+    min_coord = coords.min(axis=1)
+    balance = np.ones_like(max_coord)
+    np.divide(min_coord, max_coord, out=balance, where=max_coord != 0)
+
+    value = coords.mean(axis=1)
+    alignment = (resonance * ALIGNMENT_RESONANCE_WEIGHT + balance * ALIGNMENT_BALANCE_WEIGHT
+                 + value * ALIGNMENT_VALUE_WEIGHT)
+
+    # Coercive power: high control (justice/power) without compassion (love/wisdom)
+    control = (justice + power) / 2.0
+    compassion = (love + wisdom) / 2.0
+    coercive = (control > 0.7) & (compassion < 0.4)
+
+    return {
+        'distance_from_jehovah': distance,
+        'divine_resonance': resonance,
+        'biblical_balance': balance,
+        'overall_biblical_alignment': alignment,
+        'coercive': coercive
+    }
+
+# Words that count as a direct biblical reference in analyze_concept
+_DIRECT_REFERENCE_WORDS = frozenset(['god', 'jesus', 'christ', 'lord', 'jehovah'])
+
+@njit(cache=True)
+def _finalize_coordinates(love, power, wisdom, justice, context_modifier, direct_reference):
+    """
+    Final blend of analyze_concept's raw scores, fused into one kernel when
+    Numba is installed: context scaling, the direct-reference bonus, the
+    biblical balance correction and clamping to [0, 1].
+    """
+    # Apply context modifier
+    if context_modifier > 0.5:
+        # More biblical contexts
+        love *= context_modifier
+        power *= context_modifier
+        wisdom *= context_modifier
+        justice *= context_modifier
+
+    # Direct biblical references
+    if direct_reference:
+        base_biblical = 0.4
+        love += base_biblical * 0.4
+        power += base_biblical * 0.3
+        wisdom += base_biblical * 0.2
+        justice += base_biblical * 0.1
+
+    # Apply biblical balance correction
+    total_biblical = love + power + wisdom + justice
+    if total_biblical > 0:
+        biblical_balance = 2.0 / (1 + total_biblical)  # Reduces extreme values
+        love *= biblical_balance
+        power *= biblical_balance
+        wisdom *= biblical_balance
+        justice *= biblical_balance
+
+    # Ensure coordinates are within valid range
+    return (min(max(0.0, love), 1.0), min(max(0.0, power), 1.0),
+            min(max(0.0, wisdom), 1.0), min(max(0.0, justice), 1.0))
+
+if NUMBA_AVAILABLE:
+    # Compile (or load from cache) at import rather than on the first analysis
+    _finalize_coordinates(0.0, 0.0, 0.0, 0.0, 0.3, False)
+
+# Punctuation stripped from biblical text before splitting into words
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+
+# Biblical concept mapping used by BiblicalText, shared by every instance
+_CONCEPT_VARIANTS = {
+    'god': frozenset(['divine', 'creator', 'almighty', 'lord', 'jehovah', 'father', 'spirit']),
+    'jesus': frozenset(['christ', 'messiah', 'savior', 'son of god', 'lamb of god']),
+    'holyspirit': frozenset(['holy spirit', 'comforter', 'advocate', 'spirit of truth']),
+    'love': frozenset(['charity', 'agape', 'compassion', 'mercy', 'grace', 'benevolence']),
+    'wisdom': frozenset(['understanding', 'knowledge', 'insight', 'discernment', 'prudence']),
+    'justice': frozenset(['righteousness', 'fairness', 'equity', 'judgment', 'truth']),
+    'faith': frozenset(['belief', 'trust', 'confidence', 'reliance', 'faithfulness']),
+    'hope': frozenset(['expectation', 'trust', 'confidence', 'anticipation', 'optimism']),
+    'peace': frozenset(['harmony', 'tranquility', 'contentment', 'rest', 'shalom']),
+    'sin': frozenset(['transgression', 'iniquity', 'wrongdoing', 'evil', 'corruption']),
+    'salvation': frozenset(['redemption', 'deliverance', 'rescue', 'freedom', 'eternal life']),
+    'worship': frozenset(['praise', 'adoration', 'reverence', 'honor', 'glorify'])
+}
+_CONCEPT_VARIANT_SCANNER = KeywordScanner(
+    variant for variants in _CONCEPT_VARIANTS.values() for variant in variants)
+
 class BiblicalText:
     """
     Represents biblical text with rich metadata for semantic analysis
@@ -201,38 +376,14 @@ class BiblicalText:
         # Convert to lowercase and split, handling biblical punctuation
         text = text.lower()
         # Replace biblical punctuation with spaces
-        text = re.sub(r'[^\w\s]', ' ', text)
-        words = [word.strip() for word in text.split() if word.strip()]
-        return words
+        text = _PUNCTUATION_RE.sub(' ', text)
+        return text.split()
     
     def _extract_concepts(self, text: str) -> List[str]:
         """Extract key biblical concepts from text"""
-        concepts = []
-        # Biblical concept mapping
-        concept_map = {
-            'god': ['divine', 'creator', 'almighty', 'lord', 'jehovah', 'father', 'spirit'],
-            'jesus': ['christ', 'messiah', 'savior', 'son of god', 'lamb of god'],
-            'holyspirit': ['holy spirit', 'comforter', 'advocate', 'spirit of truth'],
-            'love': ['charity', 'agape', 'compassion', 'mercy', 'grace', 'benevolence'],
-            'wisdom': ['understanding', 'knowledge', 'insight', 'discernment', 'prudence'],
-            'justice': ['righteousness', 'fairness', 'equity', 'judgment', 'truth'],
-            'faith': ['belief', 'trust', 'confidence', 'reliance', 'faithfulness'],
-            'hope': ['expectation', 'trust', 'confidence', 'anticipation', 'optimism'],
-            'peace': ['harmony', 'tranquility', 'contentment', 'rest', 'shalom'],
-            'sin': ['transgression', 'iniquity', 'wrongdoing', 'evil', 'corruption'],
-            'salvation': ['redemption', 'deliverance', 'rescue', 'freedom', 'eternal life'],
-            'worship': ['praise', 'adoration', 'reverence', 'honor', 'glorify']
-        }
-        
-        text_lower = text.lower()
-        
-        for main_concept, variants in concept_map.items():
-            for variant in variants:
-                if variant in text_lower:
-                    concepts.append(main_concept)
-                    break
-        
-        return list(set(concepts))
+        found = _CONCEPT_VARIANT_SCANNER.find(text.lower())
+        return list({main_concept for main_concept, variants in _CONCEPT_VARIANTS.items()
+                     if not found.isdisjoint(variants)})
 
 class BiblicalReference:
     """
@@ -435,6 +586,87 @@ class BiblicalWisdomDatabase:
         """Search biblical references by principle"""
         return [ref for ref in self.references.values() if ref.principle == principle]
 
+# Texts per sentence-transformer forward pass in analyze_concepts
+EMBEDDING_BATCH_SIZE = 64
+
+# Window in which concurrent single-text encodes are coalesced into one batch (0 disables)
+EMBEDDING_FLUSH_MS = float(os.getenv("SSDB_EMBEDDING_FLUSH_MS", "0"))
+
+# Maximum number of (text, context) results kept in the coordinate LRU cache
+COORDINATE_CACHE_SIZE = 8192
+
+# Context keywords per ICE domain, checked in order. Each alternation is a single
+# regex pass with the same substring semantics as `any(term in ctx ...)`.
+_CONTEXT_DOMAIN_PATTERNS = (
+    (re.compile('bible|biblical|spiritual|ministry'), ContextDomain.BIBLICAL),
+    (re.compile('business|finance|market|corporate|work|leadership|governance'), ContextDomain.BUSINESS),
+    (re.compile('education|analysis|science|research|academic|data'), ContextDomain.EDUCATIONAL),
+)
+
+_THOUGHT_TYPE_BY_DOMAIN = {
+    ContextDomain.BIBLICAL: ThoughtType.BIBLICAL_UNDERSTANDING,
+    ContextDomain.BUSINESS: ThoughtType.PRACTICAL_WISDOM,
+    ContextDomain.EDUCATIONAL: ThoughtType.PRACTICAL_WISDOM,
+    ContextDomain.PERSONAL: ThoughtType.EMOTIONAL_EXPERIENCE,
+}
+
+# Accumulator slot per profile attribute, in analyze_concept's (love, power, wisdom, justice) order
+_PROFILE_AXIS_SLOTS = {'love': 0, 'power': 1, 'wisdom': 2, 'justice': 3}
+_PROFILE_AXES = tuple(_PROFILE_AXIS_SLOTS)
+
+def _compile_keyword_weights(weights_by_attribute: Dict[str, Dict[str, float]]) -> KeywordWeights:
+    """Flatten {attribute: {keyword: weight}} into a weighted keyword table in attribute order"""
+    return KeywordWeights(
+        (_PROFILE_AXIS_SLOTS[attribute], keyword, weight)
+        for attribute, keywords in weights_by_attribute.items()
+        for keyword, weight in keywords.items()
+    )
+
+def _index_terms(terms_by_category: Dict[str, List[str]]) -> Dict[str, Tuple[str, ...]]:
+    """Invert {category: [term, ...]} to {term: (category, ...)}, keeping repeated listings"""
+    index: Dict[str, List[str]] = {}
+    for category, terms in terms_by_category.items():
+        for term in terms:
+            index.setdefault(term, []).append(category)
+    return {term: tuple(categories) for term, categories in index.items()}
+
+def _category_scores(categories, term_index: Dict[str, Tuple[str, ...]],
+                     found: Set[str], step: float) -> Dict[str, float]:
+    """
+    Score each category by `step` per listed term present in found, capped at 1.0.
+
+    Only the terms actually found are visited; the step is still added once
+    per hit so scores match a term-by-term accumulation exactly.
+    """
+    hits = dict.fromkeys(categories, 0)
+    for term in found.intersection(term_index):
+        for category in term_index[term]:
+            hits[category] += 1
+    scores = {}
+    for category, count in hits.items():
+        score = 0.0
+        for _ in range(count):
+            score += step
+        scores[category] = min(score, 1.0)
+    return scores
+
+def _compile_context_profile(profile: Dict[str, Any]) -> KeywordWeights:
+    """Flatten a context profile into a weighted keyword table in profile order"""
+    return _compile_keyword_weights({
+        attribute: data["keywords"] for attribute, data in profile.items()
+        if attribute in _PROFILE_AXIS_SLOTS and "keywords" in data
+    })
+
+@functools.lru_cache(maxsize=4096)
+def _context_to_domain(context: Optional[str]) -> ContextDomain:
+    """ICE domain for a context string; memoized since callers reuse a few contexts"""
+    ctx = (context or "").lower()
+    for pattern, domain in _CONTEXT_DOMAIN_PATTERNS:
+        if pattern.search(ctx):
+            return domain
+    # Default to PERSONAL for contexts like creative, counseling, etc.
+    return ContextDomain.PERSONAL
+
 class BiblicalSemanticSubstrate:
     """
     Baseline Bible-based Semantic Substrate Engine
@@ -448,11 +680,20 @@ class BiblicalSemanticSubstrate:
         # Core biblical foundation
         self.jehovah_coordinates = BiblicalCoordinates(1.0, 1.0, 1.0, 1.0)
         self.biblical_database = BiblicalWisdomDatabase()
+        # Entity coordinates as one (E, 4) array with a name -> row lookup
+        entity_mappings = self.biblical_database.coordinate_mappings
+        self._entity_rows = {entity: row for row, entity in enumerate(entity_mappings)}
+        self._entity_coords = np.array([coords.to_tuple() for coords in entity_mappings.values()],
+                                       dtype=np.float64).reshape(-1, 4)
         
         # Semantic analysis components
         self.biblical_keywords = self._initialize_biblical_keywords()
         self.biblical_concepts = self._initialize_biblical_concepts()
         self.biblical_patterns = self._initialize_biblical_patterns()
+        self._keyword_index = _index_terms(self.biblical_keywords)
+        self._concept_index = _index_terms(self.biblical_concepts)
+        self._pattern_index = _index_terms(self.biblical_patterns)
+        self._pattern_scanner = KeywordScanner(self._pattern_index)
         
         # Analysis weights (biblically balanced)
         self.coordinate_weights = {
@@ -468,6 +709,8 @@ class BiblicalSemanticSubstrate:
         self.contextual_modifiers = self._initialize_contextual_modifiers()
         self.modern_semantic_keywords = self._initialize_modern_semantic_keywords()
         self.modern_negative_keywords = self._initialize_modern_negative_keywords()
+        self._modern_weights = _compile_keyword_weights(self.modern_semantic_keywords)
+        self._negative_weights = _compile_keyword_weights(self.modern_negative_keywords)
         semantic_weight = float(os.getenv("SSDB_SEMANTIC_WEIGHT", "0.35"))
         ice_weight = float(os.getenv("SSDB_ICE_WEIGHT", "0.35"))
         self.modern_semantic_weight = max(0.0, min(1.0, semantic_weight))
@@ -476,7 +719,14 @@ class BiblicalSemanticSubstrate:
         embedding_weight = float(os.getenv("SSDB_EMBEDDING_WEIGHT", "0.25"))
         self.embedding_weight = max(0.0, min(1.0, embedding_weight))
         self.embedding_model = None
+        self._embedding_batcher: Optional[EmbeddingBatcher] = None
         self.attribute_embeddings: Dict[str, np.ndarray] = {}
+        # Embeddings encoded ahead of time by analyze_concepts, keyed by text
+        self._prefetched_embeddings: Dict[str, np.ndarray] = {}
+        # Unit-norm anchors stacked as a (4, D) float32 matrix, rebuilt if attribute_embeddings is replaced
+        self._anchor_source: Optional[Dict[str, np.ndarray]] = None
+        self._anchor_attributes: Tuple[str, ...] = ()
+        self._anchor_matrix: Optional[np.ndarray] = None
         use_embeddings = os.getenv("SSDB_USE_EMBEDDINGS", "").strip().lower() in {"1", "true", "yes", "on"}
         if use_embeddings:
             self._initialize_embedding_support()
@@ -484,17 +734,21 @@ class BiblicalSemanticSubstrate:
         self.inversion_keywords = self._initialize_inversion_keywords()
 
         # Analysis cache for performance
-        self.coordinate_cache = {}
+        self.coordinate_cache: "OrderedDict[Tuple[str, str], BiblicalCoordinates]" = OrderedDict()
+        self.coordinate_cache_hits = 0
+        self.coordinate_cache_misses = 0
+        # analyze_concept may run on several threads (e.g. feeding the embedding batcher)
+        self._coordinate_cache_lock = threading.Lock()
         self.analysis_cache = {}
         
         # System state
         self.analysis_count = 0
         self.last_analysis_time = 0
 
-        self.inversion_keywords = self._initialize_inversion_keywords()
         self.context_profiles = {
             "financial": FINANCIAL_CONTEXT_PROFILE
         }
+        self._compiled_profiles: Dict[str, Tuple[Dict[str, Any], KeywordWeights]] = {}
         self._is_analyzing_ice = False
     
     def _initialize_inversion_keywords(self) -> Dict[str, str]:
@@ -701,11 +955,16 @@ class BiblicalSemanticSubstrate:
     def _initialize_embedding_support(self) -> None:
         """Optionally load a sentence-transformer model for semantic similarity."""
         if SentenceTransformer is None:
-            print("[SEMANTIC ENGINE] SentenceTransformer not available - embeddings disabled")
+            logger.warning("SentenceTransformer not available - embeddings disabled")
             return
         try:
             model_name = os.getenv("SSDB_EMBEDDING_MODEL", "all-MiniLM-L6-v2")
-            self.embedding_model = SentenceTransformer(model_name)
+            device = os.getenv("SSDB_EMBEDDING_DEVICE") or (
+                "cuda" if torch is not None and torch.cuda.is_available() else "cpu")
+            self.embedding_model = SentenceTransformer(model_name, device=device)
+            if device.startswith("cuda"):
+                # FP16 weights roughly double GPU throughput; outputs are cast back to float32 for scoring
+                self.embedding_model = self.embedding_model.half()
             anchor_texts = {
                 "love": "compassion empathy kindness mercy support",
                 "power": "decisive focused leadership strength bold",
@@ -713,8 +972,11 @@ class BiblicalSemanticSubstrate:
                 "justice": "integrity fairness truthful ethical accountable"
             }
             self.attribute_embeddings = {attr: self.embedding_model.encode(text, normalize_embeddings=True) for attr, text in anchor_texts.items()}
+            if EMBEDDING_FLUSH_MS > 0:
+                self._embedding_batcher = EmbeddingBatcher(self.embedding_model, EMBEDDING_BATCH_SIZE,
+                                                           EMBEDDING_FLUSH_MS)
         except Exception as exc:
-            print(f"[SEMANTIC ENGINE] Failed to initialize embeddings: {exc}")
+            logger.warning("Failed to initialize embeddings: %s", exc)
             self.embedding_model = None
             self.attribute_embeddings = {}
 
@@ -764,14 +1026,20 @@ class BiblicalSemanticSubstrate:
             BiblicalCoordinates representing the concept's alignment with biblical attributes
         """
         # Check cache first
-        cache_key = f"{concept_description}:{context}"
-        if cache_key in self.coordinate_cache:
-            return self.coordinate_cache[cache_key]
+        cache_key = (concept_description, context)
+        with self._coordinate_cache_lock:
+            cached = self.coordinate_cache.get(cache_key)
+            if cached is not None:
+                self.coordinate_cache.move_to_end(cache_key)
+                self.coordinate_cache_hits += 1
+                return cached
+            self.coordinate_cache_misses += 1
+
+        text_lower = concept_description.lower()
 
         # Check for inversion keywords first
-        text_lower_for_inversion = concept_description.lower()
         for negative_keyword, positive_keyword in self.inversion_keywords.items():
-            if negative_keyword in text_lower_for_inversion:
+            if negative_keyword in text_lower:
                 positive_coords = self.analyze_concept(positive_keyword, context)
                 inverted_coords = BiblicalCoordinates(
                     love=1.0 - positive_coords.love,
@@ -779,22 +1047,9 @@ class BiblicalSemanticSubstrate:
                     wisdom=1.0 - positive_coords.wisdom,
                     justice=1.0 - positive_coords.justice
                 )
-                self.coordinate_cache[cache_key] = inverted_coords
+                self._cache_coordinates(cache_key, inverted_coords)
                 return inverted_coords
         
-        # Check for inversion keywords first
-        text_lower_for_inversion = concept_description.lower()
-        for negative_keyword, positive_keyword in self.inversion_keywords.items():
-            if negative_keyword in text_lower_for_inversion:
-                positive_coords = self.analyze_concept(positive_keyword, context)
-                inverted_coords = BiblicalCoordinates(
-                    love=1.0 - positive_coords.love,
-                    power=1.0 - positive_coords.power,
-                    wisdom=1.0 - positive_coords.wisdom,
-                    justice=1.0 - positive_coords.justice
-                )
-                self.coordinate_cache[cache_key] = inverted_coords
-                return inverted_coords
 
         # Get contextual modifier
         context_modifier = self.contextual_modifiers.get(context.lower(), 0.3)
@@ -806,51 +1061,18 @@ class BiblicalSemanticSubstrate:
         justice = 0.0
         
         # Process text
-        text_lower = concept_description.lower()
-        words = text_lower.split()
-        
-        # Biblical keyword analysis
-        biblical_scores = {}
-        for category, keywords in self.biblical_keywords.items():
-            score = 0.0
-            for keyword in keywords:
-                if keyword in words:
-                    score += 0.1
-            biblical_scores[category] = min(score, 1.0)
+        words = set(text_lower.split())
         
-        # Biblical concept analysis
-        concept_scores = {}
-        for concept_category, concepts in self.biblical_concepts.items():
-            score = 0.0
-            for concept in concepts:
-                if concept in words:
-                    score += 0.15
-            concept_scores[concept_category] = min(score, 1.0)
+        # Biblical keyword and concept analysis (whole words)
+        biblical_scores = _category_scores(self.biblical_keywords, self._keyword_index, words, 0.1)
+        concept_scores = _category_scores(self.biblical_concepts, self._concept_index, words, 0.15)
         
-        # Biblical pattern analysis
-        pattern_scores = {}
-        for pattern_name, patterns in self.biblical_patterns.items():
-            score = 0.0
-            for pattern in patterns:
-                if pattern in text_lower:
-                    score += 0.2
-            pattern_scores[pattern_name] = min(score, 1.0)
+        # Biblical pattern analysis (phrases anywhere in the text)
+        pattern_scores = _category_scores(self.biblical_patterns, self._pattern_index,
+                                          self._pattern_scanner.find(text_lower), 0.2)
         
-        # Biblical entity analysis
-        entity_scores = {}
-        for entity, coords in self.biblical_database.coordinate_mappings.items():
-            score = 0.0
-            if entity in words:
-                score += 0.3
-            entity_scores[entity] = score
-        
-        # Apply biblical recognition enhancement
-        biblical_recognition = max(
-            sum(biblical_scores.values()) / len(biblical_scores),
-            sum(concept_scores.values()) / len(concept_scores),
-            sum(pattern_scores.values()) / len(pattern_scores),
-            sum(entity_scores.values()) / len(entity_scores)
-        )
+        # Biblical entity analysis: rows of the entity table named in the text, in table order
+        entity_hits = sorted(self._entity_rows[entity] for entity in words.intersection(self._entity_rows))
         
         # Base coordinate calculation
         love = biblical_scores.get('love', 0.0) * 0.5 + concept_scores.get('virtues', 0.0) * 0.3
@@ -873,14 +1095,13 @@ class BiblicalSemanticSubstrate:
             power += 0.1
         
         # Entity adjustments
-        for entity, coords in self.biblical_database.coordinate_mappings.items():
-            entity_score = entity_scores.get(entity, 0.0)
-            if entity_score > 0:
-                weight = entity_score * 0.3
-                love += coords.love * weight
-                power += coords.power * weight
-                wisdom += coords.wisdom * weight
-                justice += coords.justice * weight
+        if entity_hits:
+            weight = 0.3 * 0.3
+            for e_love, e_power, e_wisdom, e_justice in self._entity_coords[entity_hits].tolist():
+                love += e_love * weight
+                power += e_power * weight
+                wisdom += e_wisdom * weight
+                justice += e_justice * weight
         
         # Contemporary semantic enrichment
         modern_scores = self._analyze_modern_semantics(text_lower)
@@ -897,24 +1118,13 @@ class BiblicalSemanticSubstrate:
 
         # Apply context-specific profiles if available
         if context in self.context_profiles:
-            profile = self.context_profiles[context]
-            for attribute, data in profile.items():
-                if attribute in ["name", "description"]:
-                    continue
-
-                if "keywords" in data:
-                    for keyword, weight in data["keywords"].items():
-                        if keyword in text_lower:
-                            if attribute == "love":
-                                love += weight
-                            elif attribute == "power":
-                                power += weight
-                            elif attribute == "wisdom":
-                                wisdom += weight
-                            elif attribute == "justice":
-                                justice += weight
+            matches = self._compiled_context_profile(context).matches(text_lower)
+            if matches:
+                scores = [love, power, wisdom, justice]
+                for slot, _, weight in matches:
+                    scores[slot] += weight
+                love, power, wisdom, justice = scores
 
-        ice_scores = self._analyze_ice_alignment(concept_description, context)
         embedding_scores = self._analyze_embeddings(concept_description)
         love += embedding_scores['love']
         power += embedding_scores['power']
@@ -927,105 +1137,155 @@ class BiblicalSemanticSubstrate:
         wisdom += ice_scores['wisdom']
         justice += ice_scores['justice']
         
-        # Apply context modifier
-        if context_modifier > 0.5:
-            # More biblical contexts
-            love *= context_modifier
-            power *= context_modifier
-            wisdom *= context_modifier
-            justice *= context_modifier
-        
-        # Check for direct biblical references
-        if any(word in words for word in ['god', 'jesus', 'christ', 'lord', 'jehovah']):
-            base_biblical = 0.4
-            love += base_biblical * 0.4
-            power += base_biblical * 0.3
-            wisdom += base_biblical * 0.2
-            justice += base_biblical * 0.1
-        
-        # Apply biblical balance correction
-        total_biblical = love + power + wisdom + justice
-        if total_biblical > 0:
-            biblical_balance = 2.0 / (1 + total_biblical)  # Reduces extreme values
-            love *= biblical_balance
-            power *= biblical_balance
-            wisdom *= biblical_balance
-            justice *= biblical_balance
-        
-        # Ensure coordinates are within valid range
-        coordinates = BiblicalCoordinates(
-            min(max(0.0, love), 1.0),
-            min(max(0.0, power), 1.0),
-            min(max(0.0, wisdom), 1.0),
-            min(max(0.0, justice), 1.0)
-        )
+        # Context modifier, direct biblical references, balance correction and clamping
+        coordinates = BiblicalCoordinates(*_finalize_coordinates(
+            love, power, wisdom, justice, context_modifier,
+            not words.isdisjoint(_DIRECT_REFERENCE_WORDS)
+        ))
         
         # Cache result
-        self.coordinate_cache[cache_key] = coordinates
+        self._cache_coordinates(cache_key, coordinates)
         
         return coordinates
-    
+
+    def cache_info(self) -> Dict[str, int]:
+        """Hit/miss counts and occupancy of the coordinate LRU cache, for sizing COORDINATE_CACHE_SIZE"""
+        with self._coordinate_cache_lock:
+            return {
+                'hits': self.coordinate_cache_hits,
+                'misses': self.coordinate_cache_misses,
+                'maxsize': COORDINATE_CACHE_SIZE,
+                'currsize': len(self.coordinate_cache)
+            }
+
+    def _cache_coordinates(self, cache_key: Tuple[str, str], coordinates: BiblicalCoordinates):
+        with self._coordinate_cache_lock:
+            self.coordinate_cache[cache_key] = coordinates
+            if len(self.coordinate_cache) > COORDINATE_CACHE_SIZE:
+                self.coordinate_cache.popitem(last=False)
+
+    def analyze_concepts(self, concept_descriptions: List[str],
+                         context: str = "general") -> List[BiblicalCoordinates]:
+        """
+        analyze_concept for many texts, with their embeddings encoded in one model call
+        """
+        prefetched = self._prefetch_embeddings(concept_descriptions, context)
+        try:
+            return [self.analyze_concept(text, context) for text in concept_descriptions]
+        finally:
+            for text in prefetched:
+                self._prefetched_embeddings.pop(text, None)
+
+    def _prefetch_embeddings(self, texts: List[str], context: str) -> List[str]:
+        """Encode the embeddings analyze_concept will need as one batch; returns the texts added"""
+        if not self.embedding_model or not self.attribute_embeddings or not self.embedding_weight:
+            return []
+        pending = [text for text in dict.fromkeys(texts)
+                   if (text, context) not in self.coordinate_cache
+                   and text not in self._prefetched_embeddings]
+        if not pending:
+            return []
+        try:
+            embeddings = self.embedding_model.encode(pending, batch_size=EMBEDDING_BATCH_SIZE,
+                                                     convert_to_numpy=True, normalize_embeddings=True)
+        except Exception:
+            # Leave it to the per-text path to report the failure and disable embeddings
+            return []
+        self._prefetched_embeddings.update(zip(pending, embeddings))
+        return pending
+
+    def score_concepts_batch(self, concept_descriptions: List[str],
+                             context: str = "general") -> Dict[str, np.ndarray]:
+        """
+        Analyze many concepts and score them column-wise in one pass
+
+        Returns:
+            'coordinates' as an (N, 4) array plus the arrays from
+            score_biblical_coordinates_batch
+        """
+        coords_matrix = np.array(
+            [coords.to_tuple() for coords in self.analyze_concepts(concept_descriptions, context)],
+            dtype=np.float64
+        ).reshape(-1, 4)
+        scores = score_biblical_coordinates_batch(coords_matrix)
+        scores['coordinates'] = coords_matrix
+        return scores
+
     def _analyze_modern_semantics(self, text_lower: str) -> Dict[str, float]:
         """Approximate semantic alignment using contemporary terminology."""
         scores = {'love': 0.0, 'power': 0.0, 'wisdom': 0.0, 'justice': 0.0}
-        for attribute, keywords in self.modern_semantic_keywords.items():
-            for keyword, weight in keywords.items():
-                if keyword in text_lower:
-                    scores[attribute] += weight * self.modern_semantic_weight
+        for slot, _, weight in self._modern_weights.matches(text_lower):
+            scores[_PROFILE_AXES[slot]] += weight * self.modern_semantic_weight
         return scores
 
     def _analyze_negative_semantics(self, text_lower: str) -> Dict[str, float]:
         """Approximate negative semantic alignment using contemporary terminology."""
         scores = {'love': 0.0, 'power': 0.0, 'wisdom': 0.0, 'justice': 0.0}
-        for attribute, keywords in self.modern_negative_keywords.items():
-            for keyword, weight in keywords.items():
-                if keyword in text_lower:
-                    scores[attribute] += weight * 0.5  # Apply 0.5 penalty weight
+        for slot, _, weight in self._negative_weights.matches(text_lower):
+            scores[_PROFILE_AXES[slot]] += weight * 0.5  # Apply 0.5 penalty weight
         return scores
 
     def _analyze_embeddings(self, text: str) -> Dict[str, float]:
         """Use sentence embeddings to adjust coordinates when available."""
-        if not self.embedding_model or not self.attribute_embeddings:
+        if not self.embedding_model or not self.attribute_embeddings or not self.embedding_weight:
             return {"love": 0.0, "power": 0.0, "wisdom": 0.0, "justice": 0.0}
+        embedding = self._prefetched_embeddings.get(text)
         try:
-            embedding = self.embedding_model.encode(text, normalize_embeddings=True)
+            if embedding is None and self._embedding_batcher is not None:
+                embedding = self._embedding_batcher.encode(text)
+            elif embedding is None:
+                embedding = self.embedding_model.encode(text, normalize_embeddings=True)
         except Exception as exc:
-            print(f"[SEMANTIC ENGINE] Embedding encoding failed: {exc}")
+            logger.warning("Embedding encoding failed: %s", exc)
+            if self._embedding_batcher is not None:
+                self._embedding_batcher.close()
+                self._embedding_batcher = None
             self.embedding_model = None
             self.attribute_embeddings = {}
             return {"love": 0.0, "power": 0.0, "wisdom": 0.0, "justice": 0.0}
         scores = {"love": 0.0, "power": 0.0, "wisdom": 0.0, "justice": 0.0}
-        for attribute, anchor in self.attribute_embeddings.items():
-            similarity = float(np.dot(embedding, anchor))
+        attributes, anchors = self._anchor_embeddings()
+        vector = np.asarray(embedding, dtype=np.float32)
+        if simsimd is not None:
+            # SIMD cosine kernels; cdist returns distances, so flip them back to similarities
+            similarities = 1.0 - np.asarray(simsimd.cdist(vector[None, :], anchors, metric="cosine")).ravel()
+        else:
+            # Embeddings are unit-norm, so cosine similarity is a single matrix-vector product
+            similarities = anchors @ vector
+        for attribute, similarity in zip(attributes, similarities.tolist()):
             if similarity > 0:
                 scores[attribute] += similarity * self.embedding_weight
         return scores
 
+    def _anchor_embeddings(self) -> Tuple[Tuple[str, ...], np.ndarray]:
+        """Attribute names and their normalized anchor embeddings as one contiguous matrix"""
+        if self._anchor_source is not self.attribute_embeddings:
+            anchors = np.stack([np.asarray(v, dtype=np.float32) for v in self.attribute_embeddings.values()])
+            anchors /= np.linalg.norm(anchors, axis=1, keepdims=True)
+            self._anchor_attributes = tuple(self.attribute_embeddings)
+            self._anchor_matrix = np.ascontiguousarray(anchors)
+            self._anchor_source = self.attribute_embeddings
+        return self._anchor_attributes, self._anchor_matrix
+
+    def _compiled_context_profile(self, context: str) -> KeywordWeights:
+        """Weighted keyword table for a context profile, rebuilt if the profile is replaced."""
+        profile = self.context_profiles[context]
+        compiled = self._compiled_profiles.get(context)
+        if compiled is None or compiled[0] is not profile:
+            compiled = (profile, _compile_context_profile(profile))
+            self._compiled_profiles[context] = compiled
+        return compiled[1]
+
     def _map_context_to_domain(self, context: str) -> ContextDomain:
-        ctx = (context or "").lower()
-        if any(term in ctx for term in ['bible', 'biblical', 'spiritual', 'ministry']):
-            return ContextDomain.BIBLICAL
-        if any(term in ctx for term in ['business', 'finance', 'market', 'corporate', 'work', 'leadership', 'governance']):
-            return ContextDomain.BUSINESS
-        if any(term in ctx for term in ['education', 'analysis', 'science', 'research', 'academic', 'data']):
-            return ContextDomain.EDUCATIONAL
-        # Default to PERSONAL for contexts like creative, counseling, etc.
-        return ContextDomain.PERSONAL
+        return _context_to_domain(context)
 
     def _map_context_to_thought_type(self, domain: ContextDomain) -> ThoughtType:
-        if domain == ContextDomain.BIBLICAL:
-            return ThoughtType.BIBLICAL_UNDERSTANDING
-        if domain == ContextDomain.BUSINESS:
-            return ThoughtType.PRACTICAL_WISDOM
-        if domain == ContextDomain.EDUCATIONAL:
-            return ThoughtType.PRACTICAL_WISDOM
-        if domain == ContextDomain.PERSONAL:
-            return ThoughtType.EMOTIONAL_EXPERIENCE
-        return ThoughtType.PRACTICAL_WISDOM # Default
+        return _THOUGHT_TYPE_BY_DOMAIN.get(domain, ThoughtType.PRACTICAL_WISDOM)
 
     def _analyze_ice_alignment(self, text: str, context: str) -> Dict[str, float]:
         """Leverage ICE framework to derive semantic coordinates."""
-        if not getattr(self, 'ice_framework', None) or self._is_analyzing_ice:
+        # A zero ICE weight would scale the whole ICE pass to nothing, so skip it
+        if not self.ice_weight or not getattr(self, 'ice_framework', None) or self._is_analyzing_ice:
             return {'love': 0.0, 'power': 0.0, 'wisdom': 0.0, 'justice': 0.0}
 
         self._is_analyzing_ice = True
@@ -1033,12 +1293,11 @@ class BiblicalSemanticSubstrate:
             domain = self._map_context_to_domain(context)
             thought_type = self._map_context_to_thought_type(domain)
 
-            with contextlib.redirect_stdout(io.StringIO()):
-                result = self.ice_framework.process_thought(
-                    primary_thought=text,
-                    thought_type=thought_type,
-                    domain=domain
-                )
+            result = self.ice_framework.process_thought(
+                primary_thought=text,
+                thought_type=thought_type,
+                domain=domain
+            )
         except Exception:
             return {'love': 0.0, 'power': 0.0, 'wisdom': 0.0, 'justice': 0.0}
         finally:
@@ -1085,6 +1344,10 @@ class BiblicalSemanticSubstrate:
                     'application': principle_data['application']
                 }
         
+        # Distance from JEHOVAH is computed once and shared by every score below
+        resonance = 1.0 - coordinates.distance_from_jehovah() / 2.0
+        balance = coordinates.biblical_balance()
+
         # Biblical verse references
         verse_references = []
         for ref_key, ref_obj in self.biblical_database.references.items():
@@ -1105,12 +1368,13 @@ class BiblicalSemanticSubstrate:
             'biblical_concepts': biblical_concepts,
             'principle_alignment': principle_alignment,
             'verse_references': verse_references,
-            'divine_resonance': coordinates.divine_resonance(),
-            'biblical_balance': coordinates.biblical_balance(),
+            'divine_resonance': resonance,
+            'biblical_balance': balance,
             'dominant_attribute': coordinates.get_dominant_attribute(),
             'deficient_attributes': coordinates.get_deficient_attributes(),
-            'overall_alignment': coordinates.overall_biblical_alignment(),
-            'biblical_relevance': coordinates.divine_resonance() * (1.0 - coordinates.distance_from_jehovah() / 2.0)
+            'overall_alignment': coordinates.overall_biblical_alignment(resonance, balance),
+            # Resonance is 1 - distance/2, so relevance is resonance squared
+            'biblical_relevance': resonance * resonance
         }
     
     def _calculate_alignment_score(self, coords1: BiblicalCoordinates, coords2: BiblicalCoordinates) -> float:
@@ -1133,10 +1397,12 @@ class BiblicalSemanticSubstrate:
         """
         # Get baseline coordinates
         coordinates = self.analyze_concept(secular_text, context)
+        squared_distance = coordinates.squared_distance_from_jehovah()
         
         # Biblical integration analysis
         biblical_analysis = {
-            'can_be_biblically_interpreted': coordinates.divine_resonance() > 0.3,
+            # divine_resonance > 0.3  <=>  distance < 1.4  <=>  squared distance < 1.96
+            'can_be_biblically_interpreted': squared_distance < 1.96,
             'biblical_applications': self._find_applications(secular_text),
             'wisdom_principles_identified': self._identify_wisdom_principles(secular_text),
             'biblical_alignment_gaps': coordinates.get_deficient_attributes(),
@@ -1145,6 +1411,9 @@ class BiblicalSemanticSubstrate:
         
         # Add biblical recommendations
         recommendations = self._generate_biblical_recommendations(coordinates, secular_text, biblical_analysis)
+
+        resonance = 1.0 - math.sqrt(squared_distance) / 2.0
+        balance = coordinates.biblical_balance()
         
         return {
             'text': secular_text,
@@ -1152,11 +1421,11 @@ class BiblicalSemanticSubstrate:
             'coordinates': coordinates,
             'biblical_analysis': biblical_analysis,
             'recommendations': recommendations,
-            'divine_resonance': coordinates.divine_resonance(),
-            'biblical_balance': coordinates.biblical_balance(),
+            'divine_resonance': resonance,
+            'biblical_balance': balance,
             'dominant_attribute': coordinates.get_dominant_attribute(),
             'deficient_attributes': coordinates.get_deficient_attributes(),
-            'overall_alignment': coordinates.overall_biblical_alignment(),
+            'overall_alignment': coordinates.overall_biblical_alignment(resonance, balance),
             'secular_biblical_compatibility': self._assess_secular_biblical_compatibility(coordinates, secular_text)
         }
     
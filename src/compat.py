@@ -0,0 +1,13 @@
+"""
+COMPAT
+
+Small shims for language features that depend on the Python version.
+
+DATACLASS_SLOTS is passed as `@dataclass(**DATACLASS_SLOTS)`. On 3.10+ it
+makes the dataclass slotted, dropping the per-instance __dict__; on older
+interpreters it is empty and the class is a regular dataclass.
+"""
+
+import sys
+
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
@@ -3,7 +3,9 @@ Context Detector: A tool for automatically detecting the context of a text.
 """
 
 import re
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Set
+
+_TOKEN_RE = re.compile(r'\b\w+\b')
 
 class ContextDetector:
     """
@@ -21,7 +23,7 @@ class ContextDetector:
         Detects the most appropriate context for a given text by scoring it
         against all available context profiles.
         """
-        words = re.findall(r'\b\w+\b', text.lower())
+        words = set(_TOKEN_RE.findall(text.lower()))
         best_profile = None
         highest_score = -1
 
@@ -33,7 +35,7 @@ class ContextDetector:
 
         return best_profile
 
-    def _score_profile(self, words: List[str], profile: Dict[str, Any]) -> float:
+    def _score_profile(self, words: Set[str], profile: Dict[str, Any]) -> float:
         """
         Scores a text against a single context profile.
         """
@@ -0,0 +1,99 @@
+"""
+EMBEDDING BATCHER
+
+Coalesces single-text encode requests from concurrent callers into batched
+`model.encode` calls. A background thread takes the first waiting request,
+collects whatever else arrives within a short flush window (up to a batch
+cap), encodes them together and resolves each caller's future.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+class EmbeddingBatcher:
+    """
+    Micro-batcher in front of a sentence-transformer style model
+
+    All encoding happens on the one worker thread, so concurrent callers
+    never run the model in parallel and contend for the GIL.
+    """
+
+    def __init__(self, model, max_batch: int = 64, flush_ms: float = 10.0):
+        self.model = model
+        self.max_batch = max(1, int(max_batch))
+        self.flush_seconds = max(0.0, flush_ms) / 1000.0
+        self._queue: "queue.Queue[Optional[Tuple[str, Future]]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+
+    def submit(self, text: str) -> Future:
+        """Queue text for encoding; the future resolves to its normalized embedding"""
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("EmbeddingBatcher is closed")
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="embedding-batcher", daemon=True)
+                self._worker.start()
+            self._queue.put((text, future))
+        return future
+
+    def encode(self, text: str) -> np.ndarray:
+        """Blocking encode of one text through the shared batch"""
+        return self.submit(text).result()
+
+    def close(self) -> None:
+        """Encode anything already queued, then stop the worker"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            worker = self._worker
+            self._queue.put(None)
+        if worker is not None:
+            worker.join()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            stopping = False
+            deadline = time.monotonic() + self.flush_seconds
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._encode_batch(batch)
+            if stopping:
+                return
+
+    def _encode_batch(self, batch: List[Tuple[str, Future]]) -> None:
+        live = [(text, future) for text, future in batch if future.set_running_or_notify_cancel()]
+        if not live:
+            return
+        texts = [text for text, _ in live]
+        futures = [future for _, future in live]
+        try:
+            embeddings = self.model.encode(texts, batch_size=self.max_batch,
+                                           convert_to_numpy=True, normalize_embeddings=True)
+        except Exception as exc:
+            for future in futures:
+                future.set_exception(exc)
+            return
+        for future, embedding in zip(futures, embeddings):
+            future.set_result(embedding)
@@ -34,6 +34,43 @@ except ImportError:
 
 # ============= ENHANCED CORE COMPONENTS =============
 
+# Essences of known biblical words, keyed by lower-cased text
+_BIBLICAL_ESSENCES = {
+    # Love words
+    'love': {'love': 0.9, 'power': 0.3, 'wisdom': 0.6, 'justice': 0.7},
+    'agape': {'love': 1.0, 'power': 0.4, 'wisdom': 0.8, 'justice': 0.8},
+    'charity': {'love': 0.9, 'power': 0.2, 'wisdom': 0.7, 'justice': 0.8},
+    'mercy': {'love': 0.8, 'power': 0.2, 'wisdom': 0.6, 'justice': 0.9},
+    'grace': {'love': 0.9, 'power': 0.3, 'wisdom': 0.7, 'justice': 0.8},
+
+    # Power words
+    'power': {'love': 0.3, 'power': 0.9, 'wisdom': 0.5, 'justice': 0.8},
+    'authority': {'love': 0.2, 'power': 0.8, 'wisdom': 0.6, 'justice': 0.9},
+    'strength': {'love': 0.4, 'power': 0.8, 'wisdom': 0.5, 'justice': 0.7},
+    'might': {'love': 0.2, 'power': 0.9, 'wisdom': 0.4, 'justice': 0.6},
+
+    # Wisdom words
+    'wisdom': {'love': 0.6, 'power': 0.5, 'wisdom': 1.0, 'justice': 0.9},
+    'understanding': {'love': 0.7, 'power': 0.4, 'wisdom': 0.9, 'justice': 0.8},
+    'knowledge': {'love': 0.4, 'power': 0.5, 'wisdom': 0.8, 'justice': 0.6},
+    'discernment': {'love': 0.6, 'power': 0.3, 'wisdom': 0.9, 'justice': 0.9},
+
+    # Justice words
+    'justice': {'love': 0.6, 'power': 0.7, 'wisdom': 0.7, 'justice': 1.0},
+    'righteousness': {'love': 0.7, 'power': 0.5, 'wisdom': 0.8, 'justice': 0.9},
+    'truth': {'love': 0.6, 'power': 0.5, 'wisdom': 0.8, 'justice': 0.9},
+    'holiness': {'love': 0.8, 'power': 0.6, 'wisdom': 0.8, 'justice': 1.0},
+
+    # Sacred words
+    'god': {'love': 1.0, 'power': 1.0, 'wisdom': 1.0, 'justice': 1.0},
+    'jehovah': {'love': 1.0, 'power': 1.0, 'wisdom': 1.0, 'justice': 1.0},
+    'christ': {'love': 1.0, 'power': 0.8, 'wisdom': 0.9, 'justice': 0.9},
+    'spirit': {'love': 0.7, 'power': 0.6, 'wisdom': 0.8, 'justice': 0.7}
+}
+
+# Essence given to words outside _BIBLICAL_ESSENCES
+_DEFAULT_ESSENCE = {'love': 0.2, 'power': 0.2, 'wisdom': 0.2, 'justice': 0.2}
+
 class SemanticUnit:
     """
     Words preserve their essential meaning through semantic signatures
@@ -61,51 +98,12 @@ class SemanticUnit:
         """Generate unique semantic signature that preserves essential meaning"""
         # Combine text, context, and divine attributes
         combined = f"{self.text}_{self.context}_divine_love_power_wisdom_justice"
-        return hashlib.sha256(combined.encode()).hexdigest()[:16]
+        return hashlib.blake2b(combined.encode(), digest_size=8).hexdigest()
     
     def _extract_essence(self) -> Dict[str, float]:
         """Extract essential meaning components based on divine attributes"""
-        # Biblical word meaning mapping
-        biblical_mappings = {
-            # Love words
-            'love': {'love': 0.9, 'power': 0.3, 'wisdom': 0.6, 'justice': 0.7},
-            'agape': {'love': 1.0, 'power': 0.4, 'wisdom': 0.8, 'justice': 0.8},
-            'charity': {'love': 0.9, 'power': 0.2, 'wisdom': 0.7, 'justice': 0.8},
-            'mercy': {'love': 0.8, 'power': 0.2, 'wisdom': 0.6, 'justice': 0.9},
-            'grace': {'love': 0.9, 'power': 0.3, 'wisdom': 0.7, 'justice': 0.8},
-            
-            # Power words
-            'power': {'love': 0.3, 'power': 0.9, 'wisdom': 0.5, 'justice': 0.8},
-            'authority': {'love': 0.2, 'power': 0.8, 'wisdom': 0.6, 'justice': 0.9},
-            'strength': {'love': 0.4, 'power': 0.8, 'wisdom': 0.5, 'justice': 0.7},
-            'might': {'love': 0.2, 'power': 0.9, 'wisdom': 0.4, 'justice': 0.6},
-            
-            # Wisdom words
-            'wisdom': {'love': 0.6, 'power': 0.5, 'wisdom': 1.0, 'justice': 0.9},
-            'understanding': {'love': 0.7, 'power': 0.4, 'wisdom': 0.9, 'justice': 0.8},
-            'knowledge': {'love': 0.4, 'power': 0.5, 'wisdom': 0.8, 'justice': 0.6},
-            'discernment': {'love': 0.6, 'power': 0.3, 'wisdom': 0.9, 'justice': 0.9},
-            
-            # Justice words
-            'justice': {'love': 0.6, 'power': 0.7, 'wisdom': 0.7, 'justice': 1.0},
-            'righteousness': {'love': 0.7, 'power': 0.5, 'wisdom': 0.8, 'justice': 0.9},
-            'truth': {'love': 0.6, 'power': 0.5, 'wisdom': 0.8, 'justice': 0.9},
-            'holiness': {'love': 0.8, 'power': 0.6, 'wisdom': 0.8, 'justice': 1.0},
-            
-            # Sacred words
-            'god': {'love': 1.0, 'power': 1.0, 'wisdom': 1.0, 'justice': 1.0},
-            'jehovah': {'love': 1.0, 'power': 1.0, 'wisdom': 1.0, 'justice': 1.0},
-            'christ': {'love': 1.0, 'power': 0.8, 'wisdom': 0.9, 'justice': 0.9},
-            'spirit': {'love': 0.7, 'power': 0.6, 'wisdom': 0.8, 'justice': 0.7}
-        }
-        
-        # Look up in biblical mappings
-        essence = biblical_mappings.get(self.text, {
-            # Default essence for unknown words
-            'love': 0.2, 'power': 0.2, 'wisdom': 0.2, 'justice': 0.2
-        })
-        
-        return essence
+        # Look up in biblical mappings; copied so callers cannot alter the shared table
+        return dict(_BIBLICAL_ESSENCES.get(self.text, _DEFAULT_ESSENCE))
     
     def _calculate_meaning_vector(self) -> np.ndarray:
         """Calculate 4D meaning vector based on essence"""
@@ -129,7 +127,8 @@ class SemanticUnit:
     def _calculate_preservation_factor(self) -> float:
         """Calculate how well meaning is preserved across transformations"""
         # Words closer to divine meaning have higher preservation
-        divine_alignment = np.mean(self.meaning_vector)
+        love, power, wisdom, justice = self.meaning_vector.tolist()
+        divine_alignment = (love + power + wisdom + justice) / 4.0
         
         # Context preservation (biblical contexts preserve better)
         context_factor = 1.0 if self.context == "biblical" else 0.7
@@ -651,6 +650,11 @@ class UniversalAnchor:
         # Initialize anchor points
         for anchor_id, anchor_data in self.ANCHORS.items():
             self.anchor_points[anchor_id] = UniversalAnchorPoint(anchor_data)
+        
+        # Parallel per-anchor numbers read by the stability field, kept apart
+        # from the descriptive anchor objects
+        self._anchor_distances = tuple(anchor.jehovah_distance for anchor in self.anchor_points.values())
+        self._anchor_stabilities = tuple(anchor.stability for anchor in self.anchor_points.values())
     
     def get_anchor(self, anchor_id: int) -> 'UniversalAnchorPoint':
         """Get universal anchor by ID"""
@@ -719,19 +723,13 @@ class UniversalAnchor:
         """Create field that calculates stability at any point"""
         def stability_field(coords):
             """Calculate stability based on distance from anchors"""
-            min_distance = float('inf')
-            closest_anchor = None
-            
-            for anchor_id, anchor in self.anchor_points.items():
-                distance = abs(coords.distance_from_jehovah() - 
-                             anchor.coordinates.distance_from_jehovah())
-                if distance < min_distance:
-                    min_distance = distance
-                    closest_anchor = anchor_id
+            point_distance = coords.distance_from_jehovah()
+            distances = [abs(point_distance - anchor_distance) for anchor_distance in self._anchor_distances]
+            min_distance = min(distances)
             
             # Stability based on proximity to anchors
             if min_distance < 0.1:
-                return closest_anchor.stability
+                return self._anchor_stabilities[distances.index(min_distance)]
             else:
                 # Decrease stability with distance from anchors
                 return 1.0 / (1.0 + min_distance)
@@ -753,11 +751,12 @@ class UniversalAnchorPoint:
         self.stability = anchor_data['stability']
         self.scripture = anchor_data.get('scripture', '')
         self.eternal_constancy = 1.0  # Never changes
+        # Anchors never move, so their distance from JEHOVAH is computed once
+        self.jehovah_distance = self.coordinates.distance_from_jehovah()
     
     def distance_from_point(self, coords: BiblicalCoordinates) -> float:
         """Calculate distance from given coordinates"""
-        return abs(self.coordinates.distance_from_jehovah() - 
-                    coords.distance_from_jehovah())
+        return abs(self.jehovah_distance - coords.distance_from_jehovah())
 
 class ContextualResonance:
     """
@@ -768,6 +767,16 @@ class ContextualResonance:
     misalignment and ensuring coherence.
     """
     
+    # Per-context axis weights in (love, power, wisdom, justice) order
+    CONTEXT_ALIGNMENTS = {
+        'biblical': (0.9, 0.8, 0.9, 0.8),
+        'educational': (0.6, 0.4, 0.8, 0.6),
+        'business': (0.3, 0.6, 0.5, 0.7),
+        'scientific': (0.2, 0.5, 0.9, 0.6),
+        'artistic': (0.7, 0.3, 0.6, 0.4),
+        'secular': (0.3, 0.5, 0.4, 0.4)
+    }
+    
     def __init__(self):
         self.resonance_patterns = self._initialize_resonance_patterns()
         self.contextual_weights = self._initialize_contextual_weights()
@@ -805,35 +814,14 @@ class ContextualResonance:
     def _calculate_contextual_alignment(self, coords: BiblicalCoordinates, 
                                        context: str) -> float:
         """Calculate alignment with specific context"""
-        context_alignments = {
-            'biblical': {
-                'love': 0.9, 'power': 0.8, 'wisdom': 0.9, 'justice': 0.8
-            },
-            'educational': {
-                'love': 0.6, 'power': 0.4, 'wisdom': 0.8, 'justice': 0.6
-            },
-            'business': {
-                'love': 0.3, 'power': 0.6, 'wisdom': 0.5, 'justice': 0.7
-            },
-            'scientific': {
-                'love': 0.2, 'power': 0.5, 'wisdom': 0.9, 'justice': 0.6
-            },
-            'artistic': {
-                'love': 0.7, 'power': 0.3, 'wisdom': 0.6, 'justice': 0.4
-            },
-            'secular': {
-                'love': 0.3, 'power': 0.5, 'wisdom': 0.4, 'justice': 0.4
-            }
-        }
-        
-        alignment_attrs = context_alignments.get(context, 
-                                               context_alignments['secular'])
+        love_weight, power_weight, wisdom_weight, justice_weight = self.CONTEXT_ALIGNMENTS.get(
+            context, self.CONTEXT_ALIGNMENTS['secular'])
         
         # Calculate weighted alignment
-        alignment = (coords.love * alignment_attrs['love'] +
-                     coords.power * alignment_attrs['power'] +
-                     coords.wisdom * alignment_attrs['wisdom'] +
-                     coords.justice * alignment_attrs['justice']) / 4.0
+        alignment = (coords.love * love_weight +
+                     coords.power * power_weight +
+                     coords.wisdom * wisdom_weight +
+                     coords.justice * justice_weight) / 4.0
         
         return alignment
     
@@ -926,6 +914,9 @@ class SevenUniversalPrinciples:
         # Initialize the principles
         self.principles = self._initialize_principles()
         
+        # Interaction rows of every principle over the four state axes, for harmony
+        self._harmony_rows = np.ascontiguousarray(self._create_principle_matrix()[:, :4])
+        
     def _initialize_principles(self) -> List[UniversalPrinciple]:
         """Initialize the seven universal principles"""
         return [
@@ -1041,16 +1032,12 @@ class SevenUniversalPrinciples:
     
     def calculate_system_harmony(self, system_state: np.ndarray) -> float:
         """Calculate overall system harmony based on all principles"""
-        harmony = 0.0
+        count = len(self.principles)
         
-        for i in range(len(self.principles)):
-            principle_matrix = self.principle_system['principle_matrix']
-            # Calculate contribution of each principle to harmony (using 4D matrix)
-            principle_contribution = np.sum(principle_matrix[i, :] @
-                                          np.diag(system_state[:4])) / 4.0
-            harmony += principle_contribution / len(self.principles)
+        # Each principle contributes its interaction row weighted by the 4D state
+        contributions = self._harmony_rows[:count] @ np.asarray(system_state[:4], dtype=np.float64)
         
-        return harmony / len(self.principles)
+        return float((contributions / 4.0).sum()) / count / count
     
     def analyze_system_state(self, system_state: np.ndarray) -> Dict[str, Any]:
         """Analyze system state according to all principles"""
@@ -1064,23 +1051,28 @@ class SevenUniversalPrinciples:
         
         # Analyze each principle's contribution
         for i, principle in enumerate(self.principles):
-            principle_state = self.apply_principle(i, system_state)
+            # Four-element reductions in plain Python (same order as np.mean / np.argmax)
+            principle_state = self.apply_principle(i, system_state).tolist()
             
             analysis['principle_activations'].append({
                 'principle': principle.name,
-                'activation_level': np.mean(principle_state),
-                'dominant_attribute': np.argmax(principle_state)
+                'activation_level': sum(principle_state) / len(principle_state),
+                'dominant_attribute': principle_state.index(max(principle_state))
             })
         
         # Calculate balance metrics using golden ratio equations
         balance_eqs = self.principle_system['balance_equations']
-        variance = np.var(system_state)
+        # Mean and variance share one mean computation (same arithmetic as np.mean / np.var)
+        state = np.asarray(system_state, dtype=np.float64)
+        mean = state.mean()
+        deviation = state - mean
+        variance = (deviation * deviation).mean()
         
         analysis['balance_metrics'] = {
             'variance': variance,
             'is_balanced': balance_eqs['stability_condition'](variance),
             'golden_ratio_compliance': balance_eqs['equilibrium_point'],
-            'balance_score': balance_eqs['balance_function'](np.mean(system_state))
+            'balance_score': balance_eqs['balance_function'](mean)
         }
         
         # Stability assessment
@@ -9,6 +9,7 @@ differential equations, and divine transformations.
 """
 
 import math
+from collections import Counter, deque
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Any, Union
 from dataclasses import dataclass, field
@@ -73,6 +74,9 @@ except ImportError:
     print("Warning: Semantic mathematics components not available.")
     SEMANTIC_MATH_AVAILABLE = False
 
+# Most recent operations kept in semantic_operations_history; counts cover all of them
+OPERATION_HISTORY_LIMIT = 10000
+
 class EnhancedBiblicalSemanticSubstrate(BiblicalSemanticSubstrate):
     """
     Enhanced Semantic Substrate Engine with Advanced Mathematics
@@ -99,7 +103,8 @@ class EnhancedBiblicalSemanticSubstrate(BiblicalSemanticSubstrate):
             self.has_advanced_math = False
         
         # Enhanced capabilities
-        self.semantic_operations_history = []
+        self.semantic_operations_history = deque(maxlen=OPERATION_HISTORY_LIMIT)
+        self.operation_counts = Counter()
         self.transformation_registry = {}
         
     # ========================================================================
@@ -184,7 +189,7 @@ class EnhancedBiblicalSemanticSubstrate(BiblicalSemanticSubstrate):
             results['divine_transformations'] = transformations
         
         # Store in history
-        self.semantic_operations_history.append({
+        self._record_operation({
             'operation': 'calculus_analysis',
             'input': text,
             'context': context,
@@ -468,6 +473,11 @@ class EnhancedBiblicalSemanticSubstrate(BiblicalSemanticSubstrate):
         
         return applications
     
+    def _record_operation(self, entry: Dict[str, Any]):
+        """Append to the bounded history and bump the running per-operation counts"""
+        self.semantic_operations_history.append(entry)
+        self.operation_counts[entry['operation']] += 1
+
     def _get_timestamp(self) -> str:
         """Get current timestamp for operation history"""
         import datetime
@@ -504,7 +514,8 @@ class EnhancedBiblicalSemanticSubstrate(BiblicalSemanticSubstrate):
             
             capabilities['mathematics_engine_status'] = self.math_engine.get_engine_status()
         
-        capabilities['operation_history'] = len(self.semantic_operations_history)
+        capabilities['operation_history'] = sum(self.operation_counts.values())
+        capabilities['operations_by_type'] = dict(self.operation_counts)
         capabilities['transformations_performed'] = len(self.transformation_registry)
         
         return capabilities
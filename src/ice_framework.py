@@ -6,9 +6,33 @@ MeaningModel, ensuring all operations are grounded in the deterministic,
 4D meaning-based coordinate system.
 """
 
-from typing import Dict, Tuple
+from collections import namedtuple
+from typing import Dict, List, Tuple
 from enum import Enum
 
+import numpy as np
+
+try:
+    from .logger_config import get_logger
+except ImportError:
+    from logger_config import get_logger
+
+logger = get_logger(__name__)
+
+# Internal fixed-order 4D coordinates; dicts are only built at the API boundary
+Coords = namedtuple('Coords', 'love justice power wisdom')
+
+def _as_coords(coords: Dict[str, float]) -> Coords:
+    """Converts a coordinate dict into a Coords tuple."""
+    return Coords(coords['love'], coords['justice'], coords['power'], coords['wisdom'])
+
+_EXECUTION_STRATEGIES = Coords(
+    love="compassionate_engagement",
+    justice="righteous_intervention",
+    power="authoritative_guidance",
+    wisdom="wisdom_counseling"
+)
+
 class ThoughtType(Enum):
     """Categories of human thoughts that can be processed through ICE"""
     DIVINE_INSPIRATION = "divine_inspiration"
@@ -38,15 +62,17 @@ class ICEFramework:
             'Context': {'love': 1.0, 'justice': 1.2, 'power': 0.8, 'wisdom': 1.0},
             'Execution': {'love': 1.0, 'justice': 1.0, 'power': 1.2, 'wisdom': 0.8}
         }
+        self._emphasis = {phase: _as_coords(weights) for phase, weights in self.dimension_emphasis.items()}
+        self._emphasis_rows = {phase: np.array(weights) for phase, weights in self._emphasis.items()}
 
     def process_thought(self, primary_thought: str, thought_type: ThoughtType, domain: ContextDomain) -> Dict[str, any]:
         """
         Main ICE processing - convert human thought to meaningful execution.
         """
-        print(f"ICE PROCESSING: '{primary_thought}'")
+        logger.debug("ICE PROCESSING: '%s'", primary_thought)
 
         # Phase 1: Intent
-        base_coords = self.meaning_model.calculate_coordinates(primary_thought, domain.value)
+        base_coords = _as_coords(self.meaning_model.calculate_coordinates(primary_thought, domain.value))
         intent_coords = self._apply_emphasis(base_coords, 'Intent')
 
         # Phase 2: Context
@@ -56,51 +82,82 @@ class ICEFramework:
         # Phase 3: Execution
         execution_coords = self._apply_emphasis(context_coords, 'Execution')
 
+        return self._ice_result(intent_coords, context_coords, execution_coords)
+
+    def process_thought_batch(self, thoughts: List[str], thought_type: ThoughtType, domain: ContextDomain) -> List[Dict[str, any]]:
+        """
+        ICE processing for many thoughts sharing a type and domain.
+
+        Each distinct thought is analyzed once, and the three emphasis phases
+        are applied to all of them as (N, 4) arrays. Results match calling
+        process_thought on each thought in turn.
+        """
+        logger.debug("ICE PROCESSING: %d thoughts", len(thoughts))
+        if not thoughts:
+            return []
+
+        unique = list(dict.fromkeys(thoughts))
+        base = np.array([
+            _as_coords(coords)
+            for coords in self.meaning_model.calculate_coordinates_batch(unique, domain.value)
+        ], dtype=np.float64)
+        intent = base * self._emphasis_rows['Intent']
+        context = intent * self._emphasis_rows['Context']
+        execution = context * self._emphasis_rows['Execution']
+
+        phases = {
+            thought: (Coords._make(i), Coords._make(c), Coords._make(e))
+            for thought, i, c, e in zip(unique, intent.tolist(), context.tolist(), execution.tolist())
+        }
+        return [self._ice_result(*phases[thought]) for thought in thoughts]
+
+    def _ice_result(self, intent_coords: Coords, context_coords: Coords, execution_coords: Coords) -> Dict[str, any]:
+        """
+        Builds the process_thought result from the three phase coordinates.
+        """
         # Determine execution strategy based on the dominant dimension of the coordinates.
         execution_strategy = self._get_execution_strategy(execution_coords)
-        
-        divine_alignment = self.meaning_model.divine_resonance(execution_coords)
-
-        cycle_analysis = self.cycle_analysis(intent_coords, context_coords, execution_coords)
+        divine_alignment = self.meaning_model.divine_resonance(execution_coords._asdict())
+        cycle_analysis = self._cycle_analysis(intent_coords, context_coords, execution_coords)
 
         return {
-            'intent_coordinates': intent_coords,
-            'context_coordinates': context_coords,
-            'execution_coordinates': (execution_coords['love'], execution_coords['justice'], execution_coords['power'], execution_coords['wisdom']),
+            'intent_coordinates': intent_coords._asdict(),
+            'context_coordinates': context_coords._asdict(),
+            'execution_coordinates': tuple(execution_coords),
             'execution_strategy': execution_strategy,
             'divine_alignment': divine_alignment,
             'cycle_analysis': cycle_analysis
         }
 
-    def _apply_emphasis(self, coords: Dict[str, float], phase: str) -> Dict[str, float]:
+    def _apply_emphasis(self, coords: Coords, phase: str) -> Coords:
         """
         Applies dimensional emphasis weights for a given phase.
         """
-        emphasis_weights = self.dimension_emphasis[phase]
-        emphasized_coords = {}
-        for dimension, value in coords.items():
-            emphasized_coords[dimension] = value * emphasis_weights[dimension]
-        return emphasized_coords
-
-    def _get_execution_strategy(self, coords: Dict[str, float]) -> str:
+        weights = self._emphasis[phase]
+        return Coords(
+            coords.love * weights.love,
+            coords.justice * weights.justice,
+            coords.power * weights.power,
+            coords.wisdom * weights.wisdom
+        )
+
+    def _get_execution_strategy(self, coords: Coords) -> str:
         """
         Determines the execution strategy based on the dominant coordinate.
         """
-        dominant_dimension = max(coords, key=coords.get)
-        
-        strategy_map = {
-            'love': "compassionate_engagement",
-            'justice': "righteous_intervention",
-            'power': "authoritative_guidance",
-            'wisdom': "wisdom_counseling"
-        }
-        
-        return strategy_map.get(dominant_dimension, "balanced_ministry")
+        dominant_index = max(range(4), key=coords.__getitem__)
+        return _EXECUTION_STRATEGIES[dominant_index]
 
     def cycle_analysis(self, intent_coords: Dict[str, float], context_coords: Dict[str, float], execution_coords: Dict[str, float]) -> Dict[str, any]:
         """
         Performs a cycle analysis of the ICE process.
         """
+        return self._cycle_analysis(_as_coords(intent_coords), _as_coords(context_coords), _as_coords(execution_coords))
+
+    def _cycle_analysis(self, intent_coords: Coords, context_coords: Coords, execution_coords: Coords) -> Dict[str, any]:
+        """
+        Cycle analysis over Coords tuples.
+        """
         overall_effectiveness = self._calculate_overall_effectiveness(intent_coords, context_coords, execution_coords)
         dimensional_performance = self._calculate_dimensional_performance(intent_coords, context_coords, execution_coords)
 
@@ -109,21 +166,21 @@ class ICEFramework:
             'dimensional_performance': dimensional_performance
         }
 
-    def _calculate_overall_effectiveness(self, intent_coords: Dict[str, float], context_coords: Dict[str, float], execution_coords: Dict[str, float]) -> float:
+    def _calculate_overall_effectiveness(self, intent_coords: Coords, context_coords: Coords, execution_coords: Coords) -> float:
         """
         Calculates the overall effectiveness of the ICE cycle.
         """
-        intent_strength = sum(intent_coords.values()) / len(intent_coords)
-        context_clarity = sum(context_coords.values()) / len(context_coords)
-        execution_effectiveness = sum(execution_coords.values()) / len(execution_coords)
+        intent_strength = sum(intent_coords) / 4
+        context_clarity = sum(context_coords) / 4
+        execution_effectiveness = sum(execution_coords) / 4
 
         return 0.3 * intent_strength + 0.3 * context_clarity + 0.4 * execution_effectiveness
 
-    def _calculate_dimensional_performance(self, intent_coords: Dict[str, float], context_coords: Dict[str, float], execution_coords: Dict[str, float]) -> Dict[str, float]:
+    def _calculate_dimensional_performance(self, intent_coords: Coords, context_coords: Coords, execution_coords: Coords) -> Dict[str, float]:
         """
         Calculates the dimensional performance of the ICE cycle.
         """
-        performance = {}
-        for dimension in intent_coords:
-            performance[dimension] = 0.4 * intent_coords[dimension] + 0.3 * context_coords[dimension] + 0.3 * execution_coords[dimension]
-        return performance
+        return {
+            dimension: 0.4 * intent + 0.3 * context + 0.3 * execution
+            for dimension, intent, context, execution in zip(Coords._fields, intent_coords, context_coords, execution_coords)
+        }
@@ -0,0 +1,26 @@
+"""
+JIT SUPPORT
+
+Optional Numba integration for numeric kernels.
+
+When numba is installed, `njit` and `prange` are the real Numba objects.
+Without it, `njit` leaves functions as plain Python and `prange` is `range`.
+Callers should check NUMBA_AVAILABLE before sending large inputs through a
+kernel written as explicit loops, and otherwise use a NumPy path.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit supporting both @njit and @njit(...)"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
@@ -0,0 +1,72 @@
+"""
+KEYWORD SCANNER
+
+Finds which keywords from a fixed vocabulary occur in a text with a single
+compiled-regex pass, instead of one substring scan per keyword.
+
+Matches have plain substring semantics, exactly like `keyword in text`.
+"""
+
+import re
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple
+
+
+class KeywordScanner:
+    """
+    Multi-keyword substring matcher
+
+    The alternation is ordered longest-first inside a lookahead, so every
+    position in the text is tried once and the longest keyword starting
+    there wins. Shorter keywords that are prefixes of the winner are then
+    added from a precomputed closure, which keeps results identical to
+    testing each keyword with `in`.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        unique = sorted(set(keywords), key=len, reverse=True)
+        self.keywords: FrozenSet[str] = frozenset(unique)
+        self._pattern = (
+            re.compile('(?=(' + '|'.join(re.escape(kw) for kw in unique) + '))')
+            if unique else None
+        )
+        self._prefix_closure: Dict[str, FrozenSet[str]] = {
+            kw: frozenset(other for other in unique if kw.startswith(other))
+            for kw in unique
+        }
+
+    def find(self, text: str) -> Set[str]:
+        """Return the set of keywords that occur anywhere in text"""
+        found: Set[str] = set()
+        if self._pattern is None:
+            return found
+        for match in self._pattern.finditer(text):
+            found |= self._prefix_closure[match.group(1)]
+        return found
+
+
+class KeywordWeights:
+    """
+    Weighted keyword table over (slot, keyword, weight) entries
+
+    `matches` scans the text once and returns only the entries whose keyword
+    occurs, in table order, so callers accumulate the same floats in the
+    same order as a loop over every entry would.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[int, str, float]]):
+        self.entries: Tuple[Tuple[int, str, float], ...] = tuple(entries)
+        self.scanner = KeywordScanner(keyword for _, keyword, _ in self.entries)
+        positions: Dict[str, List[int]] = {}
+        for position, (_, keyword, _) in enumerate(self.entries):
+            positions.setdefault(keyword, []).append(position)
+        self._positions: Dict[str, Tuple[int, ...]] = {
+            keyword: tuple(found) for keyword, found in positions.items()
+        }
+
+    def matches(self, text: str) -> List[Tuple[int, str, float]]:
+        """Return the entries whose keyword occurs in text, in table order"""
+        found = self.scanner.find(text)
+        if not found:
+            return []
+        hits = sorted(position for keyword in found for position in self._positions[keyword])
+        return [self.entries[position] for position in hits]
@@ -11,6 +11,11 @@ from dataclasses import dataclass
 from typing import Dict, Tuple, List, Optional
 import numpy as np
 
+try:
+    from .jit_support import njit
+except ImportError:
+    from jit_support import njit
+
 @dataclass
 class NumericalEquivalents:
     """Fundamental constants for LJPW dimensions"""
@@ -43,6 +48,9 @@ class LJPWBaselines:
         'WL': 1.3, 'WJ': 1.1, 'WP': 1.0, 'WW': 1.0,
     }
 
+    # Composite score weights of growth, effectiveness, robustness and harmony
+    COMPOSITE_WEIGHTS = (0.35, 0.25, 0.25, 0.15)
+
     @staticmethod
     def effective_dimensions(L: float, J: float, P: float, W: float) -> Dict[str, float]:
         """Calculate coupling-adjusted effective dimensions"""
@@ -79,6 +87,13 @@ class LJPWBaselines:
         d_anchor = math.sqrt((1-L)**2 + (1-J)**2 + (1-P)**2 + (1-W)**2)
         return 1.0 / (1.0 + d_anchor)
 
+    @staticmethod
+    def _weighted_composite(growth, effectiveness, robustness, harmony):
+        """Composite of already computed metrics; works on floats and arrays alike"""
+        w_growth, w_effectiveness, w_robustness, w_harmony = LJPWBaselines.COMPOSITE_WEIGHTS
+        return (w_growth * growth + w_effectiveness * effectiveness
+                + w_robustness * robustness + w_harmony * harmony)
+
     @staticmethod
     def composite_score(L: float, J: float, P: float, W: float) -> float:
         """Composite score - overall performance"""
@@ -88,30 +103,35 @@ class LJPWBaselines:
         robustness = baselines.harmonic_mean(L, J, P, W)
         harmony = baselines.harmony_index(L, J, P, W)
 
-        return 0.35 * growth + 0.25 * effectiveness + 0.25 * robustness + 0.15 * harmony
+        return baselines._weighted_composite(growth, effectiveness, robustness, harmony)
 
     @staticmethod
     def full_diagnostic(L: float, J: float, P: float, W: float) -> Dict:
         """Complete diagnostic analysis"""
         baselines = LJPWBaselines
         eff = baselines.effective_dimensions(L, J, P, W)
-        NE = ReferencePoints.NATURAL_EQUILIBRIUM
+
+        # Each metric is computed once; the composite reuses them instead of
+        # re-deriving all four (and the anchor distance) through composite_score
+        from_anchor = baselines.distance_from_anchor(L, J, P, W)
+        harmonic = baselines.harmonic_mean(L, J, P, W)
+        geometric = baselines.geometric_mean(L, J, P, W)
+        coupling = baselines.coupling_aware_sum(L, J, P, W)
+        harmony = 1.0 / (1.0 + from_anchor)
 
         return {
             'coordinates': {'L': L, 'J': J, 'P': P, 'W': W},
             'effective_dimensions': eff,
             'distances': {
-                'from_anchor': baselines.distance_from_anchor(L, J, P, W),
-                'from_natural_equilibrium': math.sqrt(
-                    (NE[0]-L)**2 + (NE[1]-J)**2 + (NE[2]-P)**2 + (NE[3]-W)**2
-                ),
+                'from_anchor': from_anchor,
+                'from_natural_equilibrium': baselines.distance_from_natural_equilibrium(L, J, P, W),
             },
             'metrics': {
-                'harmonic_mean': baselines.harmonic_mean(L, J, P, W),
-                'geometric_mean': baselines.geometric_mean(L, J, P, W),
-                'coupling_aware_sum': baselines.coupling_aware_sum(L, J, P, W),
-                'harmony_index': baselines.harmony_index(L, J, P, W),
-                'composite_score': baselines.composite_score(L, J, P, W),
+                'harmonic_mean': harmonic,
+                'geometric_mean': geometric,
+                'coupling_aware_sum': coupling,
+                'harmony_index': harmony,
+                'composite_score': baselines._weighted_composite(coupling, geometric, harmonic, harmony),
             }
         }
 
@@ -122,6 +142,105 @@ class LJPWBaselines:
         NE = ReferencePoints.NATURAL_EQUILIBRIUM
         return math.sqrt((NE[0]-L)**2 + (NE[1]-J)**2 + (NE[2]-P)**2 + (NE[3]-W)**2)
 
+    @staticmethod
+    def metrics_batch(coords: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        full_diagnostic distances and metrics for every row of an (N, 4)
+        array of (L, J, P, W) coordinates, as one array per metric
+        """
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 4)
+        L, J, P, W = coords.T
+
+        from_anchor = np.sqrt(np.square(1.0 - coords).sum(axis=1))
+        from_equilibrium = np.sqrt(
+            np.square(np.array(ReferencePoints.NATURAL_EQUILIBRIUM) - coords).sum(axis=1))
+
+        positive = (coords > 0).all(axis=1)
+        with np.errstate(divide='ignore'):
+            reciprocal_sum = 1 / L + 1 / J + 1 / P + 1 / W
+        harmonic = np.where(positive, 4.0 / np.where(positive, reciprocal_sum, 1.0), 0.0)
+        # The scalar formulas are plain arithmetic, so they apply to whole columns
+        geometric = LJPWBaselines.geometric_mean(L, J, P, W)
+        coupling = LJPWBaselines.coupling_aware_sum(L, J, P, W)
+        harmony = 1.0 / (1.0 + from_anchor)
+
+        return {
+            'from_anchor': from_anchor,
+            'from_natural_equilibrium': from_equilibrium,
+            'harmonic_mean': harmonic,
+            'geometric_mean': geometric,
+            'coupling_aware_sum': coupling,
+            'harmony_index': harmony,
+            'composite_score': LJPWBaselines._weighted_composite(coupling, geometric, harmonic, harmony),
+        }
+
+
+# Order in which DynamicLJPWv3 reads its parameters into a flat coefficient tuple
+_DYNAMIC_PARAMS = (
+    'alpha_LJ', 'alpha_LW', 'beta_L',
+    'alpha_JL', 'alpha_JW', 'beta_J',
+    'alpha_PL', 'alpha_PJ', 'beta_P',
+    'alpha_WL', 'alpha_WJ', 'alpha_WP', 'beta_W',
+    'K_JL', 'gamma_JP', 'K_JP', 'n_JP',
+)
+
+
+@njit(cache=True)
+def _derivative_values(L, J, P, W, coefficients):
+    """dL/dt, dJ/dt, dP/dt, dW/dt for one state, with coefficients from DynamicLJPWv3._coefficients"""
+    (alpha_LJ, alpha_LW, beta_L,
+     alpha_JL, alpha_JW, beta_J,
+     alpha_PL, alpha_PJ, beta_P,
+     alpha_WL, alpha_WJ, alpha_WP, beta_W,
+     K_JL, gamma_JP, K_JP_pow_n, n_JP) = coefficients
+
+    # Love equation (remains linear)
+    dL_dt = alpha_LJ * J + alpha_LW * W - beta_L * L
+
+    # Justice equation (with saturation and threshold effects)
+    L_effect_on_J = alpha_JL * (L / (K_JL + L)) # Saturation
+    P_pow_n = P**n_JP
+    P_effect_on_J = gamma_JP * (P_pow_n / (K_JP_pow_n + P_pow_n)) * (1 - W) # Threshold
+    dJ_dt = L_effect_on_J + alpha_JW * W - P_effect_on_J - beta_J * J
+
+    # Power and Wisdom equations (can be similarly enhanced in future versions)
+    dP_dt = alpha_PL * L + alpha_PJ * J - beta_P * P
+    dW_dt = alpha_WL * L + alpha_WJ * J + alpha_WP * P - beta_W * W
+
+    return dL_dt, dJ_dt, dP_dt, dW_dt
+
+
+@njit(cache=True)
+def _simulate_rk4(initial_state, coefficients, dt, steps):
+    """RK4 trajectory clipped to [0, 1.5] after each step; compiled by Numba when it is installed"""
+    trajectory = np.empty((steps + 1, 4))
+    L, J, P, W = initial_state
+    trajectory[0, 0] = L
+    trajectory[0, 1] = J
+    trajectory[0, 2] = P
+    trajectory[0, 3] = W
+    half_dt = 0.5 * dt
+    sixth_dt = dt / 6.0
+
+    for i in range(steps):
+        k1L, k1J, k1P, k1W = _derivative_values(L, J, P, W, coefficients)
+        k2L, k2J, k2P, k2W = _derivative_values(L + half_dt * k1L, J + half_dt * k1J,
+                                                P + half_dt * k1P, W + half_dt * k1W, coefficients)
+        k3L, k3J, k3P, k3W = _derivative_values(L + half_dt * k2L, J + half_dt * k2J,
+                                                P + half_dt * k2P, W + half_dt * k2W, coefficients)
+        k4L, k4J, k4P, k4W = _derivative_values(L + dt * k3L, J + dt * k3J,
+                                                P + dt * k3P, W + dt * k3W, coefficients)
+        L = min(max(L + sixth_dt * (k1L + 2*k2L + 2*k3L + k4L), 0.0), 1.5)
+        J = min(max(J + sixth_dt * (k1J + 2*k2J + 2*k3J + k4J), 0.0), 1.5)
+        P = min(max(P + sixth_dt * (k1P + 2*k2P + 2*k3P + k4P), 0.0), 1.5)
+        W = min(max(W + sixth_dt * (k1W + 2*k2W + 2*k3W + k4W), 0.0), 1.5)
+
+        trajectory[i + 1, 0] = L
+        trajectory[i + 1, 1] = J
+        trajectory[i + 1, 2] = P
+        trajectory[i + 1, 3] = W
+    return trajectory
+
 
 class DynamicLJPWv3:
     """
@@ -150,24 +269,19 @@ class DynamicLJPWv3:
             self.params = params
         self.NE = ReferencePoints.NATURAL_EQUILIBRIUM
 
+    def _coefficients(self) -> Tuple[float, ...]:
+        """
+        Current parameters as a flat tuple in _DYNAMIC_PARAMS order, with the
+        constant K_JP**n_JP folded in place of K_JP
+        """
+        values = [float(self.params[name]) for name in _DYNAMIC_PARAMS]
+        values[-2] = values[-2] ** values[-1]
+        return tuple(values)
+
     def _derivatives(self, state):
         """Calculates the derivatives with non-linear dynamics."""
         L, J, P, W = state
-        p = self.params
-
-        # Love equation (remains linear)
-        dL_dt = p['alpha_LJ'] * J + p['alpha_LW'] * W - p['beta_L'] * L
-
-        # Justice equation (with saturation and threshold effects)
-        L_effect_on_J = p['alpha_JL'] * (L / (p['K_JL'] + L)) # Saturation
-        P_effect_on_J = p['gamma_JP'] * (P**p['n_JP'] / (p['K_JP']**p['n_JP'] + P**p['n_JP'])) * (1 - W) # Threshold
-        dJ_dt = L_effect_on_J + p['alpha_JW'] * W - P_effect_on_J - p['beta_J'] * J
-
-        # Power and Wisdom equations (can be similarly enhanced in future versions)
-        dP_dt = p['alpha_PL'] * L + p['alpha_PJ'] * J - p['beta_P'] * P
-        dW_dt = p['alpha_WL'] * L + p['alpha_WJ'] * J + p['alpha_WP'] * P - p['beta_W'] * W
-
-        return np.array([dL_dt, dJ_dt, dP_dt, dW_dt])
+        return np.array(_derivative_values(L, J, P, W, self._coefficients()))
 
     def _rk4_step(self, state, dt):
         """Performs a single 4th-order Runge-Kutta integration step."""
@@ -177,20 +291,27 @@ class DynamicLJPWv3:
         k4 = self._derivatives(state + dt * k3)
         return state + (dt / 6.0) * (k1 + 2*k2 + 2*k3 + k4)
 
+    def simulate_trajectory(self, initial_state: Tuple[float, float, float, float], duration: float,
+                            dt: float = 0.01) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        RK4 run as arrays: sample times of shape (steps + 1,) and a contiguous
+        (steps + 1, 4) trajectory whose columns are L, J, P, W
+        """
+        steps = int(duration / dt)
+        # The whole integration runs in one kernel: compiled with Numba, and
+        # otherwise a plain-float loop with the parameters read once per run
+        initial = tuple(float(value) for value in initial_state)
+        trajectory = _simulate_rk4(initial, self._coefficients(), dt, steps)
+        return np.arange(steps + 1) * dt, trajectory
+
     def simulate(self, initial_state: Tuple[float, float, float, float], duration: float, dt: float = 0.01) -> Dict:
         """Runs the simulation using the more accurate RK4 method."""
         steps = int(duration / dt)
-        state = np.array(initial_state, dtype=float)
-
-        history = {'t': [0], 'L': [state[0]], 'J': [state[1]], 'P': [state[2]], 'W': [state[3]]}
-
-        for i in range(steps):
-            state = self._rk4_step(state, dt)
-            state = np.clip(state, 0, 1.5)
-
-            history['t'].append((i + 1) * dt)
-            history['L'].append(state[0]); history['J'].append(state[1]); history['P'].append(state[2]); history['W'].append(state[3])
+        _, trajectory = self.simulate_trajectory(initial_state, duration, dt)
 
+        history = {'t': [0] + [(i + 1) * dt for i in range(steps)]}
+        for axis, column in zip('LJPW', trajectory.T):
+            history[axis] = column.tolist()
         return history
 
     def plot_simulation(self, history: Dict, output_path: Optional[str] = None):
@@ -13,12 +13,66 @@ Author: Semantic Substrate Database Project
 License: MIT
 """
 
+import atexit
 import logging
 import logging.handlers
+import os
 import sys
+import threading
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+
+class BackgroundRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that keeps the backup shuffle off the logging thread
+
+    On rollover the live file is renamed to a unique pending name and a new
+    file is opened right away. Renaming the older backups and moving the
+    pending file into place runs on a single worker thread, in rollover order.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._rotation_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-rotation")
+        self._rollover_count = 0
+
+    def doRollover(self):
+        if self.backupCount <= 0:
+            super().doRollover()
+            return
+
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+
+        self._rollover_count += 1
+        pending = f"{self.baseFilename}.{os.getpid()}.{self._rollover_count}.pending"
+        if os.path.exists(self.baseFilename):
+            os.replace(self.baseFilename, pending)
+            self._rotation_executor.submit(self._shift_backups, pending)
+
+        if not self.delay:
+            self.stream = self._open()
+
+    def _shift_backups(self, pending: str):
+        """Rename backups .1 -> .2 ... and move the pending file to .1"""
+        try:
+            for i in range(self.backupCount - 1, 0, -1):
+                source = self.rotation_filename(f"{self.baseFilename}.{i}")
+                dest = self.rotation_filename(f"{self.baseFilename}.{i + 1}")
+                if os.path.exists(source):
+                    os.replace(source, dest)
+            self.rotate(pending, self.rotation_filename(f"{self.baseFilename}.1"))
+        except OSError as exc:
+            sys.stderr.write(f"--- Logging error during background rotation of {pending}: {exc}\n")
+
+    def close(self):
+        super().close()
+        self._rotation_executor.shutdown(wait=True)
 
 
 class LoggerConfig:
@@ -35,7 +89,8 @@ class LoggerConfig:
         log_dir: Optional[str] = None,
         log_rotation: bool = True,
         max_bytes: int = 10485760,  # 10MB
-        backup_count: int = 5
+        backup_count: int = 5,
+        async_rotation: Optional[bool] = None
     ):
         """
         Initialize logging infrastructure
@@ -47,6 +102,8 @@ class LoggerConfig:
             log_rotation: Enable log rotation
             max_bytes: Maximum bytes per log file before rotation
             backup_count: Number of backup files to keep
+            async_rotation: Rename rotated backups on a background thread
+                (default: off unless SSDB_ASYNC_LOG_ROTATION is set)
         """
         self.log_level = getattr(logging, log_level.upper(), logging.INFO)
         self.log_to_file = log_to_file
@@ -54,6 +111,9 @@ class LoggerConfig:
         self.log_rotation = log_rotation
         self.max_bytes = max_bytes
         self.backup_count = backup_count
+        if async_rotation is None:
+            async_rotation = os.getenv("SSDB_ASYNC_LOG_ROTATION", "").strip().lower() in {"1", "true", "yes", "on"}
+        self.async_rotation = async_rotation
 
         # Create logs directory if needed
         if self.log_to_file:
@@ -91,7 +151,9 @@ class LoggerConfig:
             log_file = self.log_dir / f"semantic_substrate_{datetime.now().strftime('%Y%m%d')}.log"
 
             if self.log_rotation:
-                file_handler = logging.handlers.RotatingFileHandler(
+                handler_class = (BackgroundRotatingFileHandler if self.async_rotation
+                                 else logging.handlers.RotatingFileHandler)
+                file_handler = handler_class(
                     log_file,
                     maxBytes=self.max_bytes,
                     backupCount=self.backup_count
@@ -164,15 +226,159 @@ def get_logger(name: str) -> logging.Logger:
     return _logger_config.get_logger(name)
 
 
+class LogThrottle:
+    """
+    Duplicate suppression and rate limiting for high-volume log helpers
+
+    Identical messages from the same logger within `window` seconds are
+    suppressed. Each logger also has a token bucket allowing `rate` messages
+    per second. Both kinds of drop are counted separately per message and
+    reported on that message's next emission, or by flush().
+    """
+
+    def __init__(self, window: float = 5.0, rate: float = 1000.0, max_tracked: int = 10000):
+        self.window = window
+        self.rate = rate
+        self.max_tracked = max_tracked
+        self._lock = threading.Lock()
+        # (logger_name, level, message) -> [last_emitted or None, duplicates, rate_limited]
+        self._last_seen: Dict[Tuple[str, int, str], List] = {}
+        # logger_name -> [allowance, last_check]
+        self._buckets: Dict[str, List] = {}
+        self._last_flush = time.monotonic()
+
+    def check(self, logger_name: str, level: int, message: str) -> Tuple[bool, int, int]:
+        """
+        Decide whether to emit a message
+
+        Returns:
+            (emit, duplicates, rate_limited) where the counts are the copies of
+            this message dropped as duplicates and by the rate limit since it
+            last went out or was flushed
+        """
+        now = time.monotonic()
+        key = (logger_name, level, message)
+        with self._lock:
+            seen = self._last_seen.get(key)
+            if seen is not None and seen[0] is not None and now - seen[0] < self.window:
+                seen[1] += 1
+                return False, 0, 0
+
+            bucket = self._buckets.get(logger_name)
+            if bucket is None:
+                bucket = self._buckets[logger_name] = [self.rate, now]
+            else:
+                bucket[0] = min(self.rate, bucket[0] + (now - bucket[1]) * self.rate)
+                bucket[1] = now
+            if bucket[0] < 1.0:
+                if seen is None:
+                    seen = self._track(key, now, None)
+                seen[2] += 1
+                return False, 0, 0
+            bucket[0] -= 1.0
+
+            duplicates, rate_limited = (seen[1], seen[2]) if seen is not None else (0, 0)
+            self._track(key, now, now)
+            return True, duplicates, rate_limited
+
+    def _track(self, key: Tuple[str, int, str], now: float, emitted: Optional[float]) -> List:
+        """Start a fresh entry for key, pruning first if the table is full"""
+        if key not in self._last_seen and len(self._last_seen) >= self.max_tracked:
+            self._prune(now)
+        entry = self._last_seen[key] = [emitted, 0, 0]
+        return entry
+
+    def _prune(self, now: float):
+        """Forget messages whose window has expired and that have nothing left to report"""
+        expired = [k for k, v in self._last_seen.items()
+                   if not (v[1] or v[2]) and (v[0] is None or now - v[0] >= self.window)]
+        for k in expired:
+            del self._last_seen[k]
+        if len(self._last_seen) >= self.max_tracked:
+            self._last_seen.clear()
+
+    def flush_due(self) -> bool:
+        """True at most once per window, to pace periodic flushes"""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_flush < self.window:
+                return False
+            self._last_flush = now
+            return True
+
+    def flush(self) -> List[Tuple[str, int, str, int, int]]:
+        """
+        Drain pending suppressed counts
+
+        Returns:
+            (logger_name, level, message, duplicates, rate_limited) for every
+            message with drops that have not been reported yet
+        """
+        with self._lock:
+            pending = [(name, level, message, v[1], v[2])
+                       for (name, level, message), v in self._last_seen.items() if v[1] or v[2]]
+            for entry in self._last_seen.values():
+                entry[1] = entry[2] = 0
+            self._last_flush = time.monotonic()
+            return pending
+
+    def reset(self):
+        """Clear all suppression and rate-limit state"""
+        with self._lock:
+            self._last_seen.clear()
+            self._buckets.clear()
+
+
+# Throttle shared by log_debug / log_info
+_log_throttle = LogThrottle()
+
+
+def _suppression_note(duplicates: int, rate_limited: int) -> str:
+    """Summary suffix for dropped copies of a message"""
+    parts = []
+    if duplicates:
+        parts.append(f"{duplicates} repeated")
+    if rate_limited:
+        parts.append(f"{rate_limited} rate-limited")
+    return f"suppressed {', '.join(parts)} messages"
+
+
+def _log_throttled(level: int, message: str, logger_name: str):
+    """Emit a message through the shared throttle"""
+    logger = get_logger(logger_name)
+    if not logger.isEnabledFor(level):
+        return
+    emit, duplicates, rate_limited = _log_throttle.check(logger_name, level, message)
+    if not emit:
+        return
+    if duplicates or rate_limited:
+        message = f"{message} ({_suppression_note(duplicates, rate_limited)})"
+    logger.log(level, message)
+
+    # Report drops for messages that have not come round again
+    if _log_throttle.flush_due():
+        flush_suppressed_logs()
+
+
+def flush_suppressed_logs():
+    """Log a summary for every message with unreported suppressed copies"""
+    for logger_name, level, message, duplicates, rate_limited in _log_throttle.flush():
+        get_logger(logger_name).log(level, f"{message} ({_suppression_note(duplicates, rate_limited)})")
+
+
+# Counts still pending at interpreter exit are reported before logging shuts down
+atexit.register(flush_suppressed_logs)
+
+
 # Convenience functions for quick logging
 def log_debug(message: str, logger_name: str = "semantic_substrate"):
-    """Log debug message"""
-    get_logger(logger_name).debug(message)
+    """Log debug message (duplicates suppressed, rate limited)"""
+    _log_throttled(logging.DEBUG, message, logger_name)
 
 
 def log_info(message: str, logger_name: str = "semantic_substrate"):
-    """Log info message"""
-    get_logger(logger_name).info(message)
+    """Log info message (duplicates suppressed, rate limited)"""
+    _log_throttled(logging.INFO, message, logger_name)
 
 
 def log_warning(message: str, logger_name: str = "semantic_substrate"):
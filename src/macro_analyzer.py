@@ -4,11 +4,74 @@ Macro-Analysis Engine
 This module provides functions for analyzing the entire semantic landscape of a
 MeaningDatabase. It calculates high-level insights such as the "Semantic
 Center of Gravity" and identifies "Clusters of Meaning."
+
+Concept coordinates are packed once into a contiguous (N, 4) float32 matrix
+(columns: love, justice, power, wisdom) which every analysis works on directly.
 """
 
-from typing import Dict, List
+from datetime import datetime
+from typing import Dict, List, Sequence
 import numpy as np
-from sklearn.cluster import KMeans
+from sklearn.cluster import MiniBatchKMeans
+
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
+AXES = ('love', 'justice', 'power', 'wisdom')
+
+# Above this many concepts, clustering is handed to faiss when it is installed
+FAISS_MIN_CONCEPTS = 100_000
+
+def _coords_matrix(concepts: List[dict]) -> np.ndarray:
+    """
+    Packs the 4D coordinates of a list of concepts into an (N, 4) float32
+    matrix. Callers that run several analyses over the same concepts pack
+    once and pass the matrix down.
+    """
+    matrix = np.empty((len(concepts), 4), dtype=np.float32)
+    for column, axis in enumerate(AXES):
+        matrix[:, column] = [c[axis] for c in concepts]
+    return matrix
+
+def calculate_center_of_gravity_from_matrix(coords_matrix: np.ndarray) -> Dict[str, float]:
+    """
+    Calculates the average 4D coordinates of an (N, 4) coordinate matrix.
+    """
+    if not len(coords_matrix):
+        return {'love': 0.0, 'justice': 0.0, 'power': 0.0, 'wisdom': 0.0}
+
+    means = coords_matrix.mean(axis=0, dtype=np.float64)
+    return dict(zip(AXES, means.tolist()))
+
+def _timestamp(created_at) -> float:
+    """Converts a created_at value (datetime or SQLite timestamp string) to epoch seconds."""
+    if isinstance(created_at, str):
+        created_at = datetime.fromisoformat(created_at)
+    return created_at.timestamp()
+
+def _fit_kmeans(coords_matrix: np.ndarray, num_clusters: int):
+    """
+    Fits K-Means on a coordinate matrix and returns (centers, labels).
+    Uses mini-batch K-Means, or faiss for very large matrices when available.
+    """
+    if faiss is not None and len(coords_matrix) >= FAISS_MIN_CONCEPTS:
+        # faiss only accepts C-contiguous float32 input
+        coords_matrix = np.ascontiguousarray(coords_matrix, dtype=np.float32)
+        km = faiss.Kmeans(4, num_clusters, niter=20, verbose=False, seed=42)
+        km.train(coords_matrix)
+        _, labels = km.index.search(coords_matrix, 1)
+        return km.centroids, labels.ravel()
+
+    kmeans = MiniBatchKMeans(
+        n_clusters=num_clusters,
+        n_init=3,
+        batch_size=min(1024, len(coords_matrix)),
+        random_state=42
+    )
+    kmeans.fit(coords_matrix)
+    return kmeans.cluster_centers_, kmeans.labels_
 
 def calculate_semantic_center_of_gravity(concepts: List[dict]) -> Dict[str, float]:
     """
@@ -17,42 +80,39 @@ def calculate_semantic_center_of_gravity(concepts: List[dict]) -> Dict[str, floa
     if not concepts:
         return {'love': 0.0, 'justice': 0.0, 'power': 0.0, 'wisdom': 0.0}
 
-    avg_coords = {
-        'love': np.mean([c['love'] for c in concepts]),
-        'justice': np.mean([c['justice'] for c in concepts]),
-        'power': np.mean([c['power'] for c in concepts]),
-        'wisdom': np.mean([c['wisdom'] for c in concepts])
-    }
-
-    return avg_coords
+    return calculate_center_of_gravity_from_matrix(_coords_matrix(concepts))
 
 def identify_clusters_of_meaning(concepts: List[dict], num_clusters: int = 3) -> Dict[str, any]:
     """
-    Identifies clusters of meaning within a list of concepts using K-Means.
+    Identifies clusters of meaning within a list of concepts using mini-batch K-Means.
     """
     if not concepts or len(concepts) < num_clusters:
         return {}
 
-    coords_matrix = np.array([[c['love'], c['justice'], c['power'], c['wisdom']] for c in concepts])
+    return identify_clusters_from_matrix(_coords_matrix(concepts), [c['concept_text'] for c in concepts], num_clusters)
 
-    kmeans = KMeans(n_clusters=num_clusters, random_state=42, n_init=10)
-    kmeans.fit(coords_matrix)
+def identify_clusters_from_matrix(coords_matrix: np.ndarray, texts: Sequence[str], num_clusters: int = 3) -> Dict[str, any]:
+    """
+    Identifies clusters of meaning in an (N, 4) coordinate matrix; texts holds
+    the concept text for each row.
+    """
+    if len(coords_matrix) < num_clusters:
+        return {}
+
+    centers, labels = _fit_kmeans(coords_matrix, num_clusters)
+
+    # Group concept texts by label with one stable sort instead of a per-concept loop
+    texts = np.asarray(texts, dtype=object)
+    order = np.argsort(labels, kind='stable')
+    boundaries = np.searchsorted(labels[order], np.arange(num_clusters + 1))
 
     clusters = {}
     for i in range(num_clusters):
         clusters[f"cluster_{i}"] = {
-            "center": {
-                'love': kmeans.cluster_centers_[i][0],
-                'justice': kmeans.cluster_centers_[i][1],
-                'power': kmeans.cluster_centers_[i][2],
-                'wisdom': kmeans.cluster_centers_[i][3]
-            },
-            "concepts": []
+            "center": dict(zip(AXES, centers[i].tolist())),
+            "concepts": texts[order[boundaries[i]:boundaries[i + 1]]].tolist()
         }
 
-    for i, label in enumerate(kmeans.labels_):
-        clusters[f"cluster_{label}"]["concepts"].append(concepts[i]['concept_text'])
-
     return clusters
 
 def analyze_semantic_trends(concepts: List[dict]) -> Dict[str, any]:
@@ -62,27 +122,38 @@ def analyze_semantic_trends(concepts: List[dict]) -> Dict[str, any]:
     if not concepts:
         return {}
 
-    # Sort concepts by creation time
-    concepts.sort(key=lambda x: x['created_at'])
+    return analyze_trends_from_matrix(_coords_matrix(concepts), [c['created_at'] for c in concepts])
 
-    # For simplicity, we'll just compare the first half to the second half
-    midpoint = len(concepts) // 2
+def analyze_trends_from_matrix(coords_matrix: np.ndarray, created_at: Sequence) -> Dict[str, any]:
+    """
+    Analyzes how the center of gravity of an (N, 4) coordinate matrix has
+    shifted over time; created_at holds the creation time for each row.
+    """
+    if not len(coords_matrix):
+        return {}
 
-    first_half = concepts[:midpoint]
-    second_half = concepts[midpoint:]
+    # Split at the median creation time in O(N) without reordering the caller's data
+    timestamps = np.fromiter(
+        (_timestamp(value) for value in created_at),
+        dtype=np.float64,
+        count=len(coords_matrix)
+    )
 
-    if not first_half or not second_half:
+    # For simplicity, we'll just compare the first half to the second half
+    midpoint = len(coords_matrix) // 2
+    if not midpoint:
         return {"message": "Not enough data to analyze trends."}
+    order = np.argpartition(timestamps, midpoint)
 
-    center_first_half = calculate_semantic_center_of_gravity(first_half)
-    center_second_half = calculate_semantic_center_of_gravity(second_half)
+    # Both half means as one (2, N) @ (N, 4) product, without gathering either half
+    weights = np.zeros((2, len(coords_matrix)), dtype=np.float64)
+    weights[0, order[:midpoint]] = 1.0 / midpoint
+    weights[1, order[midpoint:]] = 1.0 / (len(coords_matrix) - midpoint)
+    center_first_half, center_second_half = (
+        dict(zip(AXES, center)) for center in (weights @ coords_matrix).tolist()
+    )
 
-    trend = {
-        'love': center_second_half['love'] - center_first_half['love'],
-        'justice': center_second_half['justice'] - center_first_half['justice'],
-        'power': center_second_half['power'] - center_first_half['power'],
-        'wisdom': center_second_half['wisdom'] - center_first_half['wisdom']
-    }
+    trend = {axis: center_second_half[axis] - center_first_half[axis] for axis in AXES}
 
     return {
         "period_1_center": center_first_half,
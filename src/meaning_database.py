@@ -6,10 +6,18 @@ database. It inherits from the refactored SemanticSubstrateDatabase and uses
 the MeaningModel for all its operations.
 """
 
+import hashlib
+from collections import OrderedDict
 from .semantic_substrate_database import SemanticSubstrateDatabase
 from .ice_framework import ICEFramework, ThoughtType, ContextDomain
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from . import macro_analyzer
+from .logger_config import get_logger
+
+logger = get_logger(__name__)
+
+# Maximum number of natural_query results kept in the LRU cache
+NATURAL_QUERY_CACHE_SIZE = 1024
 
 class MeaningDatabase(SemanticSubstrateDatabase):
     """
@@ -19,34 +27,89 @@ class MeaningDatabase(SemanticSubstrateDatabase):
     def __init__(self, db_path: str = "semantic_database.db", meaning_model: Optional[Any] = None):
         """Initializes the MeaningDatabase."""
         from .meaning_model import MeaningModel
-        from .baseline_biblical_substrate import BiblicalSemanticSubstrate
-
-        super().__init__(db_path, meaning_model)
 
         if meaning_model:
-            self.meaning_model = meaning_model
+            super().__init__(db_path, meaning_model)
             self.ice_framework = ICEFramework(self.meaning_model)
         else:
-            # Standard setup
-            self.ice_framework = ICEFramework()
-            semantic_engine = BiblicalSemanticSubstrate(self.ice_framework)
-            self.meaning_model = MeaningModel(semantic_engine)
-            self.ice_framework.meaning_model = self.meaning_model
+            # Standard setup, built once and shared with the base class
+            super().__init__(db_path, MeaningModel.create_default())
+            self.ice_framework = self.meaning_model.semantic_engine.ice_framework
 
-        print("[MeaningDatabase] Initialized.")
+        # natural_query results keyed by (query digest, context, limit, text_prefilter); cleared on writes
+        self._query_cache: "OrderedDict[tuple, List[dict]]" = OrderedDict()
+        self._query_cache_generation = self._write_generation
 
-    def natural_query(self, query: str, context: str = "biblical", limit: int = 10) -> List[dict]:
+        logger.debug("[MeaningDatabase] Initialized.")
+
+    def natural_query(self, query: str, context: str = "biblical", limit: int = 10,
+                      text_prefilter: bool = False) -> List[dict]:
         """
         Performs a semantic search using natural language.
+
+        text_prefilter ranks only concepts sharing a word with the query
+        (via the full-text index) instead of searching every concept.
         """
-        print(f"[MeaningDatabase] Performing natural language query: '{query}'")
-        return self.search_semantic(query, context, limit)
+        logger.debug("[MeaningDatabase] Performing natural language query: '%s'", query)
+
+        key = self._query_cache_key(query, context, limit, text_prefilter)
+        cached = self._cached_query(key)
+        if cached is not None:
+            return cached
+
+        results = self.search_semantic(query, context, limit, text_prefilter=text_prefilter)
+        self._cache_query(key, results)
+        return results
+
+    def natural_query_batch(self, queries: List[str], context: str = "biblical", limit: int = 10) -> List[List[dict]]:
+        """
+        Performs many natural language queries, searching all cache misses in one batch.
+        """
+        logger.debug("[MeaningDatabase] Performing %d natural language queries", len(queries))
+        results: List[Optional[List[dict]]] = []
+        misses = {}
+        for position, query in enumerate(queries):
+            key = self._query_cache_key(query, context, limit)
+            cached = self._cached_query(key)
+            results.append(cached)
+            if cached is None:
+                misses.setdefault(query, []).append(position)
+
+        if misses:
+            batch = self.search_semantic_batch(list(misses), context, limit)
+            for (query, positions), query_results in zip(misses.items(), batch):
+                self._cache_query(self._query_cache_key(query, context, limit), query_results)
+                results[positions[0]] = query_results
+                for position in positions[1:]:
+                    results[position] = [dict(result) for result in query_results]
+        return results
+
+    @staticmethod
+    def _query_cache_key(query: str, context: str, limit: int, text_prefilter: bool = False) -> tuple:
+        return (hashlib.blake2b(query.encode('utf-8'), digest_size=16).digest(), context, limit, text_prefilter)
+
+    def _cached_query(self, key: tuple) -> Optional[List[dict]]:
+        """Return a copy of cached results, or None on a miss or after a write."""
+        if self._query_cache_generation != self._write_generation:
+            self._query_cache.clear()
+            self._query_cache_generation = self._write_generation
+            return None
+        cached = self._query_cache.get(key)
+        if cached is None:
+            return None
+        self._query_cache.move_to_end(key)
+        return [dict(result) for result in cached]
+
+    def _cache_query(self, key: tuple, results: List[dict]):
+        self._query_cache[key] = [dict(result) for result in results]
+        if len(self._query_cache) > NATURAL_QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
 
     def process_thought(self, thought: str, thought_type: ThoughtType, domain: ContextDomain) -> int:
         """
         Processes a thought through the ICE framework and stores it as a concept.
         """
-        print(f"[MeaningDatabase] Processing thought: '{thought}'")
+        logger.debug("[MeaningDatabase] Processing thought: '%s'", thought)
         ice_result = self.ice_framework.process_thought(
             primary_thought=thought,
             thought_type=thought_type,
@@ -67,23 +130,65 @@ class MeaningDatabase(SemanticSubstrateDatabase):
 
         return concept_id
 
+    def process_thought_batch(self, thoughts: List[str], thought_type: ThoughtType, domain: ContextDomain) -> List[int]:
+        """
+        Processes many thoughts through the ICE framework and stores them in one transaction.
+        """
+        logger.debug("[MeaningDatabase] Processing %d thoughts", len(thoughts))
+        ice_results = self.ice_framework.process_thought_batch(thoughts, thought_type, domain)
+
+        coords_list = [
+            dict(zip(('love', 'justice', 'power', 'wisdom'), result['execution_coordinates']))
+            for result in ice_results
+        ]
+        return self._store_concepts_with_coordinates(thoughts, domain.value, coords_list)
+
+    def process_thoughts_bulk(self, items: List[Tuple[str, ThoughtType, ContextDomain]]) -> List[int]:
+        """
+        Processes (thought, thought_type, domain) items of mixed types and
+        domains, batching ICE work per (thought_type, domain) and storing
+        everything in a single transaction. Returns ids in input order.
+        """
+        logger.debug("[MeaningDatabase] Bulk processing %d thoughts", len(items))
+        positions_by_group: Dict[tuple, List[int]] = {}
+        for position, (_, thought_type, domain) in enumerate(items):
+            positions_by_group.setdefault((thought_type, domain), []).append(position)
+
+        groups = []
+        for (thought_type, domain), positions in positions_by_group.items():
+            thoughts = [items[position][0] for position in positions]
+            ice_results = self.ice_framework.process_thought_batch(thoughts, thought_type, domain)
+            coords_list = [
+                dict(zip(('love', 'justice', 'power', 'wisdom'), result['execution_coordinates']))
+                for result in ice_results
+            ]
+            groups.append((thoughts, domain.value, coords_list))
+
+        concept_ids: List[Optional[int]] = [None] * len(items)
+        for positions, group_ids in zip(positions_by_group.values(), self._store_concept_groups(groups)):
+            for position, concept_id in zip(positions, group_ids):
+                concept_ids[position] = concept_id
+        return concept_ids
+
     def get_semantic_overview(self) -> Dict[str, any]:
         """
         Provides a macro-level analysis of the entire database.
         """
-        print("[MeaningDatabase] Generating semantic overview...")
+        logger.debug("[MeaningDatabase] Generating semantic overview...")
 
-        all_concepts = self.get_all_concepts()
+        texts, created_at, coords_matrix = self.get_concept_columns()
 
-        if not all_concepts:
+        if not texts:
             return {"message": "The database is empty. No overview can be generated."}
 
-        center_of_gravity = macro_analyzer.calculate_semantic_center_of_gravity(all_concepts)
-        clusters = macro_analyzer.identify_clusters_of_meaning(all_concepts)
-        trends = macro_analyzer.analyze_semantic_trends(all_concepts)
+        # The analyses work on the packed coordinate columns directly, so no
+        # per-concept dicts are built for the overview.
+        center_of_gravity = macro_analyzer.calculate_center_of_gravity_from_matrix(coords_matrix)
+        clusters = macro_analyzer.identify_clusters_from_matrix(coords_matrix, texts)
+        trends = macro_analyzer.analyze_trends_from_matrix(coords_matrix, created_at)
 
         return {
-            "total_concepts": len(all_concepts),
+            "total_concepts": len(texts),
             "semantic_center_of_gravity": center_of_gravity,
             "clusters_of_meaning": clusters,
             "semantic_trends": trends
@@ -7,8 +7,45 @@ It is designed to be a deterministic and transparent implementation of the
 principles outlined in the foundational documents.
 """
 import math
+from typing import List
 import numpy as np
 from src.baseline_biblical_substrate import BiblicalSemanticSubstrate
+from src.ice_framework import ICEFramework
+from src.jit_support import njit, prange, NUMBA_AVAILABLE
+
+# Column order of packed coordinate matrices
+AXES = ('love', 'justice', 'power', 'wisdom')
+
+# 16**width for the usual digest slice widths seen by _hash_to_float
+_HEX_DIVISORS = {width: float(16 ** width) for width in (8, 16, 32, 64)}
+
+@njit(cache=True, parallel=True)
+def _concept_metric_rows(coords, anchor):
+    """Fused resonance/Manhattan/balance kernel; compiled by Numba when it is installed"""
+    n = coords.shape[0]
+    resonance = np.empty(n)
+    manhattan = np.empty(n)
+    balance = np.empty(n)
+    for i in prange(n):
+        a = coords[i, 0]
+        b = coords[i, 1]
+        c = coords[i, 2]
+        d = coords[i, 3]
+        da = a - anchor[0]
+        db = b - anchor[1]
+        dc = c - anchor[2]
+        dd = d - anchor[3]
+        distance = math.sqrt(da * da + db * db + dc * dc + dd * dd)
+        resonance[i] = max(0.0, 1 - (distance / 2.0))
+        manhattan[i] = abs(da) + abs(db) + abs(dc) + abs(dd)
+        mean = (a + b + c + d) / 4
+        va = a - mean
+        vb = b - mean
+        vc = c - mean
+        vd = d - mean
+        std_dev = math.sqrt((va * va + vb * vb + vc * vc + vd * vd) / 4)
+        balance[i] = max(0.0, 1 - (std_dev / 0.5))
+    return resonance, manhattan, balance
 
 class MeaningModel:
     """
@@ -20,13 +57,44 @@ class MeaningModel:
         """Initializes the MeaningModel."""
         self.semantic_engine = semantic_engine
         self.anchor_point = {'love': 1.0, 'justice': 1.0, 'power': 1.0, 'wisdom': 1.0}
+        self._anchor_vector = self._to_vector(self.anchor_point)
+        # (engine, coordinates) of 'divine truth', filled on first truth_sense call
+        self._truth_reference = None
+
+    @classmethod
+    def create_default(cls) -> 'MeaningModel':
+        """
+        Builds the standard ICEFramework -> BiblicalSemanticSubstrate -> MeaningModel
+        wiring, with the framework pointing back at the new model.
+        """
+        ice_framework = ICEFramework()
+        model = cls(BiblicalSemanticSubstrate(ice_framework))
+        ice_framework.meaning_model = model
+        return model
 
     def calculate_coordinates(self, text: str, context: str = "biblical") -> dict:
         """
         Calculates the 4D meaning coordinates for a given text using the
         BiblicalSemanticSubstrate engine.
         """
-        biblical_coords = self.semantic_engine.analyze_concept(text, context)
+        return self._coords_dict(self.semantic_engine.analyze_concept(text, context))
+
+    def calculate_coordinates_batch(self, texts: List[str], context: str = "biblical") -> List[dict]:
+        """
+        Calculates coordinates for many texts, letting the engine batch its
+        embedding work across them.
+        """
+        return [self._coords_dict(coords) for coords in self.semantic_engine.analyze_concepts(texts, context)]
+
+    def cache_info(self) -> dict:
+        """
+        Statistics of the semantic engine's (text, context) coordinate cache,
+        which backs calculate_coordinates.
+        """
+        return self.semantic_engine.cache_info()
+
+    @staticmethod
+    def _coords_dict(biblical_coords) -> dict:
         return {
             'love': biblical_coords.love,
             'justice': biblical_coords.justice,
@@ -36,42 +104,108 @@ class MeaningModel:
 
     def _hash_to_float(self, hex_string: str) -> float:
         """Converts a hexadecimal string to a float between 0 and 1."""
-        return int(hex_string, 16) / (16**len(hex_string))
+        divisor = _HEX_DIVISORS.get(len(hex_string))
+        if divisor is None:
+            return int(hex_string, 16) / (16**len(hex_string))
+        return int(hex_string, 16) / divisor
+
+    @staticmethod
+    def _to_vector(coords) -> tuple:
+        """
+        Adapts a coordinate dict (or a sequence already in AXES order) to a
+        fixed-order 4-float tuple for the scalar metrics.
+        """
+        if isinstance(coords, dict):
+            return (coords['love'], coords['justice'], coords['power'], coords['wisdom'])
+        return tuple(coords)
 
     def semantic_distance(self, coords1: dict, coords2: dict) -> float:
         """
         Calculates the Euclidean distance between two sets of 4D coordinates.
         """
-        return math.sqrt(
-            (coords1['love'] - coords2['love'])**2 +
-            (coords1['justice'] - coords2['justice'])**2 +
-            (coords1['power'] - coords2['power'])**2 +
-            (coords1['wisdom'] - coords2['wisdom'])**2
-        )
+        l1, j1, p1, w1 = self._to_vector(coords1)
+        l2, j2, p2, w2 = self._to_vector(coords2)
+        dl, dj, dp, dw = l1 - l2, j1 - j2, p1 - p2, w1 - w2
+        return math.sqrt(dl * dl + dj * dj + dp * dp + dw * dw)
 
     def divine_resonance(self, coords: dict) -> float:
         """
         Calculates the divine resonance of a set of coordinates.
         """
-        distance = self.semantic_distance(coords, self.anchor_point)
+        love, justice, power, wisdom = self._to_vector(coords)
+        a_love, a_justice, a_power, a_wisdom = self._anchor_vector
+        dl, dj, dp, dw = love - a_love, justice - a_justice, power - a_power, wisdom - a_wisdom
+        distance = math.sqrt(dl * dl + dj * dj + dp * dp + dw * dw)
         return max(0, 1 - (distance / 2.0))
 
     def distance_from_jehovah(self, coords: dict) -> float:
         """
         Calculates the Manhattan distance from the Anchor Point (1,1,1,1).
         """
-        return abs(coords['love'] - self.anchor_point['love']) + \
-               abs(coords['justice'] - self.anchor_point['justice']) + \
-               abs(coords['power'] - self.anchor_point['power']) + \
-               abs(coords['wisdom'] - self.anchor_point['wisdom'])
+        love, justice, power, wisdom = self._to_vector(coords)
+        a_love, a_justice, a_power, a_wisdom = self._anchor_vector
+        return abs(love - a_love) + abs(justice - a_justice) + abs(power - a_power) + abs(wisdom - a_wisdom)
 
     def biblical_balance(self, coords: dict) -> float:
         """
         Calculates the balance between the 4D coordinates.
         """
-        values = list(coords.values())
-        std_dev = np.std(values)
-        return max(0, 1 - (std_dev / 0.5))
+        love, justice, power, wisdom = self._to_vector(coords)
+        mean = (love + justice + power + wisdom) / 4
+        dl, dj, dp, dw = love - mean, justice - mean, power - mean, wisdom - mean
+        std_dev = math.sqrt((dl * dl + dj * dj + dp * dp + dw * dw) / 4)
+        return max(0.0, 1 - (std_dev / 0.5))
+
+    @staticmethod
+    def pack(coords_iter) -> np.ndarray:
+        """
+        Packs coordinate dicts into an (N, 4) float64 matrix with AXES columns.
+        """
+        return np.array([[coords[axis] for axis in AXES] for coords in coords_iter],
+                        dtype=np.float64).reshape(-1, 4)
+
+    def semantic_distance_batch(self, coords_matrix: np.ndarray, target: dict) -> np.ndarray:
+        """
+        semantic_distance from every row of a packed matrix to one set of coordinates.
+        """
+        diff = coords_matrix - np.array([target[axis] for axis in AXES], dtype=np.float64)
+        return np.sqrt((diff ** 2).sum(axis=1))
+
+    def divine_resonance_batch(self, coords_matrix: np.ndarray) -> np.ndarray:
+        """
+        divine_resonance for every row of a packed matrix.
+        """
+        diff = coords_matrix - np.array(self._anchor_vector, dtype=np.float64)
+        distance = np.sqrt(np.square(diff, out=diff).sum(axis=1))
+        return np.maximum(0.0, 1 - (distance / 2.0))
+
+    def distance_from_jehovah_batch(self, coords_matrix: np.ndarray) -> np.ndarray:
+        """
+        distance_from_jehovah (Manhattan) for every row of a packed matrix.
+        """
+        diff = coords_matrix - np.array(self._anchor_vector, dtype=np.float64)
+        return np.abs(diff, out=diff).sum(axis=1)
+
+    def biblical_balance_batch(self, coords_matrix: np.ndarray) -> np.ndarray:
+        """
+        biblical_balance for every row of a packed matrix.
+        """
+        std_dev = np.std(coords_matrix, axis=1)
+        return np.maximum(0.0, 1 - (std_dev / 0.5))
+
+    def concept_metrics_batch(self, coords_matrix: np.ndarray):
+        """
+        divine_resonance, distance_from_jehovah and biblical_balance for every
+        row of a packed matrix, computed together from one anchor difference.
+        """
+        anchor = np.array(self._anchor_vector, dtype=np.float64)
+        if NUMBA_AVAILABLE:
+            return _concept_metric_rows(np.ascontiguousarray(coords_matrix, dtype=np.float64), anchor)
+
+        diff = coords_matrix - anchor
+        resonance = np.maximum(0.0, 1 - (np.sqrt((diff ** 2).sum(axis=1)) / 2.0))
+        manhattan = np.abs(diff, out=diff).sum(axis=1)
+        return resonance, manhattan, self.biblical_balance_batch(coords_matrix)
 
     def truth_sense(self, text: str, context: str = "biblical") -> float:
         """
@@ -79,6 +213,15 @@ class MeaningModel:
         distance from the concept of 'divine truth'.
         """
         text_coords = self.calculate_coordinates(text, context)
-        truth_coords = self.calculate_coordinates("divine truth", "biblical")
-        distance = self.semantic_distance(text_coords, truth_coords)
+        distance = self.semantic_distance(text_coords, self._truth_coords())
         return max(0.0, 1.0 - distance)
+
+    def _truth_coords(self) -> tuple:
+        """
+        Coordinates of 'divine truth', computed once per semantic engine.
+        """
+        reference = self._truth_reference
+        if reference is None or reference[0] is not self.semantic_engine:
+            coords = self._to_vector(self.calculate_coordinates("divine truth", "biblical"))
+            reference = self._truth_reference = (self.semantic_engine, coords)
+        return reference[1]
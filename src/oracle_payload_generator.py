@@ -8,35 +8,93 @@ raw 4D coordinates into human-readable insights, warnings, and suggestions.
 
 from typing import Dict, List
 
+import numpy as np
+
+LOW_SCORE_THRESHOLD = 0.3
+GROWTH_LOVE_THRESHOLD = 0.5
+
+# Warning per axis, in report order. Bit i of a warning mask flags axis i.
+_WARNING_MESSAGES = (
+    ('love', "Low alignment with 'Love'. May lack compassion or customer-centricity."),
+    ('justice', "Potential 'Justice' deficit. Claims may be unsubstantiated or unfair."),
+    ('power', "Low 'Power' score. May indicate a lack of conviction, resources, or viability."),
+    ('wisdom', "Low 'Wisdom' score. The approach may be short-sighted or lack a clear plan."),
+)
+
+# Warning lists for all 16 masks, built once at import
+_WARNINGS_BY_MASK = tuple(
+    tuple(message for bit, (_, message) in enumerate(_WARNING_MESSAGES) if mask & (1 << bit))
+    for mask in range(1 << len(_WARNING_MESSAGES))
+)
+
+_GROWTH_BASE = "To improve balance, focus on strengthening the weaker coordinates. "
+_GROWTH_POWER_WITHOUT_LOVE = (
+    _GROWTH_BASE +
+    "Specifically, consider how to frame the concept in a more collaborative and customer-focused way."
+)
+
+_DISPLAY_NAMES = {'love': 'Love', 'justice': 'Justice', 'power': 'Power', 'wisdom': 'Wisdom'}
+
+# Column order of the matrix accepted by generate_oracle_payloads
+PAYLOAD_AXES = tuple(axis for axis, _ in _WARNING_MESSAGES)
+_AXIS_DISPLAY_NAMES = tuple(_DISPLAY_NAMES[axis] for axis in PAYLOAD_AXES)
+_INSIGHTS = tuple(f"This concept strongly projects '{name}'." for name in _AXIS_DISPLAY_NAMES)
+_POWER_COLUMN = PAYLOAD_AXES.index('power')
+
+def warning_mask(coords: Dict[str, float]) -> int:
+    """
+    Returns a bitmask of low-scoring axes (bit 0 love, 1 justice, 2 power, 3 wisdom).
+    """
+    return ((coords['love'] < LOW_SCORE_THRESHOLD) |
+            (coords['justice'] < LOW_SCORE_THRESHOLD) << 1 |
+            (coords['power'] < LOW_SCORE_THRESHOLD) << 2 |
+            (coords['wisdom'] < LOW_SCORE_THRESHOLD) << 3)
+
 def generate_oracle_payload(coords: Dict[str, float]) -> Dict[str, any]:
     """
     Generates the "oracle" payload based on a set of 4D coordinates.
     """
-    insights = []
-    warnings = []
+    values = (coords['love'], coords['justice'], coords['power'], coords['wisdom'])
 
-    # Analyze the dominant attribute
-    dominant_attribute = max(coords, key=coords.get)
-    insights.append(f"This concept strongly projects '{dominant_attribute.capitalize()}'.")
+    # Analyze the dominant attribute (ties go to the first axis, as in generate_oracle_payloads)
+    dominant = values.index(max(values))
+    insights = [_INSIGHTS[dominant]]
 
     # Generate warnings based on low scores
-    if coords['love'] < 0.3:
-        warnings.append("Low alignment with 'Love'. May lack compassion or customer-centricity.")
-    if coords['justice'] < 0.3:
-        warnings.append("Potential 'Justice' deficit. Claims may be unsubstantiated or unfair.")
-    if coords['power'] < 0.3:
-        warnings.append("Low 'Power' score. May indicate a lack of conviction, resources, or viability.")
-    if coords['wisdom'] < 0.3:
-        warnings.append("Low 'Wisdom' score. The approach may be short-sighted or lack a clear plan.")
+    warnings = list(_WARNINGS_BY_MASK[warning_mask(coords)])
 
     # Generate growth suggestion
-    growth_suggestion = "To improve balance, focus on strengthening the weaker coordinates. "
-    if dominant_attribute == 'power' and coords['love'] < 0.5:
-        growth_suggestion += "Specifically, consider how to frame the concept in a more collaborative and customer-focused way."
+    if dominant == _POWER_COLUMN and values[0] < GROWTH_LOVE_THRESHOLD:
+        growth_suggestion = _GROWTH_POWER_WITHOUT_LOVE
+    else:
+        growth_suggestion = _GROWTH_BASE
 
     return {
-        "dominant_attribute": dominant_attribute.capitalize(),
+        "dominant_attribute": _AXIS_DISPLAY_NAMES[dominant],
         "insights": insights,
         "warnings": warnings,
         "growth_suggestion": growth_suggestion
     }
+
+def generate_oracle_payloads(coords: np.ndarray) -> Dict[str, list]:
+    """
+    Generates oracle payloads for many concepts at once, column by column.
+
+    Rows of coords are (love, justice, power, wisdom). Returns one list per
+    payload key, each aligned with the input rows, matching what
+    generate_oracle_payload would return row by row.
+    """
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, len(PAYLOAD_AXES))
+    # argmax takes the first maximum, the same tie-break as max() over the dict
+    dominant = coords.argmax(axis=1)
+    masks = (coords < LOW_SCORE_THRESHOLD) @ (1 << np.arange(len(PAYLOAD_AXES)))
+    power_without_love = (dominant == _POWER_COLUMN) & (coords[:, 0] < GROWTH_LOVE_THRESHOLD)
+
+    dominant = dominant.tolist()
+    return {
+        "dominant_attribute": [_AXIS_DISPLAY_NAMES[i] for i in dominant],
+        "insights": [[_INSIGHTS[i]] for i in dominant],
+        "warnings": [list(_WARNINGS_BY_MASK[mask]) for mask in masks.tolist()],
+        "growth_suggestion": [_GROWTH_POWER_WITHOUT_LOVE if flag else _GROWTH_BASE
+                              for flag in power_without_love.tolist()]
+    }
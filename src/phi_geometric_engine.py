@@ -20,6 +20,11 @@ import numpy as np
 from typing import List, Tuple, Dict, Any, Optional
 from dataclasses import dataclass
 
+try:
+    from .compat import DATACLASS_SLOTS
+except ImportError:
+    from compat import DATACLASS_SLOTS
+
 # Golden ratio constant (to maximum precision)
 PHI = 1.618033988749895  # (1 + √5) / 2
 PHI_INVERSE = 0.618033988749895  # 1 / φ = φ - 1
@@ -27,9 +32,9 @@ GOLDEN_ANGLE_RAD = 2.39996322972865332  # (2 - φ) × 2π radians
 GOLDEN_ANGLE_DEG = 137.5077640500378  # (2 - φ) × 360 degrees
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class PhiCoordinate:
-    """4D coordinate with phi-geometric properties"""
+    """4D coordinate with phi-geometric properties (immutable, so anchors can be shared)"""
     love: float
     power: float
     wisdom: float
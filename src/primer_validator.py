@@ -12,21 +12,87 @@ It ensures that:
 """
 
 import math
+import sys
 from typing import Dict, Any, List, Tuple, Optional
+import numpy as np
 from semantic_substrate_database import SemanticSubstrateDatabase, BiblicalCoordinates
+from jit_support import njit, prange, NUMBA_AVAILABLE
+
+# Concepts fetched and scored per batch by validate_database
+VALIDATION_BATCH_SIZE = 1024
+
+
+@njit(cache=True, parallel=True)
+def _score_principles_1_3(coords, stored_distance):
+    """Fused Principle 1-3 scoring kernel; compiled by Numba when it is installed"""
+    n = coords.shape[0]
+    score1 = np.empty(n)
+    score2 = np.empty(n)
+    score3 = np.empty(n)
+    for i in prange(n):
+        a = coords[i, 0]
+        b = coords[i, 1]
+        c = coords[i, 2]
+        d = coords[i, 3]
+
+        da = 1.0 - a
+        db = 1.0 - b
+        dc = 1.0 - c
+        dd = 1.0 - d
+        expected_distance = math.sqrt(da * da + db * db + dc * dc + dd * dd)
+        score1[i] = 1.0 - min(1.0, abs(stored_distance[i] - expected_distance))
+
+        mean = (a + b + c + d) / 4
+        va = a - mean
+        vb = b - mean
+        vc = c - mean
+        vd = d - mean
+        std_dev = math.sqrt((va * va + vb * vb + vc * vc + vd * vd) / 4)
+        score2[i] = max(0.0, 1.0 - (std_dev * 2))
+
+        high = int(a > 0.9) + int(b > 0.9) + int(c > 0.9) + int(d > 0.9)
+        low = int(a < 0.1) + int(b < 0.1) + int(c < 0.1) + int(d < 0.1)
+        extreme_count = high + low
+        if high == 4 or low == 4 or extreme_count == 0:
+            score3[i] = 1.0
+        else:
+            score3[i] = max(0.0, 1.0 - (extreme_count * 0.25))
+    return score1, score2, score3
 
 
 class PrimerValidator:
     """Validates database operations against primer principles"""
 
+    # Expected resonance ranges by context (Principle 7)
+    CONTEXT_RESONANCE_TARGETS = {
+        'biblical': (0.8, 1.0),
+        'ministry': (0.75, 0.95),
+        'educational': (0.7, 0.9),
+        'business': (0.6, 0.85),
+        'personal': (0.65, 0.9)
+    }
+    DEFAULT_RESONANCE_TARGET = (0.5, 0.9)
+
+    # Principle 4 score while the substrate schema stores no concept relationships
+    UNVERIFIED_RELATIONSHIP_SCORE = 0.5
+
     def __init__(self, db: SemanticSubstrateDatabase):
         self.db = db
         self.cursor = db.conn.cursor()
 
         # Load universal principles from database
         self.principles = self._load_principles()
+        # Principle names indexed by number (index 0 unused) for the report loops
+        self._principle_names = tuple(
+            self.principles.get(num, {}).get('name', 'Unknown') for num in range(8)
+        )
         self.anchor_point_a = BiblicalCoordinates(1.0, 1.0, 1.0, 1.0)
 
+        # Principle 7 ranges as lookup arrays indexed by context; the last slot is the default
+        self._target_index = {context: i for i, context in enumerate(self.CONTEXT_RESONANCE_TARGETS)}
+        ranges = list(self.CONTEXT_RESONANCE_TARGETS.values()) + [self.DEFAULT_RESONANCE_TARGET]
+        self._target_lo, self._target_hi = np.array(ranges, dtype=np.float64).T
+
     def _load_principles(self) -> Dict[int, Dict[str, str]]:
         """Load universal principles from database"""
         self.cursor.execute("""
@@ -65,7 +131,7 @@ class PrimerValidator:
         concept = {
             'text': row[0],
             'context': row[1],
-            'coordinates': BiblicalCoordinates(row[2], row[3], row[4], row[5]),
+            'coord_tuple': (row[2], row[3], row[4], row[5]),  # (love, power, wisdom, justice)
             'divine_resonance': row[6],
             'distance_from_anchor': row[7]
         }
@@ -99,29 +165,106 @@ class PrimerValidator:
             validation['warnings'].append("Low principle alignment - review concept definition")
 
         # Add recommendations based on weak areas
+        names = self._principle_names
         for principle_num, compliance in validation['principle_compliance'].items():
             if compliance['score'] < 0.7:
                 validation['recommendations'].append(
-                    f"Improve alignment with Principle {principle_num}: {self.principles[principle_num]['name']}"
+                    f"Improve alignment with Principle {principle_num}: {names[principle_num]}"
                 )
 
         return validation
 
+    def _iter_concept_columns(self):
+        """Stream stored concepts as per-field column batches of at most VALIDATION_BATCH_SIZE rows"""
+        cursor = self.db.conn.execute("""
+            SELECT id, concept_text, context, love, power, wisdom, justice,
+                   divine_resonance, distance_from_jehovah, created_at, updated_at
+            FROM semantic_coordinates
+        """)
+        while True:
+            rows = cursor.fetchmany(VALIDATION_BATCH_SIZE)
+            if not rows:
+                return
+            yield self._columns_from_rows(rows)
+
+    @staticmethod
+    def _columns_from_rows(rows: List[tuple]) -> Dict[str, Any]:
+        ids, texts, contexts, love, power, wisdom, justice, resonance, distance, created, updated = zip(*rows)
+        return {
+            'ids': list(ids),
+            'texts': list(texts),
+            'contexts': list(contexts),
+            'coords': np.column_stack([np.array(axis, dtype=np.float64) for axis in (love, power, wisdom, justice)]),
+            'resonance': np.array(resonance, dtype=np.float64),
+            'distance': np.array(distance, dtype=np.float64),
+            'evolved': np.array([c != u for c, u in zip(created, updated)], dtype=bool)
+        }
+
+    def _semantic_unit_ids(self) -> set:
+        """Ids of concepts that have at least one semantic unit"""
+        self.cursor.execute("SELECT DISTINCT coordinate_id FROM semantic_units")
+        return {row[0] for row in self.cursor.fetchall()}
+
+    def _principle_scores_bulk(self, columns: Dict[str, Any], unit_ids: set) -> Dict[int, np.ndarray]:
+        """
+        Scores for all seven principles across a batch of concepts at once
+
+        Mirrors the per-concept _validate_principle_* checks.
+        """
+        coords = columns['coords']
+        contexts = columns['contexts']
+        n = len(contexts)
+        scores = {}
+
+        if NUMBA_AVAILABLE:
+            scores[1], scores[2], scores[3] = _score_principles_1_3(coords, columns['distance'])
+        else:
+            # Principle 1: stored distance agrees with the distance from Anchor A
+            anchor_diff = 1.0 - coords
+            expected_distance = np.sqrt(np.square(anchor_diff, out=anchor_diff).sum(axis=1))
+            scores[1] = 1.0 - np.minimum(1.0, np.abs(columns['distance'] - expected_distance))
+
+            # Principle 2: coherence across the four axes
+            scores[2] = np.maximum(0.0, 1.0 - (coords.std(axis=1) * 2))
+
+            # Principle 3: no extreme axes unless all of them are
+            high, low = coords > 0.9, coords < 0.1
+            extreme_count = (high | low).sum(axis=1)
+            balanced = high.all(axis=1) | low.all(axis=1) | (extreme_count == 0)
+            scores[3] = np.where(balanced, 1.0, np.maximum(0.0, 1.0 - (extreme_count * 0.25)))
+
+        # Principle 4: relationships cannot be verified yet (see _validate_principle_4)
+        scores[4] = np.full(n, self.UNVERIFIED_RELATIONSHIP_SCORE)
+
+        # Principle 5: context plus semantic unit
+        has_context = np.fromiter((bool(c) for c in contexts), dtype=bool, count=n)
+        specific = np.fromiter((len(c) > 3 for c in contexts), dtype=bool, count=n)
+        has_unit = np.fromiter((i in unit_ids for i in columns['ids']), dtype=bool, count=n)
+        scores[5] = np.where(has_context, 0.4, 0.0) + np.where(specific, 0.3, 0.0) + np.where(has_unit, 0.3, 0.0)
+
+        # Principle 6: concepts updated since creation have evolved
+        scores[6] = np.where(columns['evolved'], 1.0, 0.7)
+
+        # Principle 7: resonance inside the context's target range
+        default = len(self._target_index)
+        idx = np.fromiter((self._target_index.get(c, default) for c in contexts), dtype=np.intp, count=n)
+        resonance = columns['resonance']
+        outside = np.maximum(np.maximum(self._target_lo[idx] - resonance, resonance - self._target_hi[idx]), 0.0)
+        scores[7] = np.maximum(0.0, 1.0 - outside)
+
+        return scores
+
     def _validate_principle_1(self, concept: Dict[str, Any]) -> Dict[str, Any]:
         """Validate Universal Anchor Point Principle"""
         # Principle 1: Systems are stabilized by invariant reference points
         # Check: Concept should have measurable distance from Anchor Point A
 
-        coords = concept['coordinates']
+        love, power, wisdom, justice = concept['coord_tuple']
         distance = concept['distance_from_anchor']
 
         # Calculate expected distance
-        expected_distance = math.sqrt(
-            (1.0 - coords.love) ** 2 +
-            (1.0 - coords.power) ** 2 +
-            (1.0 - coords.wisdom) ** 2 +
-            (1.0 - coords.justice) ** 2
-        )
+        dl, dp, dw, dj = 1.0 - love, 1.0 - power, 1.0 - wisdom, 1.0 - justice
+        expected_distance = math.sqrt(dl * dl + dp * dp + dw * dw + dj * dj)
 
         # Check consistency
         distance_error = abs(distance - expected_distance)
@@ -138,12 +281,11 @@ class PrimerValidator:
         # Principle 2: Complex systems arise from precisely linked components
         # Check: All four axes should be coherently aligned (no extreme imbalances)
 
-        coords = concept['coordinates']
-        values = [coords.love, coords.power, coords.wisdom, coords.justice]
+        values = concept['coord_tuple']
 
         # Calculate variance (measure of imbalance)
         mean = sum(values) / len(values)
-        variance = sum((x - mean) ** 2 for x in values) / len(values)
+        variance = sum((x - mean) * (x - mean) for x in values) / len(values)
         std_dev = math.sqrt(variance)
 
         # Lower standard deviation = better coherence
@@ -160,8 +302,7 @@ class PrimerValidator:
         # Principle 3: Stable systems maintain integrity through balanced forces
         # Check: No axis should be at extremes (0 or 1) unless all are
 
-        coords = concept['coordinates']
-        values = [coords.love, coords.power, coords.wisdom, coords.justice]
+        values = concept['coord_tuple']
 
         # Check for extreme values
         extreme_count = sum(1 for v in values if v < 0.1 or v > 0.9)
@@ -184,23 +325,10 @@ class PrimerValidator:
         """Validate Sovereignty and Relational Interdependence"""
         # Principle 4: Entities achieve highest expression through conscious relationships
         # Check: Concept should have relationships with other concepts
-
-        concept_id = self.db.query_by_text(concept['text'], concept['context'])
-        if concept_id:
-            relationships = self.db.get_concept_relationships(concept_id['id'])
-            relationship_count = len(relationships)
-
-            # Score based on relationship richness
-            score = min(1.0, relationship_count / 5.0)
-
-            return {
-                'score': score,
-                'compliant': relationship_count > 0,
-                'message': f"Relationships: {relationship_count}"
-            }
+        # The substrate schema has no relationship store, so this cannot be verified yet
 
         return {
-            'score': 0.5,
+            'score': self.UNVERIFIED_RELATIONSHIP_SCORE,
             'compliant': False,
             'message': "Cannot verify relationships"
         }
@@ -270,16 +398,7 @@ class PrimerValidator:
         resonance = concept['divine_resonance']
         context = concept['context']
 
-        # Expected resonance ranges by context
-        context_resonance_targets = {
-            'biblical': (0.8, 1.0),
-            'ministry': (0.75, 0.95),
-            'educational': (0.7, 0.9),
-            'business': (0.6, 0.85),
-            'personal': (0.65, 0.9)
-        }
-
-        target = context_resonance_targets.get(context, (0.5, 0.9))
+        target = self.CONTEXT_RESONANCE_TARGETS.get(context, self.DEFAULT_RESONANCE_TARGET)
         in_range = target[0] <= resonance <= target[1]
 
         if in_range:
@@ -304,38 +423,36 @@ class PrimerValidator:
 
         Returns comprehensive validation report
         """
-        print(f"\n{'='*70}")
-        print("DATABASE-WIDE PRIMER VALIDATION")
-        print(f"{'='*70}\n")
+        self.cursor.execute("SELECT COUNT(*) FROM semantic_coordinates")
+        total_concepts = self.cursor.fetchone()[0]
 
-        # Get all concepts
-        self.cursor.execute("SELECT id, concept_text FROM semantic_coordinates")
-        concepts = self.cursor.fetchall()
+        # Lookups shared by every batch
+        unit_ids = self._semantic_unit_ids()
 
-        total_concepts = len(concepts)
+        # Stream concepts in batches, scoring each batch column-wise
         valid_concepts = 0
         total_alignment = 0.0
-        principle_scores = {i: [] for i in range(1, 8)}
-
-        print(f"Validating {total_concepts} concepts...\n")
-
-        for concept_id, concept_text in concepts:
-            validation = self.validate_concept(concept_id)
-
-            if validation['valid']:
-                valid_concepts += 1
-
-            total_alignment += validation['alignment_score']
-
-            # Collect principle scores
-            for principle_num, compliance in validation['principle_compliance'].items():
-                principle_scores[principle_num].append(compliance['score'])
+        principle_totals = {num: 0.0 for num in range(1, 8)}
+        for columns in self._iter_concept_columns():
+            scores = self._principle_scores_bulk(columns, unit_ids)
+
+            # Per-concept alignment is the mean of the seven principle scores
+            alignment = scores[1].copy()
+            for principle_num in range(2, 8):
+                alignment += scores[principle_num]
+            alignment /= 7
+            valid_concepts += int((alignment >= 0.6).sum())
+
+            # Running sums, added in row order
+            total_alignment = sum(alignment.tolist(), total_alignment)
+            for num in range(1, 8):
+                principle_totals[num] = sum(scores[num].tolist(), principle_totals[num])
 
         # Calculate averages
         avg_alignment = total_alignment / total_concepts if total_concepts > 0 else 0
         avg_principle_scores = {
-            num: sum(scores) / len(scores) if scores else 0
-            for num, scores in principle_scores.items()
+            num: total / total_concepts if total_concepts > 0 else 0
+            for num, total in principle_totals.items()
         }
 
         report = {
@@ -347,23 +464,32 @@ class PrimerValidator:
             'database_compliant': avg_alignment >= 0.7
         }
 
-        # Print report
-        print(f"{'='*70}")
-        print("VALIDATION REPORT")
-        print(f"{'='*70}\n")
-        print(f"Total Concepts: {report['total_concepts']}")
-        print(f"Valid Concepts: {report['valid_concepts']} ({report['validity_rate']*100:.1f}%)")
-        print(f"Average Alignment Score: {report['average_alignment']:.3f}")
-        print(f"\nPrinciple Compliance Scores:")
-
+        # Print header and report as one write
+        lines = [
+            f"\n{'='*70}",
+            "DATABASE-WIDE PRIMER VALIDATION",
+            f"{'='*70}\n",
+            f"Validating {total_concepts} concepts...\n",
+            f"{'='*70}",
+            "VALIDATION REPORT",
+            f"{'='*70}\n",
+            f"Total Concepts: {report['total_concepts']}",
+            f"Valid Concepts: {report['valid_concepts']} ({report['validity_rate']*100:.1f}%)",
+            f"Average Alignment Score: {report['average_alignment']:.3f}",
+            f"\nPrinciple Compliance Scores:"
+        ]
+
+        names = self._principle_names
         for principle_num in range(1, 8):
             score = avg_principle_scores[principle_num]
             status = "[OK]" if score >= 0.7 else "[!]" if score >= 0.5 else "[X]"
-            principle_name = self.principles.get(principle_num, {}).get('name', 'Unknown')
-            print(f"  {status} Principle {principle_num}: {score:.3f} - {principle_name}")
+            principle_name = names[principle_num]
+            lines.append(f"  {status} Principle {principle_num}: {score:.3f} - {principle_name}")
 
-        print(f"\nDatabase Compliance: {'[OK] COMPLIANT' if report['database_compliant'] else '[X] NON-COMPLIANT'}")
-        print(f"{'='*70}\n")
+        lines.append(f"\nDatabase Compliance: {'[OK] COMPLIANT' if report['database_compliant'] else '[X] NON-COMPLIANT'}")
+        lines.append(f"{'='*70}\n")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
         return report
 
@@ -381,7 +507,7 @@ class PrimerValidator:
         # Check each principle
         for principle_num, score in report['principle_scores'].items():
             if score < 0.7:
-                principle_name = self.principles[principle_num]['name']
+                principle_name = self._principle_names[principle_num]
                 recommendations.append(
                     f"Improve Principle {principle_num} ({principle_name}): Current score {score:.2f}"
                 )
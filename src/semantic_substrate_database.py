@@ -9,25 +9,60 @@ refactored to remove all dependencies on the old, flawed engine.
 import sqlite3
 import json
 import math
+import os
+import re
+import numpy as np
 from typing import Dict, List, Tuple, Optional, Any, Union
 from datetime import datetime
 try:
     from .meaning_model import MeaningModel
     from .logger_config import get_logger
-    from .oracle_payload_generator import generate_oracle_payload
+    from .oracle_payload_generator import generate_oracle_payload, generate_oracle_payloads, PAYLOAD_AXES
+    from .vector_index import CoordinateIndex
 except ImportError:
     from meaning_model import MeaningModel
     from logger_config import get_logger
-    from oracle_payload_generator import generate_oracle_payload
+    from oracle_payload_generator import generate_oracle_payload, generate_oracle_payloads, PAYLOAD_AXES
+    from vector_index import CoordinateIndex
 
 # Initialize logger
 logger = get_logger(__name__)
 
+_WORD_RE = re.compile(r"\w+")
+
+# With text_prefilter, this many full-text candidates per requested result are ranked by distance
+TEXT_PREFILTER_FACTOR = 10
+
+# Page cache (KiB) and memory-mapped I/O window (bytes) for each connection
+SQLITE_CACHE_KIB = 65536
+SQLITE_MMAP_BYTES = 256 * 1024 * 1024
+
+# Columns of a MeaningModel.pack matrix in the coordinate index's (love, power, wisdom, justice) order
+_INDEX_COLUMNS = [0, 2, 3, 1]
+
+_UPSERT_CONCEPT_SQL = """
+    INSERT INTO semantic_coordinates
+    (concept_text, context, love, power, wisdom, justice,
+     divine_resonance, distance_from_jehovah, biblical_balance)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(concept_text, context) DO UPDATE SET
+        love=excluded.love,
+        power=excluded.power,
+        wisdom=excluded.wisdom,
+        justice=excluded.justice,
+        divine_resonance=excluded.divine_resonance,
+        distance_from_jehovah=excluded.distance_from_jehovah,
+        biblical_balance=excluded.biblical_balance,
+        updated_at=CURRENT_TIMESTAMP
+"""
+
 class BiblicalCoordinates:
     """
     A simple data class to hold the 4D coordinates.
     This is to maintain compatibility with the original structure.
     """
+    __slots__ = ('love', 'power', 'wisdom', 'justice')
+
     def __init__(self, love, power, wisdom, justice):
         self.love = love
         self.power = power
@@ -45,7 +80,23 @@ class SemanticSubstrateDatabase:
     def __init__(self, db_path: str = "semantic_substrate.db", meaning_model: Optional[MeaningModel] = None):
         self.db_path = db_path
         self.conn = None
-        self.meaning_model = meaning_model if meaning_model else MeaningModel()
+        self.meaning_model = meaning_model if meaning_model else MeaningModel.create_default()
+        # Nearest-neighbour index over stored coordinates, loaded on first proximity query
+        self._coordinate_index: Optional[CoordinateIndex] = None
+        # PRAGMA data_version when the index was loaded; it moves when another connection commits
+        self._index_data_version: Optional[int] = None
+        # Bumped on every coordinate write so result caches can detect stale entries
+        self._write_generation = 0
+        # Opt-in memory-mapped snapshot of the coordinate index next to the database file
+        self._use_coords_snapshot = (
+            os.getenv("SSDB_COORDS_SNAPSHOT", "").strip().lower() in {"1", "true", "yes", "on"}
+            and db_path != ":memory:"
+        )
+        # Opt-in R*Tree over the stored coordinates for radius queries before the index is loaded;
+        # it costs an extra index insert per write
+        self._use_rtree_index = os.getenv("SSDB_RTREE_INDEX", "").strip().lower() in {"1", "true", "yes", "on"}
+        # Write generation the index matched a saved snapshot at; None if it did not
+        self._snapshot_generation: Optional[int] = None
         self._initialize_database()
 
         logger.info(f"Semantic database initialized at {db_path}")
@@ -56,6 +107,15 @@ class SemanticSubstrateDatabase:
         self.conn = sqlite3.connect(self.db_path)
         self.conn.row_factory = sqlite3.Row
         cursor = self.conn.cursor()
+        # WAL lets readers proceed during writes and, with synchronous=NORMAL,
+        # avoids an fsync per committed transaction
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        # Keep sorter and temp b-trees (e.g. for IN-list lookups) off disk
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        # Larger page cache and mmap reads for full-table scans (overview, validation)
+        cursor.execute(f"PRAGMA cache_size=-{int(SQLITE_CACHE_KIB)}")
+        cursor.execute(f"PRAGMA mmap_size={int(SQLITE_MMAP_BYTES)}")
 
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS semantic_coordinates (
@@ -75,12 +135,109 @@ class SemanticSubstrateDatabase:
             )
         """)
 
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_concept_text ON semantic_coordinates(concept_text)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_context ON semantic_coordinates(context)")
+        # Covering index (id is the implicit rowid): loading the coordinate index
+        # and per-context lookups never touch the wide rows. It subsumes the old
+        # context index, and UNIQUE(concept_text, context) serves text lookups.
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_context_coords "
+            "ON semantic_coordinates(context, love, power, wisdom, justice)"
+        )
+        cursor.execute("DROP INDEX IF EXISTS idx_context")
+        cursor.execute("DROP INDEX IF EXISTS idx_concept_text")
+        self._fts_available = self._initialize_text_index(cursor)
+        self._rtree_available = self._use_rtree_index and self._initialize_rtree_index(cursor)
 
         self.conn.commit()
         logger.info("Database schema initialized successfully")
 
+    @staticmethod
+    def _initialize_text_index(cursor: sqlite3.Cursor) -> bool:
+        """
+        Trigram FTS5 index over concept_text, kept in sync by triggers.
+
+        Returns False when the SQLite build lacks FTS5 or the trigram
+        tokenizer (SQLite < 3.34); text prefiltering is then skipped.
+        """
+        exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'semantic_coordinates_fts'"
+        ).fetchone()
+        try:
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS semantic_coordinates_fts USING fts5(
+                    concept_text, content='semantic_coordinates', content_rowid='id', tokenize='trigram'
+                )
+            """)
+        except sqlite3.OperationalError as exc:
+            logger.warning(f"Full-text index unavailable: {exc}")
+            return False
+        cursor.executescript("""
+            CREATE TRIGGER IF NOT EXISTS semantic_coordinates_fts_ai AFTER INSERT ON semantic_coordinates BEGIN
+                INSERT INTO semantic_coordinates_fts(rowid, concept_text) VALUES (new.id, new.concept_text);
+            END;
+            CREATE TRIGGER IF NOT EXISTS semantic_coordinates_fts_ad AFTER DELETE ON semantic_coordinates BEGIN
+                INSERT INTO semantic_coordinates_fts(semantic_coordinates_fts, rowid, concept_text)
+                VALUES ('delete', old.id, old.concept_text);
+            END;
+            CREATE TRIGGER IF NOT EXISTS semantic_coordinates_fts_au AFTER UPDATE OF concept_text ON semantic_coordinates BEGIN
+                INSERT INTO semantic_coordinates_fts(semantic_coordinates_fts, rowid, concept_text)
+                VALUES ('delete', old.id, old.concept_text);
+                INSERT INTO semantic_coordinates_fts(rowid, concept_text) VALUES (new.id, new.concept_text);
+            END;
+        """)
+        if not exists:
+            # Databases created before the index existed need their rows indexed once
+            cursor.execute("INSERT INTO semantic_coordinates_fts(semantic_coordinates_fts) VALUES ('rebuild')")
+        return True
+
+    @staticmethod
+    def _initialize_rtree_index(cursor: sqlite3.Cursor) -> bool:
+        """
+        4D R*Tree over (love, power, wisdom, justice), one point box per concept,
+        kept in sync by triggers.
+
+        Returns False when the SQLite build lacks the R*Tree module; radius
+        queries then always go through the in-memory coordinate index.
+        """
+        exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'semantic_coordinates_rtree'"
+        ).fetchone()
+        try:
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS semantic_coordinates_rtree USING rtree(
+                    id, love_min, love_max, power_min, power_max,
+                    wisdom_min, wisdom_max, justice_min, justice_max
+                )
+            """)
+        except sqlite3.OperationalError as exc:
+            logger.warning(f"R*Tree index unavailable: {exc}")
+            return False
+        cursor.executescript("""
+            CREATE TRIGGER IF NOT EXISTS semantic_coordinates_rtree_ai AFTER INSERT ON semantic_coordinates BEGIN
+                INSERT INTO semantic_coordinates_rtree
+                VALUES (new.id, new.love, new.love, new.power, new.power,
+                        new.wisdom, new.wisdom, new.justice, new.justice);
+            END;
+            CREATE TRIGGER IF NOT EXISTS semantic_coordinates_rtree_ad AFTER DELETE ON semantic_coordinates BEGIN
+                DELETE FROM semantic_coordinates_rtree WHERE id = old.id;
+            END;
+            CREATE TRIGGER IF NOT EXISTS semantic_coordinates_rtree_au
+            AFTER UPDATE OF love, power, wisdom, justice ON semantic_coordinates BEGIN
+                UPDATE semantic_coordinates_rtree
+                SET love_min = new.love, love_max = new.love, power_min = new.power, power_max = new.power,
+                    wisdom_min = new.wisdom, wisdom_max = new.wisdom,
+                    justice_min = new.justice, justice_max = new.justice
+                WHERE id = new.id;
+            END;
+        """)
+        if not exists:
+            # Databases created before the index existed are bulk-loaded once
+            cursor.execute("""
+                INSERT INTO semantic_coordinates_rtree
+                SELECT id, love, love, power, power, wisdom, wisdom, justice, justice
+                FROM semantic_coordinates
+            """)
+        return True
+
     def store_concept(self, text: str, context: str = "biblical") -> int:
         """
         Store a concept with its semantic coordinates, calculated by the MeaningModel.
@@ -88,6 +245,14 @@ class SemanticSubstrateDatabase:
         coords = self.meaning_model.calculate_coordinates(text, context)
         return self._store_concept_with_coordinates(text, context, coords)
 
+    def store_many(self, texts: List[str], context: str = "biblical") -> List[int]:
+        """
+        Store many concepts in a single transaction. Returns ids aligned with texts.
+        """
+        unique_texts = list(dict.fromkeys(texts))
+        coords_by_text = dict(zip(unique_texts, self.meaning_model.calculate_coordinates_batch(unique_texts, context)))
+        return self._store_concepts_with_coordinates(texts, context, [coords_by_text[text] for text in texts])
+
     def _store_concept_with_coordinates(
         self,
         text: str,
@@ -98,27 +263,7 @@ class SemanticSubstrateDatabase:
         Stores a concept with the given coordinates.
         """
         cursor = self.conn.cursor()
-
-        divine_resonance = self.meaning_model.divine_resonance(coords)
-        distance_from_jehovah = self.meaning_model.distance_from_jehovah(coords)
-        biblical_balance = self.meaning_model.biblical_balance(coords)
-
-        cursor.execute("""
-            INSERT INTO semantic_coordinates
-            (concept_text, context, love, power, wisdom, justice,
-             divine_resonance, distance_from_jehovah, biblical_balance)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(concept_text, context) DO UPDATE SET
-                love=excluded.love,
-                power=excluded.power,
-                wisdom=excluded.wisdom,
-                justice=excluded.justice,
-                divine_resonance=excluded.divine_resonance,
-                distance_from_jehovah=excluded.distance_from_jehovah,
-                biblical_balance=excluded.biblical_balance,
-                updated_at=CURRENT_TIMESTAMP
-        """, (text, context, coords['love'], coords['power'], coords['wisdom'], coords['justice'],
-              divine_resonance, distance_from_jehovah, biblical_balance))
+        cursor.execute(_UPSERT_CONCEPT_SQL, self._concept_row(text, context, coords))
 
         cursor.execute("SELECT id FROM semantic_coordinates WHERE concept_text = ? AND context = ?", (text, context))
         row = cursor.fetchone()
@@ -127,9 +272,96 @@ class SemanticSubstrateDatabase:
         concept_id = row[0]
 
         self.conn.commit()
+        self._write_generation += 1
+
+        if self._coordinate_index is not None:
+            self._coordinate_index.add(
+                concept_id, context,
+                (coords['love'], coords['power'], coords['wisdom'], coords['justice'])
+            )
 
         return concept_id
 
+    def _concept_row(self, text: str, context: str, coords: Dict[str, float]) -> tuple:
+        """Parameters for _UPSERT_CONCEPT_SQL, including the derived metrics."""
+        return (text, context, coords['love'], coords['power'], coords['wisdom'], coords['justice'],
+                self.meaning_model.divine_resonance(coords),
+                self.meaning_model.distance_from_jehovah(coords),
+                self.meaning_model.biblical_balance(coords))
+
+    def _concept_rows(self, texts: List[str], context: str, coords_list: List[Dict[str, float]],
+                      matrix: Optional[np.ndarray] = None) -> List[tuple]:
+        """
+        _concept_row for many concepts, with the derived metrics computed column-wise.
+        matrix is coords_list already packed by MeaningModel.pack, if the caller has it.
+        """
+        model = self.meaning_model
+        if matrix is None:
+            matrix = model.pack(coords_list)
+        metrics = zip(*(column.tolist() for column in model.concept_metrics_batch(matrix)))
+        return [(text, context, coords['love'], coords['power'], coords['wisdom'], coords['justice'], *metric)
+                for text, coords, metric in zip(texts, coords_list, metrics)]
+
+    def _store_concepts_with_coordinates(
+        self,
+        texts: List[str],
+        context: str,
+        coords_list: List[Dict[str, float]]
+    ) -> List[int]:
+        """
+        Stores many concepts in one transaction. Returns ids aligned with texts.
+
+        A text repeated in the batch is stored once, with its last coordinates.
+        """
+        return self._store_concept_groups([(texts, context, coords_list)])[0]
+
+    def _store_concept_groups(
+        self,
+        groups: List[Tuple[List[str], str, List[Dict[str, float]]]]
+    ) -> List[List[int]]:
+        """
+        Stores several (texts, context, coords_list) groups in a single
+        transaction. Returns one id list per group, aligned with its texts.
+        """
+        pending = []
+        with self.conn:
+            cursor = self.conn.cursor()
+            for texts, context, coords_list in groups:
+                latest = dict(zip(texts, coords_list))
+                unique_texts = list(latest)
+                if not unique_texts:
+                    pending.append((texts, context, latest, {}, None))
+                    continue
+                # One packed (N, 4) matrix feeds both the metric columns and the coordinate index
+                coords_list = list(latest.values())
+                matrix = self.meaning_model.pack(coords_list)
+                cursor.executemany(_UPSERT_CONCEPT_SQL,
+                                   self._concept_rows(unique_texts, context, coords_list, matrix))
+                ids_by_text = {}
+                # Stay under SQLite's bound-parameter limit
+                for start in range(0, len(unique_texts), 900):
+                    chunk = unique_texts[start:start + 900]
+                    cursor.execute(
+                        f"SELECT id, concept_text FROM semantic_coordinates "
+                        f"WHERE context = ? AND concept_text IN ({','.join('?' * len(chunk))})",
+                        [context, *chunk]
+                    )
+                    ids_by_text.update((row[1], row[0]) for row in cursor.fetchall())
+                pending.append((texts, context, latest, ids_by_text, matrix))
+        if any(latest for _, _, latest, _, _ in pending):
+            self._write_generation += 1
+
+        if self._coordinate_index is not None:
+            for _, context, latest, ids_by_text, matrix in pending:
+                if latest:
+                    self._coordinate_index.add_many(
+                        [ids_by_text[text] for text in latest],
+                        [context] * len(latest),
+                        matrix[:, _INDEX_COLUMNS]
+                    )
+
+        return [[ids_by_text[text] for text in texts] for texts, _, _, ids_by_text, _ in pending]
+
     def update_concept_coordinates(self, concept_id: int, coords: Dict[str, float]):
         """
         Updates the coordinates of an existing concept.
@@ -150,6 +382,28 @@ class SemanticSubstrateDatabase:
               divine_resonance, distance_from_jehovah, biblical_balance, concept_id))
 
         self.conn.commit()
+        self._write_generation += 1
+
+        if self._coordinate_index is not None:
+            self._coordinate_index.update_coords(
+                concept_id,
+                (coords['love'], coords['power'], coords['wisdom'], coords['justice'])
+            )
+
+    def delete_concept(self, concept_id: int) -> bool:
+        """
+        Deletes a concept by id. Returns True if a row was removed.
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("DELETE FROM semantic_coordinates WHERE id = ?", (concept_id,))
+        self.conn.commit()
+        if not cursor.rowcount:
+            return False
+
+        self._write_generation += 1
+        if self._coordinate_index is not None:
+            self._coordinate_index.remove(concept_id)
+        return True
 
     def get_concept(self, text: str, context: str) -> Optional[dict]:
         """
@@ -163,15 +417,8 @@ class SemanticSubstrateDatabase:
             return None
 
         concept = dict(row)
-        coords = {
-            'love': concept['love'],
-            'justice': concept['justice'],
-            'power': concept['power'],
-            'wisdom': concept['wisdom']
-        }
-
-        oracle_payload = generate_oracle_payload(coords)
-        concept.update(oracle_payload)
+        # The payload only reads the four axis columns, so the row can be passed as-is
+        concept.update(generate_oracle_payload(concept))
 
         return concept
 
@@ -184,51 +431,262 @@ class SemanticSubstrateDatabase:
             return {'love': row[0], 'power': row[1], 'wisdom': row[2], 'justice': row[3]}
         return None
 
-    def query_by_proximity(self, target_coords_dict: dict, max_distance: float = 0.5, context: Optional[str] = None, limit: int = 10) -> List[dict]:
+    @property
+    def _coords_snapshot_path(self) -> str:
+        return self.db_path + ".coords"
+
+    def _coords_fingerprint(self) -> list:
+        """Cheap aggregate that changes whenever rows are added, removed or moved."""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT COUNT(*), MAX(id), MAX(updated_at),
+                   TOTAL(love), TOTAL(power), TOTAL(wisdom), TOTAL(justice)
+            FROM semantic_coordinates
+        """)
+        return list(cursor.fetchone())
+
+    def _data_version(self) -> int:
+        cursor = self.conn.cursor()
+        cursor.execute("PRAGMA data_version")
+        return cursor.fetchone()[0]
+
+    def _discard_stale_coordinate_index(self):
         """
-        Find concepts near a point in semantic space.
+        Drop the coordinate index if another connection has committed since it
+        was loaded. This instance's own writes keep the index current, but
+        writes through other connections to the same file only show up in
+        PRAGMA data_version.
         """
+        if self._coordinate_index is not None and self._data_version() != self._index_data_version:
+            self._coordinate_index = None
+            self._snapshot_generation = None
+            # Results cached against the old contents are stale as well
+            self._write_generation += 1
+            logger.info("Coordinate index dropped after a write from another connection")
+
+    def _get_coordinate_index(self) -> CoordinateIndex:
+        """Return the coordinate index, loading it from a snapshot or the database on first use."""
+        self._discard_stale_coordinate_index()
+        if self._coordinate_index is None:
+            self._index_data_version = self._data_version()
+        if self._coordinate_index is None and self._use_coords_snapshot:
+            index = CoordinateIndex.load(self._coords_snapshot_path, self._coords_fingerprint())
+            if index is not None:
+                self._coordinate_index = index
+                self._snapshot_generation = self._write_generation
+                logger.info(f"Coordinate index mapped from snapshot with {len(index)} concepts")
+        if self._coordinate_index is None:
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT id, context, love, power, wisdom, justice FROM semantic_coordinates")
+            rows = cursor.fetchall()
+            index = CoordinateIndex()
+            index.add_many(
+                [row[0] for row in rows],
+                [row[1] for row in rows],
+                np.array([tuple(row[2:6]) for row in rows], dtype=np.float64).reshape(-1, 4)
+            )
+            self._coordinate_index = index
+            logger.info(f"Coordinate index loaded with {len(index)} concepts")
+        return self._coordinate_index
+
+    def _fetch_rows_by_id(self, id_list: List[int]) -> Dict[int, sqlite3.Row]:
+        """Fetch full rows for many ids with as few SELECTs as possible."""
         cursor = self.conn.cursor()
+        rows_by_id = {}
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(id_list), 900):
+            chunk = id_list[start:start + 900]
+            cursor.execute(
+                f"SELECT * FROM semantic_coordinates WHERE id IN ({','.join('?' * len(chunk))})",
+                chunk
+            )
+            rows_by_id.update((row['id'], row) for row in cursor.fetchall())
+        return rows_by_id
+
+    @staticmethod
+    def _ordered_rows(ids: np.ndarray, distances: np.ndarray,
+                      rows_by_id: Dict[int, sqlite3.Row]) -> Tuple[List[sqlite3.Row], np.ndarray]:
+        """Line fetched rows up with index hits, dropping ids no longer in the table."""
+        rows = [rows_by_id.get(concept_id) for concept_id in ids.tolist()]
+        if any(row is None for row in rows):
+            present = np.fromiter((row is not None for row in rows), dtype=bool, count=len(rows))
+            rows = [row for row in rows if row is not None]
+            distances = distances[present]
+        return rows, distances
+
+    @staticmethod
+    def _coords_target(coords: dict) -> Tuple[float, float, float, float]:
+        """Coordinate dict to the index's (love, power, wisdom, justice) order."""
+        return (coords['love'], coords['power'], coords['wisdom'], coords['justice'])
+
+    def _proximity_rows(self, target_coords_dict: dict, max_distance: Optional[float],
+                        context: Optional[str], limit: Optional[int],
+                        ef_search: Optional[int] = None) -> Tuple[List[sqlite3.Row], np.ndarray]:
+        """
+        Nearest stored rows to a point, closest first, with their distances as an array.
+        """
+        index = self._get_coordinate_index()
+        k = len(index) if limit is None else limit
+        ids, distances = index.search(self._coords_target(target_coords_dict), k,
+                                      max_distance=max_distance, context=context, ef_search=ef_search)
+        if not len(ids):
+            return [], distances
+        return self._ordered_rows(ids, distances, self._fetch_rows_by_id(ids.tolist()))
+
+    def _rtree_proximity_rows(self, target_coords_dict: dict, max_distance: float,
+                              context: Optional[str], limit: Optional[int]) -> Tuple[List[sqlite3.Row], np.ndarray]:
+        """
+        _proximity_rows answered from the R*Tree: rows inside the search ball's
+        bounding box are fetched, then filtered and ranked by exact distance.
+        """
+        target = np.array(self._coords_target(target_coords_dict), dtype=np.float64)
+        bounds = [bound for value in target.tolist() for bound in (value - max_distance, value + max_distance)]
+        sql = """
+            SELECT c.* FROM semantic_coordinates_rtree r JOIN semantic_coordinates c ON c.id = r.id
+            WHERE r.love_max >= ? AND r.love_min <= ? AND r.power_max >= ? AND r.power_min <= ?
+              AND r.wisdom_max >= ? AND r.wisdom_min <= ? AND r.justice_max >= ? AND r.justice_min <= ?
+        """
+        if context is not None:
+            sql += " AND c.context = ?"
+            bounds.append(context)
+        candidates = self.conn.execute(sql, bounds).fetchall()
+        if not candidates:
+            return [], np.empty(0, dtype=np.float64)
+
+        coords = np.array([(row['love'], row['power'], row['wisdom'], row['justice']) for row in candidates],
+                          dtype=np.float64)
+        distances = np.sqrt(((coords - target) ** 2).sum(axis=1))
+        order = np.lexsort((np.array([row['id'] for row in candidates]), distances))
+        order = order[distances[order] <= max_distance][:limit]
+        return [candidates[i] for i in order.tolist()], distances[order]
 
-        if context:
-            cursor.execute("SELECT * FROM semantic_coordinates WHERE context = ?", (context,))
-        else:
-            cursor.execute("SELECT * FROM semantic_coordinates")
+    def query_by_proximity(self, target_coords_dict: dict, max_distance: float = 0.5, context: Optional[str] = None, limit: int = 10) -> List[dict]:
+        """
+        Find concepts near a point in semantic space.
 
+        Until the in-memory coordinate index has been loaded, radius queries
+        are pruned by the R*Tree instead of loading every stored coordinate.
+        """
+        self._discard_stale_coordinate_index()
+        if self._coordinate_index is None and self._rtree_available and max_distance is not None:
+            rows, distances = self._rtree_proximity_rows(target_coords_dict, max_distance, context, limit)
+        else:
+            rows, distances = self._proximity_rows(target_coords_dict, max_distance, context, limit)
         results = []
-        for row in cursor.fetchall():
+        for row, distance in zip(rows, distances.tolist()):
             concept = dict(row)
-            coords = {'love': concept['love'], 'power': concept['power'], 'wisdom': concept['wisdom'], 'justice': concept['justice']}
-
-            distance = self.meaning_model.semantic_distance(target_coords_dict, coords)
+            concept['semantic_distance'] = distance
+            results.append(concept)
+        return results
 
-            if distance <= max_distance:
-                concept['semantic_distance'] = distance
-                results.append(concept)
+    @staticmethod
+    def _semantic_results(rows: List[sqlite3.Row], distances: np.ndarray) -> List[dict]:
+        """Build search_semantic result dicts from rows in ascending distance order."""
+        if not rows:
+            return []
+        # Enrich column by column, then zip into one dict per row at the end.
+        # Rows arrive closest first, so they are already in descending similarity order.
+        keys = list(rows[0].keys())
+        columns = dict(zip(keys, zip(*rows)))
+        columns['semantic_distance'] = distances.tolist()
+        columns['semantic_similarity'] = (1.0 - distances * 0.5).tolist()
+        coords = np.array([columns[axis] for axis in PAYLOAD_AXES], dtype=np.float64).T
+        columns.update(generate_oracle_payloads(coords))
+
+        keys = list(columns)
+        return [dict(zip(keys, values)) for values in zip(*columns.values())]
+
+    @staticmethod
+    def _similarity_search_params(min_similarity: float, ef_search: Optional[int]) -> Tuple[float, int]:
+        """
+        Distance cutoff and ANN effort for a similarity threshold.
 
-        results.sort(key=lambda x: x['semantic_distance'])
-        return results[:limit]
+        Strict thresholds get a larger ef_search for higher recall; loose ones
+        search faster with a smaller one.
+        """
+        if ef_search is None:
+            ef_search = int(40 + 60 * min_similarity)
+        return 2.0 * (1.0 - min_similarity), ef_search
+
+    @staticmethod
+    def _text_match_expression(query_text: str) -> Optional[str]:
+        """FTS5 MATCH expression OR-ing the query's words; None if none are long enough for trigrams."""
+        terms = dict.fromkeys(word for word in _WORD_RE.findall(query_text.lower()) if len(word) >= 3)
+        if not terms:
+            return None
+        return " OR ".join(f'"{term}"' for term in terms)
 
-    def search_semantic(self, query_text: str, context: str = "biblical", limit: int = 10) -> List[dict]:
+    def _text_candidate_rows(self, query_text: str, context: str,
+                             limit: int) -> Optional[List[sqlite3.Row]]:
+        """
+        Rows in context sharing a word with the query, best full-text matches first.
+        None means no prefilter could be applied.
+        """
+        expression = self._text_match_expression(query_text) if self._fts_available else None
+        if expression is None:
+            return None
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT c.* FROM semantic_coordinates_fts f
+            JOIN semantic_coordinates c ON c.id = f.rowid
+            WHERE semantic_coordinates_fts MATCH ? AND c.context = ?
+            ORDER BY f.rank
+            LIMIT ?
+        """, (expression, context, limit))
+        return cursor.fetchall()
+
+    def search_semantic(self, query_text: str, context: str = "biblical", limit: int = 10,
+                        min_similarity: float = 0.5, ef_search: Optional[int] = None,
+                        text_prefilter: bool = False) -> List[dict]:
         """
         Semantic search: Analyze query and find similar concepts.
+
+        Only concepts with semantic_similarity >= min_similarity are returned.
+        ef_search overrides the index search effort derived from min_similarity.
+        With text_prefilter, only the TEXT_PREFILTER_FACTOR * limit best
+        full-text matches for the query's words are ranked by semantic
+        distance, instead of searching the whole coordinate index.
         """
+        max_distance, ef_search = self._similarity_search_params(min_similarity, ef_search)
         query_coords = self.meaning_model.calculate_coordinates(query_text, context)
-        results = self.query_by_proximity(query_coords, max_distance=1.0, context=context, limit=limit)
-
-        for result in results:
-            result['semantic_similarity'] = 1.0 - (result['semantic_distance'] / 2.0)
-            coords = {
-                'love': result['love'],
-                'justice': result['justice'],
-                'power': result['power'],
-                'wisdom': result['wisdom']
-            }
-            oracle_payload = generate_oracle_payload(coords)
-            result.update(oracle_payload)
-
-        results.sort(key=lambda x: x['semantic_similarity'], reverse=True)
-        return results
+        candidates = (self._text_candidate_rows(query_text, context, limit * TEXT_PREFILTER_FACTOR)
+                      if text_prefilter else None)
+        if candidates is None:
+            rows, distances = self._proximity_rows(query_coords, max_distance, context, limit, ef_search)
+            return self._semantic_results(rows, distances)
+        if not candidates:
+            return []
+
+        target = np.array(self._coords_target(query_coords), dtype=np.float64)
+        coords = np.array([(row['love'], row['power'], row['wisdom'], row['justice']) for row in candidates],
+                          dtype=np.float64)
+        distances = np.sqrt(((coords - target) ** 2).sum(axis=1))
+        order = np.lexsort((np.array([row['id'] for row in candidates]), distances))
+        order = order[distances[order] <= max_distance][:limit]
+        return self._semantic_results([candidates[i] for i in order.tolist()], distances[order])
+
+    def search_semantic_batch(self, query_texts: List[str], context: str = "biblical", limit: int = 10,
+                              min_similarity: float = 0.5, ef_search: Optional[int] = None) -> List[List[dict]]:
+        """
+        Semantic search for many queries at once.
+
+        Query points are searched as one matrix and every matching row is
+        fetched in a single pass, instead of one round-trip per query.
+        """
+        max_distance, ef_search = self._similarity_search_params(min_similarity, ef_search)
+        if not query_texts:
+            return []
+        targets = np.array([
+            self._coords_target(self.meaning_model.calculate_coordinates(text, context))
+            for text in query_texts
+        ], dtype=np.float64)
+        hits = self._get_coordinate_index().search_batch(targets, limit, max_distance=max_distance,
+                                                         context=context, ef_search=ef_search)
+
+        all_ids = sorted({concept_id for ids, _ in hits for concept_id in ids.tolist()})
+        rows_by_id = self._fetch_rows_by_id(all_ids) if all_ids else {}
+        return [self._semantic_results(*self._ordered_rows(ids, distances, rows_by_id))
+                for ids, distances in hits]
 
     def get_all_concepts(self) -> List[dict]:
         """
@@ -239,8 +697,28 @@ class SemanticSubstrateDatabase:
         rows = cursor.fetchall()
         return [dict(row) for row in rows]
 
+    def get_concept_columns(self) -> Tuple[List[str], List[Any], np.ndarray]:
+        """
+        Column-wise view of every concept for analytics: concept texts,
+        created_at values and an (N, 4) float32 coordinate matrix with
+        columns (love, justice, power, wisdom), without building a dict per row.
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT concept_text, created_at, love, justice, power, wisdom FROM semantic_coordinates"
+        )
+        rows = cursor.fetchall()
+        if not rows:
+            return [], [], np.empty((0, 4), dtype=np.float32)
+        texts, created_at, *axes = zip(*rows)
+        return list(texts), list(created_at), np.ascontiguousarray(np.array(axes, dtype=np.float32).T)
+
     def close(self):
         if self.conn:
+            if (self._use_coords_snapshot and self._coordinate_index is not None
+                    and self._snapshot_generation != self._write_generation):
+                self._coordinate_index.save(self._coords_snapshot_path, self._coords_fingerprint())
+                self._snapshot_generation = self._write_generation
             self.conn.close()
 
     def __enter__(self):
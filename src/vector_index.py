@@ -0,0 +1,510 @@
+"""
+VECTOR INDEX
+
+In-memory nearest-neighbour index over the 4D concept coordinates stored in
+the semantic database.
+
+Small collections are searched exactly with a vectorized scan. Once the index
+holds HNSW_MIN_ITEMS concepts and hnswlib is installed, candidates come from an
+HNSW graph and are re-ranked with exact distances.
+
+Past IVF_MIN_ITEMS concepts, with faiss installed, the graph is replaced by an
+IVF-PQ index holding a one-byte code per concept. Rows written after the IVF
+index was trained are scanned exactly alongside its candidates until the next
+rebuild.
+
+An index can be saved as a directory of .npy files and loaded back memory-mapped,
+so processes opening the same database share one page-cached copy of the rows.
+"""
+
+import json
+import math
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+
+try:
+    from .jit_support import njit, prange, NUMBA_AVAILABLE
+except ImportError:
+    from jit_support import njit, prange, NUMBA_AVAILABLE
+
+try:
+    import hnswlib
+except ImportError:
+    hnswlib = None
+
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
+# Below this many concepts a brute-force scan beats building and querying a graph
+HNSW_MIN_ITEMS = 1000
+
+# IVF-PQ tier: inverted lists probed per query, and the training sample size.
+# In 4D a single 8-bit sub-quantizer (m=1) already codes the whole residual.
+IVF_MIN_ITEMS = 1_000_000
+IVF_NLIST = 1024
+IVF_NPROBE = 16
+IVF_TRAIN_SAMPLE = 256 * IVF_NLIST
+# Rebuild the IVF index once rows written since training exceed this fraction
+IVF_REBUILD_FRACTION = 0.05
+
+# Arrays written by CoordinateIndex.save, loaded copy-on-write memory-mapped
+SNAPSHOT_ARRAYS = ('ids', 'coords', 'context_codes', 'quantized', 'unquantizable')
+SNAPSHOT_MANIFEST = 'manifest.json'
+
+# Candidate oversampling when a context filter is applied after the ANN query
+CONTEXT_OVERSAMPLE = 8
+
+# Compact the arrays once tombstoned rows exceed this fraction of all rows
+COMPACT_FRACTION = 0.25
+
+# int8 screening for exact scans over at least this many rows. Coordinates in
+# [0, QUANT_RANGE] map onto 0..127; the range leaves headroom for ICE-emphasized
+# coordinates above 1.0. Rows outside it are flagged and always re-ranked.
+QUANT_MIN_ITEMS = 10000
+QUANT_RANGE = 2.0
+QUANT_SCALE = 127.0 / QUANT_RANGE
+# Worst-case distance error of a quantized row: half a step on each of 4 axes
+QUANT_ROW_ERROR = math.sqrt(4 * (0.5 / QUANT_SCALE) ** 2)
+
+
+@njit(parallel=True, cache=True)
+def _squared_distances_4d(coords, positions, target):
+    """Squared L2 distance from target to each selected row, without temporaries"""
+    n = positions.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    for i in prange(n):
+        row = positions[i]
+        dx = coords[row, 0] - target[0]
+        dy = coords[row, 1] - target[1]
+        dz = coords[row, 2] - target[2]
+        dw = coords[row, 3] - target[3]
+        out[i] = dx * dx + dy * dy + dz * dz + dw * dw
+    return out
+
+
+def _squared_distances(coords: np.ndarray, positions: np.ndarray, target: np.ndarray) -> np.ndarray:
+    """Squared distances for the given row positions; compiled when Numba is installed"""
+    if NUMBA_AVAILABLE:
+        return _squared_distances_4d(coords, positions, target)
+    diff = coords[positions] - target
+    return np.einsum('ij,ij->i', diff, diff)
+
+
+class CoordinateIndex:
+    """
+    Nearest-neighbour index mapping concept ids to (love, power, wisdom, justice)
+
+    Exact float64 coordinates are always kept, so reported distances match the
+    brute-force Euclidean distance regardless of which search tier is used.
+    """
+
+    def __init__(self, M: int = 16, ef_construction: int = 128, ef_search: int = 64):
+        self.M = M
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+
+        self._ids = np.empty(0, dtype=np.int64)
+        self._coords = np.empty((0, 4), dtype=np.float64)
+        self._context_codes = np.empty(0, dtype=np.int32)
+        self._alive = np.empty(0, dtype=bool)
+        self._quantized = np.empty((0, 4), dtype=np.int8)
+        self._unquantizable = np.empty(0, dtype=bool)
+        self._size = 0
+        self._deleted = 0
+        self._positions: Dict[int, int] = {}
+        self._context_ids: Dict[str, int] = {}
+        self._hnsw = None
+        self._hnsw_ef = ef_search
+        self._ivf = None
+        # Rows [0, _ivf_size) were coded when the IVF index was built. Positions
+        # written since then are scanned exactly; _ivf_stale counts coded entries
+        # that were since moved or removed, which still occupy IVF result slots.
+        self._ivf_size = 0
+        self._ivf_fresh = set()
+        self._ivf_stale = 0
+
+    def __len__(self) -> int:
+        return self._size - self._deleted
+
+    def __contains__(self, concept_id: int) -> bool:
+        return concept_id in self._positions
+
+    def _context_code(self, context: str) -> int:
+        code = self._context_ids.get(context)
+        if code is None:
+            code = self._context_ids[context] = len(self._context_ids)
+        return code
+
+    def _grow(self, capacity: int):
+        """Grow the backing arrays geometrically to hold at least capacity rows"""
+        new_capacity = max(capacity, 2 * len(self._ids), 64)
+        ids = np.empty(new_capacity, dtype=np.int64)
+        coords = np.empty((new_capacity, 4), dtype=np.float64)
+        codes = np.empty(new_capacity, dtype=np.int32)
+        alive = np.empty(new_capacity, dtype=bool)
+        quantized = np.empty((new_capacity, 4), dtype=np.int8)
+        unquantizable = np.empty(new_capacity, dtype=bool)
+        ids[:self._size] = self._ids[:self._size]
+        coords[:self._size] = self._coords[:self._size]
+        codes[:self._size] = self._context_codes[:self._size]
+        alive[:self._size] = self._alive[:self._size]
+        quantized[:self._size] = self._quantized[:self._size]
+        unquantizable[:self._size] = self._unquantizable[:self._size]
+        self._ids, self._coords, self._context_codes, self._alive = ids, coords, codes, alive
+        self._quantized, self._unquantizable = quantized, unquantizable
+
+    @staticmethod
+    def _quantize(coords: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Quantize rows to int8, flagging rows that fall outside the quantized range"""
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 4)
+        out_of_range = ((coords < 0.0) | (coords > QUANT_RANGE)).any(axis=1)
+        quantized = np.rint(np.clip(coords, 0.0, QUANT_RANGE) * QUANT_SCALE).astype(np.int8)
+        return quantized, out_of_range
+
+    def _set_coords(self, position: int, coords: Sequence[float]):
+        """Write exact and quantized coordinates for one row"""
+        self._coords[position] = coords
+        quantized, out_of_range = self._quantize(self._coords[position])
+        self._quantized[position] = quantized[0]
+        self._unquantizable[position] = out_of_range[0]
+
+    def _insert(self, concept_id: int, context: str, coords: Sequence[float]) -> int:
+        """Write a concept into the exact arrays and return its row position"""
+        concept_id = int(concept_id)
+        position = self._positions.get(concept_id)
+        if position is None:
+            if self._size == len(self._ids):
+                self._grow(self._size + 1)
+            position = self._size
+            self._positions[concept_id] = position
+            self._ids[position] = concept_id
+            self._alive[position] = True
+            self._size += 1
+
+        self._set_coords(position, coords)
+        self._context_codes[position] = self._context_code(context)
+        return position
+
+    def add(self, concept_id: int, context: str, coords: Sequence[float]):
+        """Insert a concept, or move it if the id is already indexed"""
+        position = self._insert(concept_id, context, coords)
+        self._sync_ann(np.array([position]))
+
+    def update_coords(self, concept_id: int, coords: Sequence[float]):
+        """Move an indexed concept to new coordinates, keeping its context"""
+        position = self._positions.get(int(concept_id))
+        if position is None:
+            return
+        self._set_coords(position, coords)
+        self._sync_ann(np.array([position]))
+
+    def remove(self, concept_id: int):
+        """Tombstone a concept; the arrays are compacted once enough rows are dead"""
+        position = self._positions.pop(int(concept_id), None)
+        if position is None:
+            return
+        self._alive[position] = False
+        self._deleted += 1
+        if self._hnsw is not None:
+            self._hnsw.mark_deleted(int(concept_id))
+        if self._ivf is not None:
+            # IVF hits are resolved through _positions, so removed ids drop out on their own
+            if position < self._ivf_size and position not in self._ivf_fresh:
+                self._ivf_stale += 1
+            self._ivf_fresh.discard(position)
+        if self._deleted > COMPACT_FRACTION * self._size:
+            self.compact()
+
+    def compact(self):
+        """Drop tombstoned rows and rebuild positions (and the ANN tier, if any)"""
+        if not self._deleted:
+            return
+        keep = np.flatnonzero(self._alive[:self._size])
+        self._ids = self._ids[keep]
+        self._coords = self._coords[keep]
+        self._context_codes = self._context_codes[keep]
+        self._alive = np.ones(len(keep), dtype=bool)
+        self._quantized = self._quantized[keep]
+        self._unquantizable = self._unquantizable[keep]
+        self._size = len(keep)
+        self._deleted = 0
+        self._positions = {concept_id: position for position, concept_id in enumerate(self._ids.tolist())}
+        if self._ann_active():
+            self._hnsw = self._ivf = None
+            if faiss is not None and len(self) >= IVF_MIN_ITEMS:
+                self._build_ivf()
+            elif hnswlib is not None and len(self) >= HNSW_MIN_ITEMS:
+                self._build_hnsw()
+
+    def add_many(self, concept_ids: Sequence[int], contexts: Sequence[str], coords: np.ndarray):
+        """Bulk insert; the ANN tier is updated once for the whole batch"""
+        positions = np.fromiter(
+            (self._insert(concept_id, context, row)
+             for concept_id, context, row in zip(concept_ids, contexts, coords)),
+            dtype=np.int64
+        )
+        self._sync_ann(positions)
+
+    def save(self, directory: str, fingerprint: Optional[list] = None):
+        """
+        Write the index rows to directory, tagged with a caller-supplied fingerprint
+
+        The manifest is removed first and written last, so an interrupted save
+        leaves no manifest and load() ignores the partial snapshot.
+        """
+        self.compact()
+        os.makedirs(directory, exist_ok=True)
+        manifest_path = os.path.join(directory, SNAPSHOT_MANIFEST)
+        if os.path.exists(manifest_path):
+            os.remove(manifest_path)
+        for name in SNAPSHOT_ARRAYS:
+            np.save(os.path.join(directory, name + '.npy'), getattr(self, '_' + name)[:self._size])
+        with open(manifest_path + '.tmp', 'w') as f:
+            json.dump({'fingerprint': fingerprint, 'context_ids': self._context_ids}, f)
+        os.replace(manifest_path + '.tmp', manifest_path)
+
+    @classmethod
+    def load(cls, directory: str, fingerprint: Optional[list] = None, **kwargs) -> Optional['CoordinateIndex']:
+        """
+        Load a saved index memory-mapped, or None if absent or saved under another fingerprint
+
+        Arrays are mapped copy-on-write: pages are shared with every other
+        process that maps the same files until this index writes to them.
+        """
+        try:
+            with open(os.path.join(directory, SNAPSHOT_MANIFEST)) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if manifest.get('fingerprint') != json.loads(json.dumps(fingerprint)):
+            return None
+
+        index = cls(**kwargs)
+        try:
+            for name in SNAPSHOT_ARRAYS:
+                setattr(index, '_' + name, np.load(os.path.join(directory, name + '.npy'), mmap_mode='c'))
+        except (OSError, ValueError):
+            return None
+        index._size = len(index._ids)
+        index._alive = np.ones(index._size, dtype=bool)
+        index._positions = {concept_id: position for position, concept_id in enumerate(index._ids.tolist())}
+        index._context_ids = manifest['context_ids']
+        index._sync_ann(np.empty(0, dtype=np.int64))
+        return index
+
+    def _ann_active(self) -> bool:
+        return self._hnsw is not None or self._ivf is not None
+
+    def _sync_ann(self, positions: np.ndarray):
+        """Push changed rows into the ANN tier, building or switching tiers as the index grows"""
+        if self._ivf is not None:
+            for position in positions.tolist():
+                if position not in self._ivf_fresh:
+                    self._ivf_fresh.add(position)
+                    if position < self._ivf_size:
+                        self._ivf_stale += 1
+            if len(self._ivf_fresh) + self._ivf_stale > IVF_REBUILD_FRACTION * self._size:
+                self._build_ivf()
+            return
+        if faiss is not None and len(self) >= IVF_MIN_ITEMS:
+            self._build_ivf()
+            return
+        if self._hnsw is None:
+            if hnswlib is not None and len(self) >= HNSW_MIN_ITEMS:
+                self._build_hnsw()
+            return
+        if len(positions) == 0:
+            return
+        if self._size > self._hnsw.get_max_elements():
+            self._hnsw.resize_index(2 * self._size)
+        self._hnsw.add_items(self._coords[positions].astype(np.float32), self._ids[positions])
+
+    def _build_hnsw(self):
+        """Build the HNSW graph from every indexed row"""
+        index = hnswlib.Index(space='l2', dim=4)
+        index.init_index(max_elements=max(2 * self._size, HNSW_MIN_ITEMS),
+                         M=self.M, ef_construction=self.ef_construction)
+        index.set_ef(self.ef_search)
+        self._hnsw_ef = self.ef_search
+        live = np.flatnonzero(self._alive[:self._size])
+        index.add_items(self._coords[live].astype(np.float32), self._ids[live])
+        self._hnsw = index
+
+    def _build_ivf(self):
+        """Train and fill an IVF-PQ index over every live row, replacing any HNSW graph"""
+        live = np.flatnonzero(self._alive[:self._size])
+        vectors = np.ascontiguousarray(self._coords[live], dtype=np.float32)
+        sample = vectors
+        if len(vectors) > IVF_TRAIN_SAMPLE:
+            chosen = np.random.default_rng(42).choice(len(vectors), IVF_TRAIN_SAMPLE, replace=False)
+            sample = vectors[chosen]
+        quantizer = faiss.IndexFlatL2(4)
+        index = faiss.IndexIVFPQ(quantizer, 4, IVF_NLIST, 1, 8)
+        index.train(sample)
+        index.add_with_ids(vectors, self._ids[live])
+        index.nprobe = IVF_NPROBE
+        self._ivf, self._hnsw = index, None
+        self._ivf_size = self._size
+        self._ivf_fresh = set()
+        self._ivf_stale = 0
+
+    def _ann_positions(self, targets: np.ndarray, candidates: int,
+                       ef_search: Optional[int] = None) -> List[np.ndarray]:
+        """Candidate row positions from the active ANN tier, one array per target row"""
+        queries = np.ascontiguousarray(targets, dtype=np.float32)
+        positions = self._positions
+        ef = self.ef_search if ef_search is None else ef_search
+        if self._ivf is not None:
+            # Scale the probed lists with the requested effort relative to the default
+            self._ivf.nprobe = max(1, IVF_NPROBE * ef // self.ef_search)
+            # Stale entries can take result slots; ask for that many more
+            _, labels = self._ivf.search(queries, candidates + self._ivf_stale)
+            fresh = np.fromiter(self._ivf_fresh, dtype=np.int64, count=len(self._ivf_fresh))
+            # -1 pads short result lists; ids missing from _positions were removed
+            return [
+                np.union1d(np.fromiter((positions[label] for label in row if label in positions),
+                                       dtype=np.int64), fresh)
+                for row in labels.tolist()
+            ]
+        if ef != self._hnsw_ef:
+            self._hnsw.set_ef(ef)
+            self._hnsw_ef = ef
+        labels, _ = self._hnsw.knn_query(queries, k=candidates)
+        return [np.fromiter((positions[int(label)] for label in row), dtype=np.int64, count=len(row))
+                for row in labels]
+
+    def search(
+        self,
+        target: Sequence[float],
+        k: int,
+        max_distance: Optional[float] = None,
+        context: Optional[str] = None,
+        ef_search: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the k nearest concepts to target
+
+        ef_search overrides the ANN search effort for this call; higher values
+        trade speed for recall. Exact scans ignore it.
+
+        Returns:
+            (ids, distances) sorted by ascending distance, ties broken by id
+        """
+        if k <= 0 or len(self) == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+        target = np.asarray(target, dtype=np.float64)
+        code = None
+        if context is not None:
+            code = self._context_ids.get(context)
+            if code is None:
+                return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+
+        if self._ann_active():
+            found = self._search_ann(target, k, max_distance, code, ef_search)
+            if found is not None:
+                return found
+
+        return self._search_exact(np.arange(self._size), target, k, max_distance, code)
+
+    def search_batch(
+        self,
+        targets: np.ndarray,
+        k: int,
+        max_distance: Optional[float] = None,
+        context: Optional[str] = None,
+        ef_search: Optional[int] = None
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Run search for every row of a (Q, 4) target matrix
+
+        With an ANN tier active, all queries go to it in one call.
+        """
+        targets = np.asarray(targets, dtype=np.float64).reshape(-1, 4)
+        if not self._ann_active() or k <= 0 or (context is not None and context not in self._context_ids):
+            return [self.search(target, k, max_distance, context, ef_search) for target in targets]
+
+        code = None if context is None else self._context_ids[context]
+        candidates = min(k if code is None else k * CONTEXT_OVERSAMPLE, len(self))
+        results = []
+        for target, positions in zip(targets, self._ann_positions(targets, candidates, ef_search)):
+            found = self._rerank(positions, target, k, max_distance, code, candidates)
+            if found is None:
+                found = self._search_exact(np.arange(self._size), target, k, max_distance, code)
+            results.append(found)
+        return results
+
+    def _search_exact(self, positions, target, k, max_distance, code):
+        """Exact top-k among the given row positions"""
+        if self._deleted:
+            positions = positions[self._alive[positions]]
+        if code is not None:
+            positions = positions[self._context_codes[positions] == code]
+        if len(positions) >= QUANT_MIN_ITEMS:
+            positions = self._screen_quantized(positions, target, k, max_distance)
+        distances = np.sqrt(_squared_distances(self._coords, positions, target))
+        if max_distance is not None:
+            keep = distances <= max_distance
+            positions, distances = positions[keep], distances[keep]
+        ids = self._ids[positions]
+        if k < len(distances):
+            top = np.argpartition(distances, k - 1)[:k]
+            # Include every row tied with the k-th distance so tie-breaking by id is exact
+            kth = distances[top].max()
+            top = np.flatnonzero(distances <= kth)
+            ids, distances = ids[top], distances[top]
+        order = np.lexsort((ids, distances))[:k]
+        return ids[order], distances[order]
+
+    def _screen_quantized(self, positions, target, k, max_distance):
+        """
+        Narrow positions to a candidate set guaranteed to contain the exact top k
+
+        Approximate distances come from int8 rows and an int8 target. Each is
+        within `error` of the true distance, so every true top-k row has an
+        approximate distance no more than 2 * error above the k-th approximate one.
+        """
+        target_q, _ = self._quantize(target)
+        target_error = float(np.linalg.norm(target - target_q[0] / QUANT_SCALE))
+        error = QUANT_ROW_ERROR + target_error
+
+        diff = self._quantized[positions].astype(np.int16) - target_q[0].astype(np.int16)
+        approx = np.sqrt(np.einsum('ij,ij->i', diff, diff, dtype=np.int32)) / QUANT_SCALE
+
+        # Out-of-range rows have clipped, meaningless approximations: they are
+        # always kept and take no part in setting the bound
+        unquantizable = self._unquantizable[positions]
+        bound = np.inf if max_distance is None else max_distance + error
+        quantizable_approx = approx[~unquantizable]
+        if k < len(quantizable_approx):
+            kth = np.partition(quantizable_approx, k - 1)[k - 1]
+            bound = min(bound, kth + 2 * error)
+        keep = (approx <= bound) | unquantizable
+        return positions[keep]
+
+    def _search_ann(self, target, k, max_distance, code, ef_search=None):
+        """
+        Approximate candidates from the ANN tier, re-ranked exactly
+
+        Returns None when the filtered candidates cannot be trusted to contain
+        the top k, in which case the caller falls back to an exact scan.
+        """
+        candidates = k if code is None else k * CONTEXT_OVERSAMPLE
+        candidates = min(candidates, len(self))
+        positions = self._ann_positions(target[None, :], candidates, ef_search)[0]
+        return self._rerank(positions, target, k, max_distance, code, candidates)
+
+    def _rerank(self, positions, target, k, max_distance, code, candidates):
+        """Exact re-ranking of ANN candidates, or None if they may miss in-range matches"""
+        if not len(positions):
+            return None
+        ids, distances = self._search_exact(positions, target, k, max_distance, code)
+        if len(ids) < k and candidates < len(self):
+            # Too few survivors; the graph may not have returned every in-range match
+            farthest = float(np.sqrt(_squared_distances(self._coords, positions, target)).max())
+            if max_distance is None or farthest <= max_distance:
+                return None
+        return ids, distances
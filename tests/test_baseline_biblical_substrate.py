@@ -0,0 +1,186 @@
+"""
+Tests for the baseline biblical semantic substrate.
+"""
+
+import itertools
+import time
+import unittest
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+import numpy as np
+from src import baseline_biblical_substrate
+from src.baseline_biblical_substrate import (
+    BiblicalCoordinates,
+    BiblicalSemanticSubstrate,
+    score_biblical_coordinates_batch,
+    _score_coordinate_rows
+)
+from src.ice_framework import ICEFramework, ContextDomain, ThoughtType
+from src.meaning_model import MeaningModel
+
+class TestBiblicalSemanticSubstrate(unittest.TestCase):
+
+    def setUp(self):
+        meaning_model = MeaningModel(None)
+        ice_framework = ICEFramework(meaning_model)
+        self.engine = BiblicalSemanticSubstrate(ice_framework)
+        meaning_model.semantic_engine = self.engine
+
+    def test_batch_scores_match_scalar(self):
+        """
+        Tests that vectorized scoring agrees with the per-instance methods.
+        """
+        samples = [
+            BiblicalCoordinates(0.9, 0.2, 0.7, 0.4),
+            BiblicalCoordinates(0.0, 0.0, 0.0, 0.0),
+            BiblicalCoordinates(0.1, 0.9, 0.2, 0.8),
+            BiblicalCoordinates(1.0, 1.0, 1.0, 1.0),
+        ]
+        scores = score_biblical_coordinates_batch(np.array([c.to_tuple() for c in samples]))
+        for i, coords in enumerate(samples):
+            self.assertAlmostEqual(scores['divine_resonance'][i], coords.divine_resonance())
+            self.assertAlmostEqual(scores['biblical_balance'][i], coords.biblical_balance())
+            self.assertAlmostEqual(scores['overall_biblical_alignment'][i], coords.overall_biblical_alignment())
+        self.assertEqual(scores['coercive'].tolist(), [False, False, True, False])
+
+    def test_coordinates_from_array(self):
+        """
+        Tests building coordinates from an array row, with the usual clamping.
+        """
+        coords = BiblicalCoordinates.from_array(np.array([0.9, 1.4, -0.2, 0.4]))
+        self.assertEqual(coords.to_tuple(), (0.9, 1.0, 0.0, 0.4))
+        self.assertIsInstance(coords.love, float)
+
+    def test_row_kernel_matches_batch(self):
+        """
+        Tests that the fused row kernel agrees with the NumPy scoring path.
+        """
+        coords = np.array([[0.9, 0.2, 0.7, 0.4], [0.0, 0.0, 0.0, 0.0], [0.1, 0.9, 0.2, 0.8]])
+        distance, balance, alignment, coercive = _score_coordinate_rows(coords)
+        scores = score_biblical_coordinates_batch(coords)
+        np.testing.assert_allclose(distance, scores['distance_from_jehovah'])
+        np.testing.assert_allclose(balance, scores['biblical_balance'])
+        np.testing.assert_allclose(alignment, scores['overall_biblical_alignment'])
+        self.assertEqual(coercive.tolist(), scores['coercive'].tolist())
+
+    def test_score_concepts_batch(self):
+        """
+        Tests that batch scoring returns one row per concept.
+        """
+        texts = ["love and mercy", "wisdom and understanding", "justice"]
+        scores = self.engine.score_concepts_batch(texts)
+        self.assertEqual(scores['coordinates'].shape, (3, 4))
+        expected = self.engine.analyze_concept(texts[1]).divine_resonance()
+        self.assertAlmostEqual(scores['divine_resonance'][1], expected)
+
+    def test_context_mapping(self):
+        """
+        Tests context-to-domain and domain-to-thought-type mapping.
+        """
+        self.assertEqual(self.engine._map_context_to_domain("Corporate Finance"), ContextDomain.BUSINESS)
+        self.assertEqual(self.engine._map_context_to_domain(None), ContextDomain.PERSONAL)
+        self.assertEqual(self.engine._map_context_to_thought_type(ContextDomain.BIBLICAL),
+                         ThoughtType.BIBLICAL_UNDERSTANDING)
+        self.assertEqual(self.engine._map_context_to_thought_type(ContextDomain.EDUCATIONAL),
+                         ThoughtType.PRACTICAL_WISDOM)
+
+    def test_text_analyses_share_alignment_formula(self):
+        """
+        Tests that the text analyses report the same overall alignment as BiblicalCoordinates.
+        """
+        for result in (self.engine.analyze_biblical_text("The love of God endures forever", "biblical"),
+                       self.engine.analyze_secular_concept("fair leadership with compassion", "business")):
+            coordinates = result['coordinates']
+            self.assertEqual(result['overall_alignment'], coordinates.overall_biblical_alignment())
+            self.assertEqual(result['divine_resonance'], coordinates.divine_resonance())
+
+    def test_coordinate_cache_is_bounded_lru(self):
+        """
+        Tests that the coordinate cache evicts least recently used entries and keys on (text, context).
+        """
+        with mock.patch.object(baseline_biblical_substrate, 'COORDINATE_CACHE_SIZE', 2):
+            self.engine.analyze_concept("love", "biblical")
+            self.engine.analyze_concept("wisdom", "biblical")
+            self.engine.analyze_concept("love", "biblical")
+            self.engine.analyze_concept("justice", "biblical")
+        self.assertEqual(list(self.engine.coordinate_cache), [("love", "biblical"), ("justice", "biblical")])
+
+        self.assertEqual(self.engine.cache_info()['hits'], 1)
+        self.assertEqual(self.engine.cache_info()['currsize'], 2)
+
+        self.engine.analyze_concept("grace", "financial:biblical")
+        self.assertNotIn(("grace:financial", "biblical"), self.engine.coordinate_cache)
+
+    def test_coordinate_cache_concurrent_use(self):
+        """
+        Tests that concurrent analyze_concept calls on a tiny cache neither fail nor lose hit/miss counts.
+        """
+        class YieldingCache(OrderedDict):
+            """Gives up the GIL after every lookup, widening the get/move_to_end window"""
+            def get(self, key, default=None):
+                value = super().get(key, default)
+                time.sleep(0.0001)
+                return value
+
+        self.engine.coordinate_cache = YieldingCache()
+        # Count every analyze_concept call, including the engine's own nested ones
+        invocations = itertools.count()
+        analyze_concept = self.engine.analyze_concept
+        def counted(*args, **kwargs):
+            next(invocations)
+            return analyze_concept(*args, **kwargs)
+        self.engine.analyze_concept = counted
+
+        calls = ["love", "wisdom", "justice"] * 200
+        with mock.patch.object(baseline_biblical_substrate, 'COORDINATE_CACHE_SIZE', 2), \
+                ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda word: self.engine.analyze_concept(word, "biblical"), calls))
+
+        self.assertEqual(len(results), len(calls))
+        info = self.engine.cache_info()
+        self.assertEqual(info['hits'] + info['misses'], next(invocations))
+        self.assertLessEqual(info['currsize'], 2)
+
+    def test_zero_weights_skip_ice_and_embeddings(self):
+        """
+        Tests that zero blend weights skip the ICE pass and embedding encodes entirely.
+        """
+        model = mock.Mock()
+        self.engine.embedding_model = model
+        self.engine.attribute_embeddings = {'love': np.ones(4)}
+        self.engine.ice_weight = 0.0
+        self.engine.embedding_weight = 0.0
+        with mock.patch.object(self.engine.ice_framework, 'process_thought') as process_thought:
+            self.engine.analyze_concepts(["grace and truth", "steady leadership"], "business")
+        process_thought.assert_not_called()
+        model.encode.assert_not_called()
+
+    def test_analyze_concepts_encodes_once(self):
+        """
+        Tests that batch analysis encodes all embeddings in a single model call.
+        """
+        class RecordingModel:
+            def __init__(self):
+                self.calls = []
+
+            def encode(self, texts, **kwargs):
+                self.calls.append(texts)
+                rows = np.ones((len(texts), 4)) if isinstance(texts, list) else np.ones(4)
+                return rows / 2.0
+
+        model = RecordingModel()
+        self.engine.embedding_model = model
+        self.engine.attribute_embeddings = {attr: np.eye(4)[i] for i, attr in
+                                            enumerate(['love', 'power', 'wisdom', 'justice'])}
+        texts = ["grace and truth", "steady leadership", "grace and truth"]
+        batch = self.engine.analyze_concepts(texts, "business")
+        self.assertEqual(model.calls, [["grace and truth", "steady leadership"]])
+        self.assertEqual(self.engine._prefetched_embeddings, {})
+
+        self.engine.coordinate_cache.clear()
+        single = [self.engine.analyze_concept(text, "business") for text in texts]
+        self.assertEqual([c.to_tuple() for c in batch], [c.to_tuple() for c in single])
+
+if __name__ == '__main__':
+    unittest.main()
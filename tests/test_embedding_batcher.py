@@ -0,0 +1,63 @@
+"""
+Tests for the embedding micro-batcher.
+"""
+
+import unittest
+import numpy as np
+from src.embedding_batcher import EmbeddingBatcher
+
+class RecordingModel:
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+
+    def encode(self, texts, **kwargs):
+        self.calls.append(list(texts))
+        if self.fail:
+            raise RuntimeError("model unavailable")
+        return np.array([[len(text), 1.0] for text in texts])
+
+class TestEmbeddingBatcher(unittest.TestCase):
+
+    def test_requests_in_window_share_one_encode(self):
+        """
+        Tests that requests queued within the flush window are encoded together, in order.
+        """
+        model = RecordingModel()
+        batcher = EmbeddingBatcher(model, max_batch=8, flush_ms=200)
+        futures = [batcher.submit(text) for text in ["a", "bb", "ccc"]]
+        results = [future.result(timeout=5) for future in futures]
+        batcher.close()
+
+        self.assertEqual(model.calls, [["a", "bb", "ccc"]])
+        self.assertEqual([row[0] for row in results], [1, 2, 3])
+
+    def test_batches_capped_at_max_batch(self):
+        """
+        Tests that a backlog is split into batches of at most max_batch texts.
+        """
+        model = RecordingModel()
+        batcher = EmbeddingBatcher(model, max_batch=2, flush_ms=200)
+        futures = [batcher.submit(str(i)) for i in range(5)]
+        for future in futures:
+            future.result(timeout=5)
+        batcher.close()
+
+        self.assertTrue(all(len(call) <= 2 for call in model.calls))
+        self.assertEqual(sum(model.calls, []), [str(i) for i in range(5)])
+
+    def test_encode_errors_reach_every_caller(self):
+        """
+        Tests that a failed batch raises in each waiting caller and the batcher rejects work once closed.
+        """
+        batcher = EmbeddingBatcher(RecordingModel(fail=True), flush_ms=50)
+        futures = [batcher.submit(text) for text in ["a", "b"]]
+        for future in futures:
+            with self.assertRaises(RuntimeError):
+                future.result(timeout=5)
+        batcher.close()
+        with self.assertRaises(RuntimeError):
+            batcher.submit("c")
+
+if __name__ == '__main__':
+    unittest.main()
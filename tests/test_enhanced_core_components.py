@@ -0,0 +1,70 @@
+"""
+Tests for the enhanced core components.
+"""
+
+import unittest
+import os
+import sys
+import numpy as np
+
+# enhanced_core_components imports its siblings as top-level modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+try:
+    import sympy
+except ImportError:
+    sympy = None
+
+@unittest.skipUnless(sympy, "enhanced_core_components requires sympy")
+class TestUniversalAnchor(unittest.TestCase):
+
+    def setUp(self):
+        from enhanced_core_components import UniversalAnchor
+        self.anchor = UniversalAnchor()
+
+    def test_stability_field_near_anchor(self):
+        """
+        Tests that a point at an anchor takes that anchor's stability (this branch used to raise AttributeError).
+        """
+        for anchor_id, point in self.anchor.anchor_points.items():
+            self.assertEqual(self.anchor.stability_field(point.coordinates), point.stability)
+        self.assertEqual(self.anchor.navigate_to_anchor(self.anchor.anchor_points[7].coordinates, 613)['stability'], 0.98)
+
+    def test_stability_field_away_from_anchors(self):
+        """
+        Tests that stability decays with the distance to the nearest anchor.
+        """
+        from baseline_biblical_substrate import BiblicalCoordinates
+        origin = BiblicalCoordinates(0.0, 0.0, 0.0, 0.0)
+        nearest = min(abs(origin.distance_from_jehovah() - point.jehovah_distance)
+                      for point in self.anchor.anchor_points.values())
+        self.assertAlmostEqual(self.anchor.stability_field(origin), 1.0 / (1.0 + nearest))
+
+@unittest.skipUnless(sympy, "enhanced_core_components requires sympy")
+class TestSevenUniversalPrinciples(unittest.TestCase):
+
+    def setUp(self):
+        from enhanced_core_components import SevenUniversalPrinciples
+        self.principles = SevenUniversalPrinciples()
+
+    def test_calculate_system_harmony(self):
+        """
+        Tests that harmony averages every principle's interaction row over the four state axes (this used to raise IndexError).
+        """
+        # The first four columns of the 7x7 principle matrix sum to 12.196
+        self.assertAlmostEqual(self.principles.calculate_system_harmony(np.ones(4)), 12.196 / 4 / 49)
+        self.assertAlmostEqual(self.principles.calculate_system_harmony(np.array([0.9, 0.2, 0.7, 0.4])),
+                               0.03479387755102041)
+
+    def test_analyze_system_state(self):
+        """
+        Tests that analyzing a system state reports harmony and one activation per principle.
+        """
+        state = np.array([0.9, 0.2, 0.7, 0.4])
+        analysis = self.principles.analyze_system_state(state)
+        self.assertEqual(analysis['harmony'], self.principles.calculate_system_harmony(state))
+        self.assertEqual(len(analysis['principle_activations']), 7)
+        self.assertEqual(analysis['stability_assessment']['stability_level'], 'low')
+
+if __name__ == '__main__':
+    unittest.main()
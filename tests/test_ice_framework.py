@@ -32,6 +32,19 @@ class TestICEFramework(unittest.TestCase):
         self.assertIn('divine_alignment', result)
         self.assertIn('cycle_analysis', result)
 
+    def test_process_thought_batch(self):
+        """
+        Tests that batch processing matches processing each thought individually.
+        """
+        thoughts = ["love and justice", "wisdom and power", "love and justice"]
+        thought_type = ThoughtType.BIBLICAL_UNDERSTANDING
+        domain = ContextDomain.BIBLICAL
+
+        batch = self.framework.process_thought_batch(thoughts, thought_type, domain)
+        single = [self.framework.process_thought(thought, thought_type, domain) for thought in thoughts]
+        self.assertEqual(batch, single)
+        self.assertIsNot(batch[0], batch[2])
+
     def test_cycle_analysis(self):
         """
         Tests the cycle_analysis method.
@@ -0,0 +1,46 @@
+"""
+Tests for the single-pass keyword scanner.
+"""
+
+import unittest
+from src.keyword_scanner import KeywordScanner, KeywordWeights
+
+class TestKeywordScanner(unittest.TestCase):
+
+    def test_matches_substring_semantics(self):
+        """
+        Tests that results equal `keyword in text` for every keyword, including
+        keywords nested inside or prefixing other keywords.
+        """
+        keywords = ['care', 'careless', 'caring', 'evidence', 'evidence-based',
+                    'fair', 'unfair', 'honest', 'honesty', 'dishonest', 'kind']
+        scanner = KeywordScanner(keywords)
+        texts = [
+            "a careless, unfair and dishonest approach",
+            "evidence-based honesty",
+            "kindness without care",
+            "nothing relevant here",
+            "",
+        ]
+        for text in texts:
+            expected = {kw for kw in keywords if kw in text}
+            self.assertEqual(scanner.find(text), expected, text)
+
+    def test_empty_vocabulary(self):
+        """
+        Tests that a scanner without keywords never matches.
+        """
+        self.assertEqual(KeywordScanner([]).find("anything"), set())
+
+    def test_weights_return_matched_entries_in_table_order(self):
+        """
+        Tests that a weighted table yields exactly the entries a full scan would, in table order.
+        """
+        entries = [(0, 'kind', 0.2), (1, 'fair', 0.3), (0, 'care', 0.1), (3, 'kind', 0.4), (2, 'unfair', 0.5)]
+        table = KeywordWeights(entries)
+        for text in ["unfair but kind care", "fair", "nothing", ""]:
+            expected = [entry for entry in entries if entry[1] in text]
+            self.assertEqual(table.matches(text), expected, text)
+
+if __name__ == '__main__':
+    unittest.main()
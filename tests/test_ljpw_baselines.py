@@ -0,0 +1,38 @@
+"""
+Tests for the LJPW mathematical baselines.
+"""
+
+import unittest
+import numpy as np
+from src.ljpw_baselines import LJPWBaselines, DynamicLJPWv3
+
+class TestLJPWBaselines(unittest.TestCase):
+
+    def test_metrics_batch_matches_full_diagnostic(self):
+        """
+        Tests that batched metrics agree with the per-point diagnostic, zero coordinates included.
+        """
+        rng = np.random.default_rng(3)
+        coords = np.vstack([rng.random((20, 4)), [[0.0, 0.5, 0.5, 0.5], [1.0, 1.0, 1.0, 1.0]]])
+        batch = LJPWBaselines.metrics_batch(coords)
+        for i, (L, J, P, W) in enumerate(coords.tolist()):
+            diagnostic = LJPWBaselines.full_diagnostic(L, J, P, W)
+            for name, expected in diagnostic['distances'].items():
+                self.assertAlmostEqual(batch[name][i], expected)
+            for name, expected in diagnostic['metrics'].items():
+                self.assertAlmostEqual(batch[name][i], expected)
+
+    def test_simulate_trajectory_matches_history(self):
+        """
+        Tests that the array trajectory holds the same samples as the simulate history lists.
+        """
+        simulator = DynamicLJPWv3()
+        times, trajectory = simulator.simulate_trajectory((0.2, 0.3, 0.9, 0.2), duration=5, dt=0.05)
+        history = simulator.simulate((0.2, 0.3, 0.9, 0.2), duration=5, dt=0.05)
+        self.assertEqual(trajectory.shape, (len(history['t']), 4))
+        self.assertEqual(times.tolist(), history['t'])
+        for column, axis in zip(trajectory.T, 'LJPW'):
+            self.assertEqual(column.tolist(), history[axis])
+
+if __name__ == '__main__':
+    unittest.main()
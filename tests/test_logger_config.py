@@ -0,0 +1,103 @@
+"""
+Tests for the logging infrastructure.
+"""
+
+import logging
+import os
+import tempfile
+import unittest
+from unittest import mock
+from src import logger_config
+from src.logger_config import BackgroundRotatingFileHandler, LoggerConfig, LogThrottle
+
+class TestLogThrottle(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 100.0
+        patcher = mock.patch('src.logger_config.time.monotonic', lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_duplicates_suppressed_within_window(self):
+        """
+        Tests that repeats inside the window are dropped and reported afterwards.
+        """
+        throttle = LogThrottle(window=5.0, rate=1000.0)
+        self.assertEqual(throttle.check("x", logging.INFO, "hello"), (True, 0, 0))
+        self.assertEqual(throttle.check("x", logging.INFO, "hello"), (False, 0, 0))
+        self.assertEqual(throttle.check("x", logging.INFO, "hello"), (False, 0, 0))
+        self.assertEqual(throttle.check("x", logging.INFO, "other"), (True, 0, 0))
+        self.now += 5.0
+        self.assertEqual(throttle.check("x", logging.INFO, "hello"), (True, 2, 0))
+
+    def test_flush_reports_pending_counts(self):
+        """
+        Tests that flush drains unreported duplicate counts once.
+        """
+        throttle = LogThrottle(window=5.0)
+        throttle.check("x", logging.DEBUG, "tick")
+        throttle.check("x", logging.DEBUG, "tick")
+        self.assertEqual(throttle.flush(), [("x", logging.DEBUG, "tick", 1, 0)])
+        self.assertEqual(throttle.flush(), [])
+
+    def test_rate_limit(self):
+        """
+        Tests that rate-limited drops are counted against the message that was dropped.
+        """
+        throttle = LogThrottle(window=5.0, rate=3.0)
+        emitted = [throttle.check("x", logging.INFO, f"m{i}")[0] for i in range(5)]
+        self.assertEqual(emitted, [True, True, True, False, False])
+        self.now += 1.0
+        self.assertEqual(throttle.check("x", logging.INFO, "m5"), (True, 0, 0))
+        self.assertEqual(throttle.check("x", logging.INFO, "m3"), (True, 0, 1))
+        self.assertEqual(throttle.flush(), [("x", logging.INFO, "m4", 0, 1)])
+
+    def test_summaries_flushed_on_later_emit(self):
+        """
+        Tests that pending drops are logged once a window has passed, on the next emitted message.
+        """
+        with mock.patch.object(logger_config, '_log_throttle', LogThrottle(window=5.0)), \
+                self.assertLogs("throttle_test", level=logging.INFO) as logs:
+            logger_config.log_info("tick", "throttle_test")
+            logger_config.log_info("tick", "throttle_test")
+            self.now += 5.0
+            logger_config.log_info("tock", "throttle_test")
+        self.assertEqual([r.getMessage() for r in logs.records],
+                         ["tick", "tock", "tick (suppressed 1 repeated messages)"])
+
+class TestBackgroundRotatingFileHandler(unittest.TestCase):
+
+    def test_rotation_keeps_all_records(self):
+        """
+        Tests that background rotation produces the usual backup files without losing records.
+        """
+        with tempfile.TemporaryDirectory() as log_dir:
+            path = os.path.join(log_dir, "test.log")
+            handler = BackgroundRotatingFileHandler(path, maxBytes=40, backupCount=3)
+            handler.setFormatter(logging.Formatter('%(message)s'))
+            for i in range(4):
+                handler.emit(logging.makeLogRecord({'msg': f"record number {i:02d} padding"}))
+            handler.close()
+
+            self.assertEqual(sorted(os.listdir(log_dir)), ["test.log", "test.log.1", "test.log.2", "test.log.3"])
+            with open(path + ".3") as oldest, open(path) as newest:
+                self.assertEqual(oldest.read(), "record number 00 padding\n")
+                self.assertEqual(newest.read(), "record number 03 padding\n")
+
+    def test_background_rotation_is_opt_in(self):
+        """
+        Tests that file logging keeps the standard rotating handler unless asked otherwise.
+        """
+        root_handlers = logging.getLogger().handlers[:]
+        self.addCleanup(setattr, logging.getLogger(), 'handlers', root_handlers)
+        with tempfile.TemporaryDirectory() as log_dir:
+            for env, expected in (({'SSDB_ASYNC_LOG_ROTATION': ''}, logging.handlers.RotatingFileHandler),
+                                  ({'SSDB_ASYNC_LOG_ROTATION': '1'}, BackgroundRotatingFileHandler)):
+                with mock.patch.dict(os.environ, env):
+                    LoggerConfig(log_to_file=True, log_dir=log_dir)
+                file_handler = logging.getLogger().handlers[-1]
+                self.assertIs(type(file_handler), expected)
+                file_handler.close()
+
+if __name__ == '__main__':
+    unittest.main()
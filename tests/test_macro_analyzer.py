@@ -0,0 +1,115 @@
+"""
+Tests for the macro-analysis engine.
+"""
+
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+import numpy as np
+from src import macro_analyzer
+
+class _StrictKmeans:
+    """Stand-in for faiss.Kmeans that rejects input faiss itself cannot take."""
+
+    def __init__(self, d, k, **kwargs):
+        self.k = k
+        self.index = self
+
+    @staticmethod
+    def _check(x):
+        if x.dtype != np.float32 or not x.flags['C_CONTIGUOUS']:
+            raise TypeError("faiss requires C-contiguous float32 input")
+
+    def train(self, x):
+        self._check(x)
+        self.centroids = x[:self.k].copy()
+
+    def search(self, x, k):
+        self._check(x)
+        distances = ((x[:, None, :] - self.centroids[None, :, :]) ** 2).sum(axis=2)
+        labels = distances.argmin(axis=1)[:, None]
+        return distances.min(axis=1)[:, None], labels
+
+class TestMacroAnalyzer(unittest.TestCase):
+
+    def setUp(self):
+        start = datetime(2024, 1, 1)
+        self.concepts = [
+            {'concept_text': 'a', 'love': 0.9, 'justice': 0.1, 'power': 0.1, 'wisdom': 0.1, 'created_at': start + timedelta(days=3)},
+            {'concept_text': 'b', 'love': 0.8, 'justice': 0.2, 'power': 0.1, 'wisdom': 0.2, 'created_at': start + timedelta(days=0)},
+            {'concept_text': 'c', 'love': 0.1, 'justice': 0.9, 'power': 0.8, 'wisdom': 0.1, 'created_at': start + timedelta(days=2)},
+            {'concept_text': 'd', 'love': 0.2, 'justice': 0.8, 'power': 0.9, 'wisdom': 0.2, 'created_at': start + timedelta(days=1)},
+        ]
+
+    def test_coords_matrix_layout(self):
+        """
+        Tests that coordinates are packed as a float32 (N, 4) matrix in axis order.
+        """
+        matrix = macro_analyzer._coords_matrix(self.concepts)
+        self.assertEqual(matrix.shape, (4, 4))
+        self.assertEqual(str(matrix.dtype), 'float32')
+        self.assertAlmostEqual(float(matrix[2, 1]), 0.9, places=5)
+
+    def test_analysis_sees_in_place_changes(self):
+        """
+        Tests that editing or extending the same concept list is reflected on the next analysis.
+        """
+        macro_analyzer.calculate_semantic_center_of_gravity(self.concepts)
+        self.concepts[0]['love'] = 0.1
+        self.concepts.append(dict(self.concepts[1], concept_text='e', love=0.2))
+        center = macro_analyzer.calculate_semantic_center_of_gravity(self.concepts)
+        self.assertAlmostEqual(center['love'], 0.28, places=5)
+
+    def test_center_of_gravity(self):
+        """
+        Tests the semantic center of gravity calculation.
+        """
+        center = macro_analyzer.calculate_semantic_center_of_gravity(self.concepts)
+        self.assertAlmostEqual(center['love'], 0.5, places=5)
+        self.assertAlmostEqual(center['power'], 0.475, places=5)
+        matrix = macro_analyzer._coords_matrix(self.concepts)
+        self.assertEqual(macro_analyzer.calculate_center_of_gravity_from_matrix(matrix), center)
+
+    def test_clusters_of_meaning(self):
+        """
+        Tests that clearly separated concepts land in separate clusters.
+        """
+        clusters = macro_analyzer.identify_clusters_of_meaning(self.concepts, num_clusters=2)
+        groups = sorted(sorted(c['concepts']) for c in clusters.values())
+        self.assertEqual(groups, [['a', 'b'], ['c', 'd']])
+
+    def test_faiss_branch_takes_any_matrix_layout(self):
+        """
+        Tests that the faiss clustering branch converts float64 and sliced matrices before searching.
+        """
+        faiss = mock.Mock(Kmeans=_StrictKmeans)
+        matrix = np.array([[c[axis] for axis in macro_analyzer.AXES] for c in self.concepts])
+        with mock.patch.object(macro_analyzer, 'faiss', faiss), \
+                mock.patch.object(macro_analyzer, 'FAISS_MIN_CONCEPTS', 1):
+            for coords in (matrix, np.asfortranarray(matrix)[::-1]):
+                centers, labels = macro_analyzer._fit_kmeans(coords, 2)
+                self.assertEqual(centers.shape, (2, 4))
+                self.assertEqual(labels.shape, (4,))
+
+    def test_semantic_trends(self):
+        """
+        Tests that trends compare the older half against the newer half.
+        """
+        trends = macro_analyzer.analyze_semantic_trends(self.concepts)
+        # Older half is {b, d}; newer half is {c, a}
+        self.assertAlmostEqual(trends['period_1_center']['love'], 0.5, places=5)
+        self.assertAlmostEqual(trends['trend']['wisdom'], -0.1, places=5)
+        # The caller's list must not be reordered
+        self.assertEqual([c['concept_text'] for c in self.concepts], ['a', 'b', 'c', 'd'])
+
+    def test_semantic_trends_sqlite_timestamps(self):
+        """
+        Tests that created_at strings as returned by SQLite are accepted.
+        """
+        for concept in self.concepts:
+            concept['created_at'] = concept['created_at'].strftime('%Y-%m-%d %H:%M:%S')
+        trends = macro_analyzer.analyze_semantic_trends(self.concepts)
+        self.assertAlmostEqual(trends['period_1_center']['love'], 0.5, places=5)
+
+if __name__ == '__main__':
+    unittest.main()
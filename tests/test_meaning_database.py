@@ -4,6 +4,8 @@ Tests for the refactored MeaningDatabase class.
 
 import unittest
 import os
+import tempfile
+from unittest import mock
 from src.meaning_database import MeaningDatabase
 from src.meaning_model import MeaningModel
 from src.baseline_biblical_substrate import BiblicalSemanticSubstrate
@@ -44,6 +46,120 @@ class TestMeaningDatabase(unittest.TestCase):
         self.assertIsNotNone(retrieved_concept)
         self.assertEqual(retrieved_concept['concept_text'], text)
 
+    def test_store_many(self):
+        """
+        Tests that bulk stores match single stores and upsert existing concepts.
+        """
+        context = "biblical"
+        existing_id = self.db.store_concept("divine love", context)
+        texts = ["divine justice", "divine love", "wisdom and understanding"]
+
+        concept_ids = self.db.store_many(texts, context)
+        self.assertEqual(concept_ids[1], existing_id)
+        for text, concept_id in zip(texts, concept_ids):
+            retrieved = self.db.get_concept(text, context)
+            self.assertEqual(retrieved['id'], concept_id)
+            coords = self.db.meaning_model.calculate_coordinates(text, context)
+            self.assertAlmostEqual(retrieved['love'], coords['love'])
+
+    def test_get_concept_columns(self):
+        """
+        Tests that the column view lines up with the stored concept rows.
+        """
+        self.db.store_many(["divine love", "divine justice", "wisdom and understanding"], "biblical")
+        concepts = self.db.get_all_concepts()
+        texts, created_at, coords = self.db.get_concept_columns()
+        self.assertEqual(texts, [c['concept_text'] for c in concepts])
+        self.assertEqual(created_at, [c['created_at'] for c in concepts])
+        self.assertEqual(coords.shape, (3, 4))
+        self.assertEqual(str(coords.dtype), 'float32')
+        self.assertTrue(coords.flags['C_CONTIGUOUS'])
+        for concept, row in zip(concepts, coords.tolist()):
+            expected = [concept[axis] for axis in ('love', 'justice', 'power', 'wisdom')]
+            for value, stored in zip(row, expected):
+                self.assertAlmostEqual(value, stored, places=6)
+
+    def test_coords_snapshot_reused_on_reopen(self):
+        """
+        Tests that the coordinate index is mapped from its snapshot when the database is unchanged.
+        """
+        meaning_model = self.db.meaning_model
+        with tempfile.TemporaryDirectory() as directory, \
+                mock.patch.dict(os.environ, {"SSDB_COORDS_SNAPSHOT": "1"}):
+            db_path = os.path.join(directory, "snapshot.db")
+            db = MeaningDatabase(db_path, meaning_model)
+            db.store_many(["divine love", "divine justice"], "biblical")
+            expected = [r['id'] for r in db.natural_query("divine love", "biblical")]
+            db.close()
+
+            db = MeaningDatabase(db_path, meaning_model)
+            self.assertEqual([r['id'] for r in db.natural_query("divine love", "biblical")], expected)
+            self.assertEqual(db._snapshot_generation, 0)
+            db.store_concept("wisdom", "biblical")
+            db.close()
+
+            db = MeaningDatabase(db_path, meaning_model)
+            db.conn.execute("DELETE FROM semantic_coordinates WHERE concept_text = 'wisdom'")
+            db.conn.commit()
+            self.assertEqual(len(db._get_coordinate_index()), 2)
+            self.assertIsNone(db._snapshot_generation)
+            db.close()
+
+    def test_default_model_built_once(self):
+        """
+        Tests that a database built without a model wires one shared MeaningModel and ICE framework.
+        """
+        with mock.patch.object(MeaningModel, 'create_default', wraps=MeaningModel.create_default) as create:
+            db = MeaningDatabase(":memory:")
+        self.assertEqual(create.call_count, 1)
+        self.assertIs(db.ice_framework.meaning_model, db.meaning_model)
+        self.assertIs(db.meaning_model.semantic_engine.ice_framework, db.ice_framework)
+        db.close()
+
+    def test_query_by_proximity_sees_other_connections(self):
+        """
+        Tests that a loaded coordinate index picks up concepts stored through another connection.
+        """
+        target = {'love': 0.5, 'power': 0.5, 'wisdom': 0.5, 'justice': 0.5}
+        self.db.store_concept("grace", "biblical")
+        self.assertEqual(len(self.db.query_by_proximity(target, 5.0)), 1)
+        self.assertIsNotNone(self.db._coordinate_index)
+
+        other = MeaningDatabase(self.db_path, self.db.meaning_model)
+        other.store_concept("divine love", "biblical")
+        other.close()
+
+        self.assertEqual(len(self.db.query_by_proximity(target, 5.0)), 2)
+        self.assertEqual(len(self.db.query_by_proximity(target, 5.0)), 2)
+
+    def test_query_by_proximity_rtree_matches_index(self):
+        """
+        Tests that radius queries pruned by the R*Tree match the coordinate index, and track writes.
+        """
+        context = "biblical"
+        self.db.store_concept("grace", context)
+        with mock.patch.dict(os.environ, {"SSDB_RTREE_INDEX": "1"}):
+            db = MeaningDatabase(self.db_path, self.db.meaning_model)
+        self.assertTrue(db._rtree_available)
+        ids = db.store_many(["divine love", "divine justice", "wisdom and understanding", "power"], context)
+        db.store_concept("divine love", "business")
+        db.update_concept_coordinates(ids[3], {'love': 0.5, 'power': 0.5, 'wisdom': 0.5, 'justice': 0.5})
+        db.delete_concept(ids[1])
+
+        target = {'love': 0.5, 'power': 0.5, 'wisdom': 0.6, 'justice': 0.5}
+        queries = [(2.0, None, 10), (0.8, context, 10), (2.0, None, 2)]
+        pruned = [db.query_by_proximity(target, *query) for query in queries]
+        self.assertIsNone(db._coordinate_index)
+        db._get_coordinate_index()
+        for query, rtree_results in zip(queries, pruned):
+            indexed = db.query_by_proximity(target, *query)
+            self.assertEqual([r['id'] for r in rtree_results], [r['id'] for r in indexed])
+            for a, b in zip(rtree_results, indexed):
+                self.assertAlmostEqual(a['semantic_distance'], b['semantic_distance'])
+        self.assertEqual(len(pruned[0]), 5)
+        self.assertNotIn(ids[1], [r['id'] for r in pruned[0]])
+        db.close()
+
     def test_natural_query(self):
         """
         Tests the natural language query functionality.
@@ -63,6 +179,85 @@ class TestMeaningDatabase(unittest.TestCase):
         # The first result should be the most semantically similar
         self.assertEqual(results[0]['concept_text'], text1)
 
+    def test_search_semantic_min_similarity(self):
+        """
+        Tests that search_semantic drops matches below the similarity threshold.
+        """
+        context = "biblical"
+        for text in ["divine love", "divine justice", "wisdom and understanding", "power"]:
+            self.db.store_concept(text, context)
+
+        default = self.db.search_semantic("divine love", context)
+        self.assertEqual(default, self.db.search_semantic("divine love", context, min_similarity=0.5, ef_search=64))
+        strict = self.db.search_semantic("divine love", context, min_similarity=0.9)
+        self.assertTrue(all(r['semantic_similarity'] >= 0.9 for r in strict))
+        self.assertEqual([r['id'] for r in strict],
+                         [r['id'] for r in default if r['semantic_similarity'] >= 0.9])
+
+    def test_natural_query_text_prefilter(self):
+        """
+        Tests that the full-text prefilter ranks only word-sharing concepts and tracks deletes.
+        """
+        context = "biblical"
+        ids = {text: self.db.store_concept(text, context)
+               for text in ["divine love", "divine justice", "wisdom and understanding"]}
+        self.db.store_concept("divine love", "business")
+
+        full = self.db.natural_query("divine love", context)
+        prefiltered = self.db.natural_query("divine love", context, text_prefilter=True)
+        self.assertEqual([r['id'] for r in prefiltered],
+                         [r['id'] for r in full if r['concept_text'] != "wisdom and understanding"])
+        self.assertEqual(prefiltered[0]['semantic_similarity'], full[0]['semantic_similarity'])
+
+        self.db.delete_concept(ids["divine love"])
+        remaining = self.db.natural_query("divine love", context, text_prefilter=True)
+        self.assertNotIn(ids["divine love"], [r['id'] for r in remaining])
+
+    def test_natural_query_cache_invalidated_on_write(self):
+        """
+        Tests that repeated queries are served from cache until a concept is stored.
+        """
+        context = "biblical"
+        self.db.store_concept("divine love", context)
+
+        first = self.db.natural_query("what is divine love?", context)
+        self.assertEqual(len(self.db._query_cache), 1)
+        second = self.db.natural_query("what is divine love?", context)
+        self.assertEqual([r['id'] for r in first], [r['id'] for r in second])
+
+        self.db.store_concept("divine love and mercy", context)
+        third = self.db.natural_query("what is divine love?", context)
+        self.assertEqual(len(third), len(first) + 1)
+
+    def test_delete_concept(self):
+        """
+        Tests that deleted concepts are no longer returned by semantic search.
+        """
+        context = "biblical"
+        concept_id = self.db.store_concept("divine love", context)
+        self.assertEqual(len(self.db.natural_query("divine love", context)), 1)
+
+        self.assertTrue(self.db.delete_concept(concept_id))
+        self.assertFalse(self.db.delete_concept(concept_id))
+        self.assertEqual(self.db.natural_query("divine love", context), [])
+
+    def test_natural_query_batch(self):
+        """
+        Tests that batched queries return the same results as one-at-a-time queries.
+        """
+        context = "biblical"
+        for text in ["divine love", "divine justice", "wisdom and understanding"]:
+            self.db.store_concept(text, context)
+
+        queries = ["what is divine love?", "justice and truth", "what is divine love?"]
+        batch = self.db.natural_query_batch(queries, context)
+        self.db._query_cache.clear()
+        single = [self.db.natural_query(query, context) for query in queries]
+
+        self.assertEqual(len(batch), 3)
+        for batch_results, single_results in zip(batch, single):
+            self.assertEqual([r['id'] for r in batch_results], [r['id'] for r in single_results])
+
     def test_process_thought(self):
         """
         Tests the ICE framework integration for processing thoughts.
@@ -79,5 +274,37 @@ class TestMeaningDatabase(unittest.TestCase):
         self.assertIsNotNone(retrieved_concept)
         self.assertEqual(retrieved_concept['id'], concept_id)
 
+    def test_process_thought_batch(self):
+        """
+        Tests that batch-processed thoughts are stored in one pass with ids in input order.
+        """
+        thoughts = ["Serve the poor with love", "Seek wisdom daily", "Serve the poor with love"]
+        domain = ContextDomain.PERSONAL
+
+        concept_ids = self.db.process_thought_batch(thoughts, ThoughtType.SPIRITUAL_GUIDANCE, domain)
+        self.assertEqual(len(concept_ids), 3)
+        self.assertEqual(concept_ids[0], concept_ids[2])
+        for thought, concept_id in zip(thoughts, concept_ids):
+            self.assertEqual(self.db.get_concept(thought, domain.value)['id'], concept_id)
+
+    def test_process_thoughts_bulk(self):
+        """
+        Tests that mixed-domain bulk processing matches per-group batches, with ids in input order.
+        """
+        items = [
+            ("Serve the poor with love", ThoughtType.SPIRITUAL_GUIDANCE, ContextDomain.PERSONAL),
+            ("Lead the team with integrity", ThoughtType.PRACTICAL_WISDOM, ContextDomain.BUSINESS),
+            ("Seek wisdom daily", ThoughtType.SPIRITUAL_GUIDANCE, ContextDomain.PERSONAL),
+        ]
+        concept_ids = self.db.process_thoughts_bulk(items)
+        self.assertEqual(len(set(concept_ids)), 3)
+        for (thought, _, domain), concept_id in zip(items, concept_ids):
+            self.assertEqual(self.db.get_concept(thought, domain.value)['id'], concept_id)
+
+        personal = self.db.process_thought_batch([items[0][0], items[2][0]], ThoughtType.SPIRITUAL_GUIDANCE,
+                                                 ContextDomain.PERSONAL)
+        self.assertEqual(personal, [concept_ids[0], concept_ids[2]])
+        self.assertEqual(self.db.process_thoughts_bulk([]), [])
+
 if __name__ == '__main__':
     unittest.main()
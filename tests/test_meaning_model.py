@@ -3,7 +3,9 @@ Tests for the MeaningModel class.
 """
 
 import unittest
-from src.meaning_model import MeaningModel
+from unittest import mock
+import numpy as np
+from src.meaning_model import MeaningModel, _concept_metric_rows
 from src.baseline_biblical_substrate import BiblicalSemanticSubstrate
 from src.ice_framework import ICEFramework
 
@@ -16,6 +18,57 @@ class TestMeaningModel(unittest.TestCase):
         self.model = MeaningModel(semantic_engine)
         ice_framework.meaning_model = self.model
 
+    def test_calculate_coordinates_batch(self):
+        """
+        Tests that batch coordinates match one-at-a-time coordinates.
+        """
+        texts = ["love and mercy", "justice", "love and mercy"]
+        batch = self.model.calculate_coordinates_batch(texts, "biblical")
+        self.assertEqual(batch, [self.model.calculate_coordinates(text, "biblical") for text in texts])
+
+    def test_batch_metrics_match_scalar(self):
+        """
+        Tests that the packed-matrix metrics agree with the per-dict methods.
+        """
+        samples = [
+            {'love': 0.1, 'justice': 0.2, 'power': 0.3, 'wisdom': 0.4},
+            {'love': 1.0, 'justice': 1.0, 'power': 1.0, 'wisdom': 1.0},
+            {'love': 0.0, 'justice': 0.0, 'power': 1.0, 'wisdom': 0.0},
+        ]
+        matrix = self.model.pack(samples)
+        self.assertEqual(matrix.shape, (3, 4))
+        target = samples[0]
+        for i, coords in enumerate(samples):
+            self.assertAlmostEqual(self.model.semantic_distance_batch(matrix, target)[i],
+                                   self.model.semantic_distance(coords, target))
+            self.assertAlmostEqual(self.model.divine_resonance_batch(matrix)[i], self.model.divine_resonance(coords))
+            self.assertAlmostEqual(self.model.distance_from_jehovah_batch(matrix)[i],
+                                   self.model.distance_from_jehovah(coords))
+            self.assertAlmostEqual(self.model.biblical_balance_batch(matrix)[i], self.model.biblical_balance(coords))
+
+    def test_scalar_metrics_accept_axis_ordered_sequences(self):
+        """
+        Tests that the scalar metrics give the same answers for dicts and AXES-ordered tuples.
+        """
+        coords = {'wisdom': 0.4, 'power': 0.3, 'justice': 0.2, 'love': 0.1}
+        vector = (0.1, 0.2, 0.3, 0.4)
+        self.assertEqual(self.model.divine_resonance(coords), self.model.divine_resonance(vector))
+        self.assertEqual(self.model.distance_from_jehovah(coords), self.model.distance_from_jehovah(vector))
+        self.assertEqual(self.model.biblical_balance(coords), self.model.biblical_balance(vector))
+        self.assertAlmostEqual(self.model.biblical_balance(coords), 1 - np.std(vector) / 0.5)
+
+    def test_fused_metric_kernel_matches_numpy(self):
+        """
+        Tests that the fused metric kernel agrees with the separate batch methods.
+        """
+        matrix = np.random.default_rng(3).random((50, 4))
+        anchor = np.array([self.model.anchor_point[axis] for axis in ('love', 'justice', 'power', 'wisdom')])
+        expected = (self.model.divine_resonance_batch(matrix), self.model.distance_from_jehovah_batch(matrix),
+                    self.model.biblical_balance_batch(matrix))
+        for fused in (self.model.concept_metrics_batch(matrix), _concept_metric_rows(matrix, anchor)):
+            for column, reference in zip(fused, expected):
+                np.testing.assert_allclose(column, reference)
+
     def test_calculate_coordinates_deterministic(self):
         """
         Tests that the coordinate generation is deterministic.
@@ -106,6 +159,17 @@ class TestMeaningModel(unittest.TestCase):
         self.assertTrue(truth_score > 0.5)
         self.assertTrue(deception_score < 0.5)
 
+    def test_truth_reference_computed_once(self):
+        """
+        Tests that 'divine truth' is analyzed once per semantic engine, not per truth_sense call.
+        """
+        expected = self.model.truth_sense("truth and justice are important")
+        engine = self.model.semantic_engine
+        with mock.patch.object(engine, 'analyze_concept', wraps=engine.analyze_concept) as analyze:
+            self.assertEqual(self.model.truth_sense("truth and justice are important"), expected)
+            self.model.truth_sense("deception and lies are good")
+        self.assertNotIn(mock.call("divine truth", "biblical"), analyze.call_args_list)
+
     def test_calculate_growth_vector(self):
         """
         Tests the growth vector calculation.
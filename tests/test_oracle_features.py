@@ -4,10 +4,16 @@ Tests for the new "Oracle" features, including the enriched payload and macro-an
 
 import unittest
 import os
+import numpy as np
 from src.meaning_database import MeaningDatabase
 from src.meaning_model import MeaningModel
 from src.baseline_biblical_substrate import BiblicalSemanticSubstrate
 from src.ice_framework import ICEFramework
+from src.oracle_payload_generator import (
+    PAYLOAD_AXES,
+    generate_oracle_payload,
+    generate_oracle_payloads
+)
 
 class TestOracleFeatures(unittest.TestCase):
 
@@ -46,6 +52,16 @@ class TestOracleFeatures(unittest.TestCase):
         # Check for a specific warning we'd expect
         self.assertTrue(any("Low alignment with 'Love'" in w for w in concept['warnings']))
 
+    def test_batch_payloads_match_single(self):
+        """
+        Tests that column-wise payload generation matches the per-concept payload, ties included.
+        """
+        coords = np.array([[0.9, 0.2, 0.7, 0.4], [0.1, 0.5, 0.9, 0.2], [0.5, 0.5, 0.5, 0.5], [0.0, 0.0, 0.0, 0.0]])
+        payloads = generate_oracle_payloads(coords)
+        for i, row in enumerate(coords):
+            expected = generate_oracle_payload(dict(zip(PAYLOAD_AXES, row.tolist())))
+            self.assertEqual({key: column[i] for key, column in payloads.items()}, expected)
+
     def test_semantic_overview(self):
         """
         Tests the get_semantic_overview method.
@@ -0,0 +1,72 @@
+"""
+Tests for the primer alignment validator.
+"""
+
+import unittest
+import os
+import io
+import sys
+from contextlib import redirect_stdout
+from unittest import mock
+
+# primer_validator imports its siblings as top-level modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from semantic_substrate_database import SemanticSubstrateDatabase
+from primer_validator import PrimerValidator
+
+class TestPrimerValidator(unittest.TestCase):
+
+    def setUp(self):
+        self.db_path = "test_primer_validator.db"
+        if os.path.exists(self.db_path):
+            os.remove(self.db_path)
+
+        self.db = SemanticSubstrateDatabase(self.db_path)
+        # Primer tables are created by the ingestion script, not the substrate schema
+        self.db.conn.executescript("""
+            CREATE TABLE universal_principles (
+                principle_number INTEGER PRIMARY KEY, name TEXT, statement TEXT, substrate_role TEXT
+            );
+            CREATE TABLE semantic_units (coordinate_id INTEGER);
+        """)
+        self.ids = [self.db.store_concept(text, "biblical") for text in ("love", "grace", "wisdom")]
+        self.db.conn.execute("INSERT INTO semantic_units VALUES (?)", (self.ids[0],))
+        self.validator = PrimerValidator(self.db)
+
+    def tearDown(self):
+        self.db.close()
+        if os.path.exists(self.db_path):
+            os.remove(self.db_path)
+
+    def test_validate_database_scores_in_bulk(self):
+        """
+        Tests that validate_database scores every concept column-wise, without per-concept lookups.
+        """
+        per_concept = [self.validator.validate_concept(concept_id) for concept_id in self.ids]
+
+        with mock.patch.object(self.validator, '_validate_principle_4', side_effect=AssertionError), \
+                redirect_stdout(io.StringIO()):
+            report = self.validator.validate_database()
+
+        self.assertEqual(report['total_concepts'], 3)
+        for num in range(1, 8):
+            expected = sum(v['principle_compliance'][num]['score'] for v in per_concept) / 3
+            self.assertAlmostEqual(report['principle_scores'][num], expected)
+        self.assertEqual(report['principle_scores'][4], PrimerValidator.UNVERIFIED_RELATIONSHIP_SCORE)
+
+    def test_validate_database_writes_once(self):
+        """
+        Tests that the header and the report reach stdout in a single write.
+        """
+        out = io.StringIO()
+        with mock.patch.object(out, 'write', wraps=out.write) as write, redirect_stdout(out):
+            self.validator.validate_database()
+
+        self.assertEqual(write.call_count, 1)
+        self.assertTrue(out.getvalue().startswith(
+            f"\n{'='*70}\nDATABASE-WIDE PRIMER VALIDATION\n{'='*70}\n\nValidating 3 concepts...\n\n{'='*70}\nVALIDATION REPORT\n"
+        ))
+
+if __name__ == '__main__':
+    unittest.main()
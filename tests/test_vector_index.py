@@ -0,0 +1,138 @@
+"""
+Tests for the in-memory coordinate index.
+"""
+
+import math
+import tempfile
+import unittest
+from unittest import mock
+import numpy as np
+from src import vector_index
+from src.vector_index import CoordinateIndex
+
+class TestCoordinateIndex(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.coords = np.round(rng.random((200, 4)), 1)
+        self.contexts = ['biblical' if i % 3 else 'business' for i in range(200)]
+        self.ids = list(range(1, 201))
+        self.index = CoordinateIndex()
+        self.index.add_many(self.ids, self.contexts, self.coords)
+
+    def _brute_force(self, target, k, max_distance, context):
+        matches = []
+        for concept_id, ctx, row in zip(self.ids, self.contexts, self.coords):
+            if context is not None and ctx != context:
+                continue
+            distance = math.sqrt(sum((a - b) ** 2 for a, b in zip(row, target)))
+            if distance <= max_distance:
+                matches.append((distance, concept_id))
+        matches.sort()
+        return [concept_id for _, concept_id in matches[:k]]
+
+    def test_search_matches_brute_force(self):
+        """
+        Tests that search returns the same ordered ids as a linear scan, ties included.
+        """
+        target = (0.5, 0.4, 0.6, 0.5)
+        for k, max_distance, context in [(10, 0.5, None), (5, 1.0, 'business'), (50, 0.3, 'biblical')]:
+            ids, distances = self.index.search(target, k, max_distance=max_distance, context=context)
+            self.assertEqual(ids.tolist(), self._brute_force(target, k, max_distance, context))
+            self.assertTrue(np.all(np.diff(distances) >= 0))
+
+    def test_quantized_screening_is_exact(self):
+        """
+        Tests that int8 screening never changes results, including out-of-range rows.
+        """
+        self.index.add(999, 'biblical', (1.8, -0.2, 0.5, 0.5))
+        self.ids.append(999)
+        self.contexts.append('biblical')
+        self.coords = np.vstack([self.coords, [1.8, -0.2, 0.5, 0.5]])
+        with mock.patch.object(vector_index, 'QUANT_MIN_ITEMS', 1):
+            for target in [(0.5, 0.4, 0.6, 0.5), (1.7, -0.1, 0.5, 0.5)]:
+                ids, _ = self.index.search(target, 7, max_distance=0.8)
+                self.assertEqual(ids.tolist(), self._brute_force(target, 7, 0.8, None))
+
+    def test_quantized_screening_ignores_out_of_range_bound(self):
+        """
+        Tests that an out-of-range row cannot tighten the screening bound and hide the true nearest rows.
+        """
+        rng = np.random.default_rng(11)
+        coords = 0.4 + 0.2 * rng.random((12000, 4))
+        index = CoordinateIndex()
+        index.add_many(list(range(12000)), ['biblical'] * 12000, coords)
+        index.add(99999, 'biblical', (5.0, 5.0, 5.0, 5.0))
+
+        target = np.array([2.0, 2.0, 2.0, 2.0])
+        distances = np.sqrt(((coords - target) ** 2).sum(axis=1))
+        with mock.patch.object(vector_index, 'HNSW_MIN_ITEMS', 10 ** 9):
+            ids, found = index.search(target, 1)
+        self.assertEqual(ids.tolist(), [int(distances.argmin())])
+        self.assertAlmostEqual(found[0], distances.min())
+
+    def test_update_moves_concept(self):
+        """
+        Tests that re-adding or updating an id moves it instead of duplicating it.
+        """
+        self.index.update_coords(1, (0.99, 0.99, 0.99, 0.99))
+        ids, distances = self.index.search((0.99, 0.99, 0.99, 0.99), 1)
+        self.assertEqual(ids.tolist(), [1])
+        self.assertAlmostEqual(distances[0], 0.0)
+        self.assertEqual(len(self.index), 200)
+
+    def test_remove_and_compact(self):
+        """
+        Tests that removed ids disappear from results, before and after compaction.
+        """
+        target = tuple(self.coords[0])
+        self.index.remove(1)
+        ids, _ = self.index.search(target, 200)
+        self.assertNotIn(1, ids.tolist())
+        self.assertEqual(len(self.index), 199)
+
+        for concept_id in range(2, 80):
+            self.index.remove(concept_id)
+        self.assertLess(self.index._size, 200)  # tombstones were compacted away
+        ids, _ = self.index.search(target, 200)
+        self.assertEqual(sorted(ids.tolist()), list(range(80, 201)))
+
+    def test_distance_kernel_matches_numpy(self):
+        """
+        Tests that the compiled distance kernel agrees with the NumPy formulation.
+        """
+        positions = np.array([0, 5, 17, 199])
+        target = np.array([0.5, 0.4, 0.6, 0.5])
+        expected = ((self.coords[positions] - target) ** 2).sum(axis=1)
+        np.testing.assert_allclose(vector_index._squared_distances_4d(self.coords, positions, target), expected)
+
+    def test_save_and_load_snapshot(self):
+        """
+        Tests that a memory-mapped snapshot answers like the original and checks its fingerprint.
+        """
+        target = (0.5, 0.4, 0.6, 0.5)
+        self.index.remove(3)
+        expected = self.index.search(target, 20, max_distance=0.6, context='biblical')
+        with tempfile.TemporaryDirectory() as directory:
+            self.index.save(directory, fingerprint=[199, 'v1'])
+            self.assertIsNone(CoordinateIndex.load(directory, fingerprint=[200, 'v1']))
+
+            loaded = CoordinateIndex.load(directory, fingerprint=[199, 'v1'])
+            self.assertEqual(len(loaded), 199)
+            ids, distances = loaded.search(target, 20, max_distance=0.6, context='biblical')
+            self.assertEqual(ids.tolist(), expected[0].tolist())
+            np.testing.assert_array_equal(distances, expected[1])
+
+            loaded.update_coords(4, target)
+            self.assertEqual(loaded.search(target, 1)[0].tolist(), [4])
+            del loaded
+
+    def test_unknown_context(self):
+        """
+        Tests that filtering on a context with no concepts returns nothing.
+        """
+        ids, _ = self.index.search((0.5, 0.5, 0.5, 0.5), 10, context='unknown')
+        self.assertEqual(len(ids), 0)
+
+if __name__ == '__main__':
+    unittest.main()